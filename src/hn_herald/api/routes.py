@@ -19,6 +19,7 @@ if TYPE_CHECKING:
 from fastapi import APIRouter, HTTPException, status
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, ValidationError
+from pydantic_core import to_json
 
 from hn_herald.api.mocks import generate_mock_digest_stream
 from hn_herald.graph.graph import create_hn_graph
@@ -507,12 +508,10 @@ async def generate_digest_stream(request: GenerateDigestRequest) -> StreamingRes
                 },
             )
 
-            # Send completion event with digest data
-            complete_event = {
-                "stage": "complete",
-                "digest": response.model_dump(mode="json"),
-            }
-            yield f"data: {json.dumps(complete_event)}\n\n"
+            # Send completion event with digest data, serialized by
+            # pydantic-core in one pass rather than dumped to dicts first
+            complete_event = {"stage": "complete", "digest": response}
+            yield f"data: {to_json(complete_event).decode()}\n\n"
 
         except Exception as e:
             logger.exception(
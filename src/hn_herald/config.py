@@ -37,6 +37,13 @@ class Settings(BaseSettings):
     llm_model: str = "claude-haiku-4-5-20251001"
     llm_temperature: float = 0.0
     llm_max_tokens: int = 8192  # Increased for batch summarization (5 articles ~1500 tokens each)
+    llm_request_timeout: float = 60.0  # Seconds before an Anthropic request is abandoned
+    llm_structured_output: bool = True  # Native tool-use JSON instead of format instructions
+    llm_context_window: int = 200000  # Model context size in tokens; prompts are clipped to fit
+    llm_batch_poll_interval: float = 30.0  # Seconds between Message Batches API status checks
+    llm_batch_max_wait: float = 86400.0  # Seconds before an unfinished message batch is cancelled
+    llm_requests_per_minute: int = 50  # Anthropic RPM allowance for proactive pacing
+    llm_tokens_per_minute: int = 80000  # Anthropic TPM allowance for proactive pacing
 
     # LangSmith Settings (optional)
     langchain_tracing_v2: bool = False
@@ -44,11 +51,11 @@ class Settings(BaseSettings):
     langchain_project: str = "hn-herald"
 
     # Caching Settings
-    # NOTE: These settings are defined but NOT currently used.
-    # The LLMService does not implement caching - see docs/design/03-llm-summarization.md
-    # for the planned cache implementation that was never built.
-    llm_cache_type: Literal["sqlite", "memory", "none"] = "sqlite"
+    # LLM responses are cached by hash of (namespace, model, temperature, prompt)
+    # "sqlite" persists responses across restarts in cache_dir; opt-in only
+    llm_cache_type: Literal["sqlite", "memory", "none"] = "memory"
     llm_cache_ttl: int = 86400  # 24 hours in seconds
+    llm_cache_namespace: str = "v1"  # Bump to invalidate all cached responses
     cache_dir: str = ".cache"
 
     # HN API Fetching Settings
@@ -58,12 +65,15 @@ class Settings(BaseSettings):
     # Article Fetching Settings
     article_fetch_timeout: int = 15
     max_content_length: int = 8000
+    max_response_bytes: int = 2_000_000  # Stop reading article responses past this size
     loader_timeout: int = 15
     loader_max_content: int = 50000
 
     # Performance Settings
     max_concurrent_fetches: int = 10
     summary_batch_size: int = 5
+    llm_batch_wait_timeout: float = 0.1  # Seconds to buffer concurrent summarize calls
+    llm_min_content_chars: int = 0  # Opt-in: shorter content is its own summary, no LLM call
 
     @property
     def is_development(self) -> bool:
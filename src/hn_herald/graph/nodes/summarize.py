@@ -6,6 +6,7 @@ Individual article failures are isolated and marked with error status.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -20,7 +21,8 @@ logger = logging.getLogger(__name__)
 async def summarize(state: HNState) -> dict[str, Any]:
     """Batch summarize articles using LLM service.
 
-    Uses batch summarization for efficiency (single LLM call).
+    Uses batch summarization for efficiency (single LLM call), run on a
+    worker thread so rate-limit waits never block the event loop.
     Individual article failures are isolated and marked with error status.
 
     Args:
@@ -42,9 +44,11 @@ async def summarize(state: HNState) -> dict[str, Any]:
 
     logger.info("summarize: Batch summarizing %d articles", len(articles))
 
-    # Batch summarize using LLM service
+    # Batch summarize using LLM service. The sync path blocks in network I/O
+    # and in the rate limiter, so it runs on a worker thread to keep the
+    # event loop (SSE streams, other requests) responsive.
     llm_service = LLMService()
-    summarized = llm_service.summarize_articles_batch(articles)
+    summarized = await asyncio.to_thread(llm_service.summarize_articles_batch, articles)
 
     # Collect errors from failed summarizations
     errors = [
@@ -18,6 +18,7 @@ from fastapi.templating import Jinja2Templates
 from hn_herald import __version__
 from hn_herald.api.routes import router as api_router
 from hn_herald.config import get_settings
+from hn_herald.rate_limit import RateLimitExceededError
 
 # Configure logging
 settings = get_settings()
@@ -49,7 +50,6 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     logger.info(f"Cache Type: {settings.llm_cache_type}")
 
     # Create cache directory if using SQLite cache
-    # NOTE: Directory is created but LLMService does not implement caching yet
     if settings.llm_cache_type == "sqlite":
         _ensure_cache_dir(settings.cache_dir)
 
@@ -91,6 +91,20 @@ if TEMPLATES_DIR.exists():
 app.include_router(api_router)
 
 
+@app.exception_handler(RateLimitExceededError)
+async def rate_limit_exceeded_handler(_request: Request, exc: RateLimitExceededError) -> Response:
+    """Turn a spent global rate limit bucket into HTTP 429.
+
+    Returns:
+        JSON error body with a Retry-After header.
+    """
+    return JSONResponse(
+        status_code=429,
+        content={"error": "Rate limit exceeded", "detail": exc.message},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
 @app.get("/")
 async def root(request: Request) -> Response:
     """Root endpoint - serves the main web interface.
@@ -10,7 +10,7 @@ from hn_herald.models.article import (
 from hn_herald.models.digest import Digest, DigestStats
 from hn_herald.models.profile import UserProfile
 from hn_herald.models.scoring import RelevanceScore, ScoredArticle
-from hn_herald.models.story import Story, StoryType
+from hn_herald.models.story import DeadItem, HNItem, Story, StoryType
 from hn_herald.models.summary import (
     ArticleSummary,
     BatchArticleSummary,
@@ -29,9 +29,11 @@ __all__ = [
     "ArticleParseError",
     "ArticleSummary",
     "BatchArticleSummary",
+    "DeadItem",
     "Digest",
     "DigestStats",
     "ExtractionStatus",
+    "HNItem",
     "LLMAPIError",
     "LLMParseError",
     "LLMRateLimitError",
@@ -6,6 +6,7 @@ and provide computed properties for common operations.
 """
 
 from enum import StrEnum
+from typing import Annotated, Literal
 
 from pydantic import BaseModel, Field, computed_field
 
@@ -57,7 +58,7 @@ class Story(BaseModel):
         by: Username of the story author.
         time: Unix timestamp of story creation.
         descendants: Total comment count (None if not available).
-        type: Item type from HN API (usually "story").
+        type: Item type from HN API ("story" or "job").
         kids: List of child comment IDs.
         text: HTML content for Ask HN posts or job listings.
         dead: True if the story has been killed by moderators.
@@ -93,7 +94,7 @@ class Story(BaseModel):
     by: str = Field(..., description="Author username")
     time: int = Field(..., description="Unix timestamp of creation")
     descendants: int | None = Field(default=None, ge=0, description="Total comment count")
-    type: str = Field(default="story", description="Item type from HN API")
+    type: Literal["story", "job"] = Field(default="story", description="Item type from HN API")
     kids: list[int] = Field(default_factory=list, description="Child comment IDs")
     text: str | None = Field(default=None, description="HTML content for Ask HN/jobs")
     dead: bool | None = Field(default=None, description="True if story is dead/killed")
@@ -121,3 +122,36 @@ class Story(BaseModel):
             True if the story has a non-empty external URL.
         """
         return bool(self.url)
+
+
+class DeadItem(BaseModel):
+    """HN item that cannot be used as a Story.
+
+    Catch-all shape for items the HN API returns that are not live stories:
+    deleted stubs, comments, polls, or payloads missing required story
+    fields. Only the flags needed for logging are kept.
+
+    Attributes:
+        id: Item identifier from HackerNews, if present.
+        type: Item type from HN API, if present.
+        dead: True if the item has been killed by moderators.
+        deleted: True if the item has been deleted by its author.
+    """
+
+    model_config = {
+        "frozen": False,
+        "extra": "ignore",
+    }
+
+    id: int | None = Field(default=None, description="Item ID from HackerNews")
+    type: str | None = Field(default=None, description="Item type from HN API")
+    dead: bool = Field(default=False, description="True if item is dead/killed")
+    deleted: bool = Field(default=False, description="True if item is deleted")
+
+
+HNItem = Annotated[Story | DeadItem, Field(union_mode="left_to_right")]
+"""Any item returned by the HN item endpoint.
+
+Validation tries Story first and falls back to DeadItem, so a single
+pydantic-core pass decides whether the payload is a usable story.
+"""
@@ -32,6 +32,10 @@ class SummarizationStatus(StrEnum):
     CACHED = "cached"
 
 
+_SUMMARY_STATUSES = frozenset({SummarizationStatus.SUCCESS, SummarizationStatus.CACHED})
+"""Statuses for which summary_data holds a usable summary."""
+
+
 class ArticleSummary(BaseModel):
     """LLM-generated summary of an article.
 
@@ -197,10 +201,7 @@ class SummarizedArticle(BaseModel):
         Returns:
             True if summary_data exists and status indicates success or cached.
         """
-        return self.summary_data is not None and self.summarization_status in (
-            SummarizationStatus.SUCCESS,
-            SummarizationStatus.CACHED,
-        )
+        return self.summary_data is not None and self.summarization_status in _SUMMARY_STATUSES
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -279,16 +280,19 @@ class LLMAPIError(LLMServiceError):
 
     Attributes:
         status_code: HTTP status code from the API response.
+        retryable: True if the failure is transient (timeouts, overload).
     """
 
-    def __init__(self, message: str, status_code: int) -> None:
+    def __init__(self, message: str, status_code: int, *, retryable: bool = False) -> None:
         """Initialize LLMAPIError.
 
         Args:
             message: Error message describing the API error.
             status_code: HTTP status code from the API response.
+            retryable: True if the failure is transient and worth retrying.
         """
         self.status_code = status_code
+        self.retryable = retryable
         super().__init__(f"LLM API error (HTTP {status_code}): {message}")
 
 
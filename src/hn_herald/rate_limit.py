@@ -11,8 +11,15 @@ Privacy-First Rate Limiting:
     - No analytics or usage metrics collected
 
 The rate limiter uses a simple token bucket algorithm via the `ratelimit`
-library, with automatic sleep-and-retry behavior to handle rate limit
-exceeded scenarios gracefully.
+library. Synchronous callers sleep and retry when the bucket is spent;
+async callers get RateLimitExceededError instead, because sleeping would
+stall the event loop.
+
+Outbound Anthropic calls are additionally paced by AnthropicLimiter, a
+sliding-window request and token budget that blocks before a call would
+exceed the account's RPM/TPM allowance instead of reacting to HTTP 429s.
+AIMDController adapts how many of those calls run at once, seeded from a
+per-provider profile in PROVIDER_PROFILES.
 
 Limitations:
     - In-memory storage: Limits reset on application restart
@@ -35,11 +42,19 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from functools import wraps
+import math
+import threading
+import time
+from collections import deque
+from contextlib import suppress
+from functools import lru_cache, partial, wraps
 from typing import TYPE_CHECKING, Any, cast, overload
 
+from pydantic import BaseModel
 from ratelimit import RateLimitException, limits, sleep_and_retry
 
+from hn_herald.config import get_settings
+
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
@@ -53,6 +68,10 @@ CALLS: int = 30
 PERIOD: int = 60
 """Rate limit period in seconds."""
 
+# Longest single sleep while waiting for Anthropic budget; waiters re-check
+# this often so budget released by reconcile() is picked up promptly
+_MAX_WAIT_STEP: float = 1.0
+
 
 class RateLimitExceededError(Exception):
     """Exception raised when rate limit is exceeded and cannot be retried.
@@ -77,6 +96,333 @@ class RateLimitExceededError(Exception):
         super().__init__(message)
 
 
+class AnthropicLimiter:
+    """Proactive request and token budget for Anthropic API calls.
+
+    Tracks the requests and tokens spent in a sliding window and blocks
+    callers until both budgets have headroom. Each call reserves an
+    estimated token count up front; once the response arrives the
+    reservation is reconciled with the actual usage so the window
+    reflects what Anthropic really counted.
+
+    Attributes:
+        requests_per_minute: Maximum requests allowed per window.
+        tokens_per_minute: Maximum tokens allowed per window.
+        window: Length of the sliding window in seconds.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        window: float = 60.0,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Maximum requests allowed per window.
+            tokens_per_minute: Maximum tokens allowed per window.
+            window: Length of the sliding window in seconds.
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.window = window
+        self._lock = threading.Lock()
+        # Each entry is a mutable [timestamp, tokens] reservation
+        self._reservations: deque[list[float]] = deque()
+        self._tokens_in_window = 0.0
+
+    def acquire(self, estimated_tokens: int) -> list[float]:
+        """Block until the call fits in the budget, then reserve it.
+
+        Args:
+            estimated_tokens: Expected input plus output tokens for the call.
+
+        Returns:
+            Reservation handle to pass to reconcile() once usage is known.
+        """
+        while True:
+            reservation, delay = self._try_reserve(estimated_tokens)
+            if reservation is not None:
+                return reservation
+            time.sleep(min(delay, _MAX_WAIT_STEP))
+
+    async def aacquire(self, estimated_tokens: int) -> list[float]:
+        """Async variant of acquire() that awaits instead of sleeping.
+
+        Args:
+            estimated_tokens: Expected input plus output tokens for the call.
+
+        Returns:
+            Reservation handle to pass to reconcile() once usage is known.
+        """
+        while True:
+            reservation, delay = self._try_reserve(estimated_tokens)
+            if reservation is not None:
+                return reservation
+            await asyncio.sleep(min(delay, _MAX_WAIT_STEP))
+
+    def reconcile(self, reservation: list[float], actual_tokens: int) -> None:
+        """Replace a reservation's estimate with the tokens actually used.
+
+        Args:
+            reservation: Handle returned by acquire() or aacquire().
+            actual_tokens: Input plus output tokens reported by the API.
+        """
+        with self._lock:
+            # After pruning, a reservation is still in the window exactly
+            # when it has not expired; popped entries were already subtracted
+            if reservation[0] > self._prune(time.monotonic()):
+                self._tokens_in_window += actual_tokens - reservation[1]
+                reservation[1] = actual_tokens
+
+    def release(self, reservation: list[float]) -> None:
+        """Return a reservation's tokens after a call that failed.
+
+        The request itself still counts towards the request budget.
+
+        Args:
+            reservation: Handle returned by acquire() or aacquire().
+        """
+        self.reconcile(reservation, 0)
+
+    def _prune(self, now: float) -> float:
+        """Drop reservations that left the window; must hold the lock.
+
+        Returns:
+            Window cutoff; reservations at or before it have been removed.
+        """
+        cutoff = now - self.window
+        while self._reservations and self._reservations[0][0] <= cutoff:
+            self._tokens_in_window -= self._reservations.popleft()[1]
+        return cutoff
+
+    def _try_reserve(self, estimated_tokens: int) -> tuple[list[float] | None, float]:
+        """Reserve budget if available, otherwise return how long to wait."""
+        # A single call larger than the whole budget would never fit
+        tokens = float(min(estimated_tokens, self.tokens_per_minute))
+
+        with self._lock:
+            now = time.monotonic()
+            cutoff = self._prune(now)
+
+            delay = 0.0
+            if len(self._reservations) >= self.requests_per_minute:
+                delay = self._reservations[0][0] - cutoff
+
+            excess = self._tokens_in_window + tokens - self.tokens_per_minute
+            if excess > 0:
+                for timestamp, reserved in self._reservations:
+                    excess -= reserved
+                    if excess <= 0:
+                        delay = max(delay, timestamp - cutoff)
+                        break
+
+            if delay > 0:
+                return None, delay
+
+            reservation = [now, tokens]
+            self._reservations.append(reservation)
+            self._tokens_in_window += tokens
+            return reservation, 0.0
+
+
+@lru_cache
+def get_anthropic_limiter() -> AnthropicLimiter:
+    """Get the process-wide Anthropic limiter, configured from settings.
+
+    Returns:
+        Shared AnthropicLimiter instance.
+    """
+    settings = get_settings()
+    return AnthropicLimiter(
+        requests_per_minute=settings.llm_requests_per_minute,
+        tokens_per_minute=settings.llm_tokens_per_minute,
+    )
+
+
+def _resolve(waiter: asyncio.Future[None]) -> None:
+    """Complete a concurrency waiter unless it was cancelled meanwhile."""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class ProviderProfile(BaseModel):
+    """Published rate limits and latency target for an LLM provider.
+
+    Attributes:
+        requests_per_minute: Default request budget per minute.
+        tokens_per_minute: Default token budget per minute.
+        max_concurrency: Ceiling for concurrent in-flight requests.
+        target_latency_ms: Latency above which concurrency stops growing.
+    """
+
+    model_config = {"frozen": True}
+
+    requests_per_minute: int
+    tokens_per_minute: int
+    max_concurrency: int
+    target_latency_ms: float
+
+
+PROVIDER_PROFILES: dict[str, ProviderProfile] = {
+    "anthropic": ProviderProfile(
+        requests_per_minute=50,
+        tokens_per_minute=80_000,
+        max_concurrency=5,
+        target_latency_ms=3000,
+    ),
+}
+"""Default provider profiles used to seed concurrency control."""
+
+
+class AIMDController:
+    """Adaptive concurrency limit for outbound LLM calls.
+
+    Additive-increase/multiplicative-decrease: every completion whose
+    smoothed latency is under target and that was not throttled raises
+    the limit by ``increase``; a 429 or timeout multiplies it by
+    ``decrease``. The limit stays within [1, max_concurrency], so
+    throughput settles near the provider's knee without manual tuning.
+
+    Slots are taken with acquire() from threads or aacquire() from any
+    event loop; state is guarded by a lock, so one process-wide
+    controller caps the sync and async summarization paths together.
+    Every release wakes all waiters, which re-check under the lock.
+
+    Attributes:
+        max_concurrency: Upper bound on the concurrency limit.
+        target_latency: Latency target in seconds.
+        limit: Current (fractional) concurrency limit.
+        latency_ewma: Smoothed request latency in seconds (None until observed).
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        target_latency: float,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        smoothing: float = 0.2,
+    ) -> None:
+        """Initialize the controller at its maximum concurrency.
+
+        Args:
+            max_concurrency: Upper bound on the concurrency limit.
+            target_latency: Latency target in seconds.
+            increase: Amount added to the limit after a healthy completion.
+            decrease: Factor applied to the limit after a 429 or timeout.
+            smoothing: EWMA weight given to each new latency sample.
+        """
+        self.max_concurrency = max_concurrency
+        self.target_latency = target_latency
+        self.limit = float(max_concurrency)
+        self.latency_ewma: float | None = None
+        self._increase = increase
+        self._decrease = decrease
+        self._smoothing = smoothing
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        # Callbacks that wake one blocked thread or loop task each
+        self._waiters: deque[Callable[[], object]] = deque()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of slots currently held."""
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """Block the calling thread until a slot is free, then take it."""
+        while True:
+            with self._lock:
+                if self._take_slot():
+                    return
+                event = threading.Event()
+                self._waiters.append(event.set)
+            event.wait()
+
+    async def aacquire(self) -> None:
+        """Wait on the running loop until a slot is free, then take it."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._take_slot():
+                    return
+                waiter = loop.create_future()
+                wake = partial(loop.call_soon_threadsafe, _resolve, waiter)
+                self._waiters.append(wake)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock, suppress(ValueError):
+                    self._waiters.remove(wake)
+                raise
+
+    def release(self, latency: float, *, overloaded: bool = False) -> None:
+        """Return a slot and adapt the limit to the call's outcome.
+
+        Args:
+            latency: Wall-clock duration of the call in seconds.
+            overloaded: True if the call hit a 429 or timed out.
+        """
+        with self._lock:
+            self._in_flight -= 1
+            if self.latency_ewma is None:
+                self.latency_ewma = latency
+            else:
+                self.latency_ewma += self._smoothing * (latency - self.latency_ewma)
+
+            if overloaded:
+                self.limit = max(self.limit * self._decrease, 1.0)
+                logger.info("LLM concurrency reduced to %.1f after overload", self.limit)
+            elif self.latency_ewma < self.target_latency:
+                self.limit = min(self.limit + self._increase, float(self.max_concurrency))
+            waiters, self._waiters = self._waiters, deque()
+
+        for wake in waiters:
+            # A waiter whose loop has since closed has nothing left to wake
+            with suppress(RuntimeError):
+                wake()
+
+    def _take_slot(self) -> bool:
+        """Take a slot if one is free; must hold the lock."""
+        if self._in_flight >= int(self.limit):
+            return False
+        self._in_flight += 1
+        return True
+
+    @classmethod
+    def from_profile(cls, profile: ProviderProfile) -> AIMDController:
+        """Build a controller seeded from a provider profile.
+
+        Args:
+            profile: Provider limits and latency target.
+
+        Returns:
+            Controller starting at the profile's maximum concurrency.
+        """
+        return cls(
+            max_concurrency=profile.max_concurrency,
+            target_latency=profile.target_latency_ms / 1000,
+        )
+
+
+@lru_cache
+def get_concurrency_controller(provider: str = "anthropic") -> AIMDController:
+    """Get the process-wide concurrency controller for a provider.
+
+    The controller is thread-safe and not bound to an event loop, so it
+    is the single in-flight limit for every LLM call in the process.
+
+    Args:
+        provider: Key into PROVIDER_PROFILES.
+
+    Returns:
+        Shared AIMDController instance.
+    """
+    return AIMDController.from_profile(PROVIDER_PROFILES[provider])
+
+
 def _create_sync_wrapper[**P, R](
     func: Callable[P, R],
 ) -> Callable[P, R]:
@@ -103,9 +449,14 @@ def _create_async_wrapper[**P, R](
 ) -> Callable[P, Awaitable[R]]:
     """Create a rate-limited wrapper for asynchronous functions.
 
-    The ratelimit library's decorators are synchronous, so we apply them
-    to a sync wrapper function and then await the actual async call.
-    This ensures proper rate limiting while maintaining async behavior.
+    The ratelimit library's decorators are synchronous, so the rate limit is
+    enforced by a sync gate built once at wrap time. The wrapper calls the
+    gate and then awaits the wrapped coroutine directly, so the hot path
+    carries no intermediate awaitable.
+
+    The gate does not sleep and retry: a blocking sleep here would stall
+    the whole event loop. A spent bucket raises RateLimitExceededError,
+    which the app turns into a 429 with a Retry-After header.
 
     Args:
         func: The asynchronous function to wrap.
@@ -114,22 +465,14 @@ def _create_async_wrapper[**P, R](
         Rate-limited async wrapper function.
     """
 
+    @limits(calls=CALLS, period=PERIOD)
+    def _gate() -> None:
+        """Consume one call from the shared rate limit bucket."""
+
     @wraps(func)
     async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-        # Create a synchronous rate-limited function that we can call
-        # The rate limiting happens in the sync layer, then we await the result
-
-        @sleep_and_retry
-        @limits(calls=CALLS, period=PERIOD)
-        def rate_limited_call() -> Awaitable[R]:
-            return func(*args, **kwargs)
-
         try:
-            # Get the coroutine from the rate-limited sync wrapper
-            coro = rate_limited_call()
-            # Await the actual async function
-            result: R = await coro
-            return result
+            _gate()
         except RateLimitException as e:
             logger.warning(
                 "Rate limit exceeded for %s: %s",
@@ -144,8 +487,9 @@ def _create_async_wrapper[**P, R](
             )
             raise RateLimitExceededError(
                 f"Rate limit exceeded: {CALLS} calls per {PERIOD} seconds",
-                retry_after=PERIOD,
+                retry_after=max(1, math.ceil(e.period_remaining)),
             ) from e
+        return await func(*args, **kwargs)
 
     return async_wrapper
 
@@ -161,7 +505,7 @@ def rate_limit[**P, R](func: Callable[P, R]) -> Callable[P, R]: ...
 def rate_limit[**P, R](
     func: Callable[P, R] | Callable[P, Awaitable[Any]],
 ) -> Callable[P, R] | Callable[P, Awaitable[Any]]:
-    """Rate limit decorator with sleep-and-retry behavior.
+    """Rate limit decorator backed by a global call bucket.
 
     Applies global rate limiting to protect upstream API quotas.
     Supports both synchronous and asynchronous functions.
@@ -176,10 +520,10 @@ def rate_limit[**P, R](
         - PERIOD: Time window in seconds (default: 60)
 
     Behavior:
-        When the rate limit is reached, the decorator will automatically
-        sleep and retry (via sleep_and_retry) rather than immediately
-        raising an exception. This provides graceful degradation under
-        load.
+        When the rate limit is reached, synchronous functions sleep and
+        retry (via sleep_and_retry). Async functions raise
+        RateLimitExceededError immediately so the event loop is never
+        blocked; callers should surface it as HTTP 429.
 
     Args:
         func: The function to rate limit. Can be sync or async.
@@ -206,6 +550,12 @@ def rate_limit[**P, R](
 __all__ = [
     "CALLS",
     "PERIOD",
+    "PROVIDER_PROFILES",
+    "AIMDController",
+    "AnthropicLimiter",
+    "ProviderProfile",
     "RateLimitExceededError",
+    "get_anthropic_limiter",
+    "get_concurrency_controller",
     "rate_limit",
 ]
@@ -11,6 +11,7 @@ import logging
 from typing import TYPE_CHECKING
 
 import httpx
+from pydantic import TypeAdapter, ValidationError
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -19,13 +20,16 @@ from tenacity import (
 )
 
 from hn_herald.config import get_settings
-from hn_herald.models.story import Story, StoryType
+from hn_herald.models.story import DeadItem, HNItem, Story, StoryType
 
 if TYPE_CHECKING:
     from types import TracebackType
 
 logger = logging.getLogger(__name__)
 
+# Validates raw item JSON straight into Story | DeadItem (or None for null)
+_HN_ITEM_ADAPTER: TypeAdapter[Story | DeadItem | None] = TypeAdapter(HNItem | None)
+
 
 class HNClientError(Exception):
     """Base exception for HN client errors."""
@@ -252,30 +256,35 @@ class HNClient:
                 return None
             raise
 
-        data = response.json()
+        try:
+            item = _HN_ITEM_ADAPTER.validate_json(response.content)
+        except ValidationError:
+            logger.exception("Failed to parse story %d", story_id)
+            return None
 
         # Handle null response (deleted items)
-        if data is None:
+        if item is None:
             logger.warning("Story %d returned null (likely deleted)", story_id)
             return None
 
-        # Skip dead or deleted stories
-        if data.get("dead", False) or data.get("deleted", False):
-            logger.warning("Story %d is dead or deleted", story_id)
+        # Skip deleted stubs, non-story items (comments, polls) and malformed stories
+        if isinstance(item, DeadItem):
+            logger.warning(
+                "Item %d is not a usable story (type: %s, dead: %s, deleted: %s)",
+                story_id,
+                item.type,
+                item.dead,
+                item.deleted,
+            )
             return None
 
-        # Skip non-story items (comments, polls)
-        if data.get("type") not in ("story", "job"):
-            logger.warning("Item %d is not a story (type: %s)", story_id, data.get("type"))
+        # Skip dead or deleted stories
+        if item.dead or item.deleted:
+            logger.warning("Story %d is dead or deleted", story_id)
             return None
 
-        try:
-            story = Story.model_validate(data)
-            logger.debug("Fetched story %d: %s", story.id, story.title)
-            return story
-        except Exception:
-            logger.exception("Failed to parse story %d", story_id)
-            return None
+        logger.debug("Fetched story %d: %s", item.id, item.title)
+        return item
 
     async def fetch_stories(
         self,
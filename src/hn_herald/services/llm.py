@@ -6,26 +6,64 @@ Supports single article and batch summarization.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import html
+import json
 import logging
-from typing import TYPE_CHECKING
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, cast
+from weakref import WeakKeyDictionary
 
+import httpx
+from anthropic import (
+    Anthropic,
+    APIConnectionError,
+    APIError,
+    APIStatusError,
+    APITimeoutError,
+    RateLimitError,
+)
+from anthropic.types.message_create_params import MessageCreateParamsNonStreaming
+from anthropic.types.messages.batch_create_params import Request
 from langchain.output_parsers import PydanticOutputParser
 from langchain_anthropic import ChatAnthropic
+from langchain_anthropic.chat_models import AnthropicTool, convert_to_anthropic_tool
 from langchain_core.messages import HumanMessage
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from langchain_core.utils.json import parse_json_markdown, parse_partial_json
+from pydantic import BaseModel, ValidationError
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
 
 from hn_herald.config import get_settings
 from hn_herald.models.summary import (
     ArticleSummary,
     BatchArticleSummary,
     LLMAPIError,
+    LLMParseError,
     LLMRateLimitError,
     SummarizationStatus,
     SummarizedArticle,
 )
+from hn_herald.rate_limit import get_anthropic_limiter, get_concurrency_controller
+from hn_herald.services.llm_cache import get_llm_cache
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Sequence
+
+    from anthropic.types import ToolParam
+    from anthropic.types.messages import MessageBatchResult
+    from langchain_core.messages import BaseMessage, BaseMessageChunk
 
     from hn_herald.models.article import Article
 
@@ -58,6 +96,167 @@ Summarize each of the following articles. For each article, provide:
 
 {format_instructions}"""
 
+# Rough chars-per-token ratio for English prose, used for local token estimates
+_CHARS_PER_TOKEN = 4
+
+# Appended to clipped article content so the model knows it was cut short
+TRUNCATION_MARKER = "\n[TRUNCATED]"
+
+# ArticleSummary.summary minimum length
+_MIN_SUMMARY_CHARS = 20
+
+# HN item text is HTML: paragraphs are separated by bare <p> tags
+_HN_PARAGRAPH = re.compile(r"<p>", re.IGNORECASE)
+_HTML_TAG = re.compile(r"<[^>]+>")
+
+# Per-article framing added by _build_batch_prompt around title and content
+_BATCH_ARTICLE_FRAME = "---\n**Article 000**\n**Title**: \n**Content**:\n\n---\n\n"
+
+
+def _html_to_text(text: str) -> str:
+    """Convert HN item HTML (paragraph tags, links, entities) to plain text."""
+    text = _HN_PARAGRAPH.sub("\n\n", text)
+    return html.unescape(_HTML_TAG.sub("", text))
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Retry rate limits and transient API failures (timeouts, overload, 5xx)."""
+    return isinstance(error, LLMRateLimitError) or (
+        isinstance(error, LLMAPIError) and error.retryable
+    )
+
+
+def _record_retry(retry_state: RetryCallState) -> None:
+    """Count a retry of an LLM call against the calling service's telemetry."""
+    service: LLMService = retry_state.args[0]
+    service.telemetry.retries += 1
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    logger.warning(
+        "Retrying LLM call after attempt %d: %s",
+        retry_state.attempt_number,
+        error,
+        extra={"event_type": "llm_retry", "attempt": retry_state.attempt_number},
+    )
+
+
+class LLMTelemetry(BaseModel):
+    """Running totals of LLM calls made by one LLMService.
+
+    Cache hits are not counted; latency is summed wall-clock time of
+    completed API calls.
+
+    Attributes:
+        calls: Completed API calls.
+        input_tokens: Input tokens reported by the API.
+        output_tokens: Output tokens reported by the API.
+        latency_ms: Total latency of completed calls in milliseconds.
+        retries: Retries scheduled after transient failures.
+    """
+
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    latency_ms: float = 0.0
+    retries: int = 0
+
+
+@lru_cache(maxsize=8)
+def _get_client(
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    api_key: str,
+    timeout: float,
+) -> ChatAnthropic:
+    """Get a shared chat client for a configuration.
+
+    Services created per request reuse one client, and with it one HTTP
+    connection pool, instead of paying connection setup and TLS handshakes
+    each time.
+    """
+    # Bounded timeout; SDK retries disabled because tenacity owns retry policy
+    return ChatAnthropic(
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        api_key=api_key,  # type: ignore[call-arg]
+        timeout=timeout,
+        max_retries=0,
+    )
+
+
+# Split once at the format instructions marker: only the head has per-call
+# fields, and the static instructions are appended without re-formatting
+_PROMPT_HEAD, _PROMPT_TAIL = PROMPT_TEMPLATE.split("{format_instructions}")
+_BATCH_PROMPT_HEAD, _BATCH_PROMPT_TAIL = BATCH_PROMPT_TEMPLATE.split("{format_instructions}")
+
+
+class _MicroBatcher[T, R]:
+    """Coalesce concurrent single-item calls into batched handler calls.
+
+    Items submitted within ``wait_timeout`` seconds of each other are
+    buffered and dispatched together once ``max_batch_size`` items are
+    pending or the timeout elapses. Each caller awaits its own result,
+    which the handler must return in input order.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list[T]], Awaitable[list[R]]],
+        max_batch_size: int,
+        wait_timeout: float,
+    ) -> None:
+        """Initialize with the batch handler and flush thresholds."""
+        self._handler = handler
+        self._max_batch_size = max_batch_size
+        self._wait_timeout = wait_timeout
+        self._pending: list[tuple[T, asyncio.Future[R]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, item: T) -> R:
+        """Queue an item and wait for its result from the next batch."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[R] = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._wait_timeout, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Dispatch all pending items as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: list[tuple[T, asyncio.Future[R]]]) -> None:
+        """Run the handler and resolve each caller's future."""
+        try:
+            results = await self._handler([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results, strict=False):
+            if not future.done():
+                future.set_result(result)
+
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(RuntimeError("Batch handler returned too few results"))
+
 
 class LLMService:
     """Service for summarizing articles using an LLM.
@@ -65,7 +264,12 @@ class LLMService:
     Usage:
         service = LLMService()
         result = service.summarize_article(article)
+        result = await service.asummarize_article(article)
+        results = await service.asummarize_articles(articles)
+        results = service.summarize_articles_threaded(articles)
+        async for partial in service.astream_summary(article): ...
         results = service.summarize_articles_batch(articles)
+        results = service.summarize_articles_via_batch_api(articles)
     """
 
     def __init__(
@@ -76,11 +280,32 @@ class LLMService:
     ) -> None:
         """Initialize LLM service with optional config overrides."""
         settings = get_settings()
-        self._client = ChatAnthropic(
-            model=model or settings.llm_model,
-            temperature=temperature if temperature is not None else settings.llm_temperature,
-            max_tokens=max_tokens or settings.llm_max_tokens,
-            api_key=settings.anthropic_api_key,  # type: ignore[call-arg]
+        self._model = model or settings.llm_model
+        self._temperature = temperature if temperature is not None else settings.llm_temperature
+        self._max_tokens = max_tokens or settings.llm_max_tokens
+        self._context_window = settings.llm_context_window
+        self._min_content_chars = settings.llm_min_content_chars
+        self._api_key = settings.anthropic_api_key
+        self._batch_client: Anthropic | None = None
+        self._limiter = get_anthropic_limiter()
+        # Adaptive in-flight limit, shared by every service in the process
+        self._concurrency = get_concurrency_controller()
+        self._cache = get_llm_cache()
+        self.telemetry = LLMTelemetry()
+        self._telemetry_lock = threading.Lock()
+        self._batch_size = settings.summary_batch_size
+        self._batch_wait_timeout = settings.llm_batch_wait_timeout
+        # Futures and timers are bound to a loop, so each loop gets its own batcher
+        self._batchers: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _MicroBatcher[Article, SummarizedArticle]
+        ] = WeakKeyDictionary()
+        self._request_timeout = settings.llm_request_timeout
+        self._client = _get_client(
+            self._model,
+            self._temperature,
+            self._max_tokens,
+            self._api_key,
+            self._request_timeout,
         )
         self._single_parser: PydanticOutputParser[ArticleSummary] = PydanticOutputParser(
             pydantic_object=ArticleSummary
@@ -88,15 +313,28 @@ class LLMService:
         self._batch_parser: PydanticOutputParser[BatchArticleSummary] = PydanticOutputParser(
             pydantic_object=BatchArticleSummary
         )
+        # Native structured output forces a tool call whose input schema is
+        # the summary model, so the prompt no longer needs format instructions.
+        # The parsers still validate the returned JSON (and the raw text when
+        # structured output is disabled).
+        self._structured_output = settings.llm_structured_output
+        self._single_tool = convert_to_anthropic_tool(ArticleSummary)
+        self._batch_tool = convert_to_anthropic_tool(BatchArticleSummary)
+        # Format instructions are static per parser; build them once
+        self._single_fmt = ""
+        self._batch_fmt = ""
+        if not self._structured_output:
+            self._single_fmt = self._single_parser.get_format_instructions()
+            self._batch_fmt = self._batch_parser.get_format_instructions()
 
     def summarize_article(self, article: Article) -> SummarizedArticle:
         """Summarize a single article. Returns result with status."""
-        content = article.content or article.hn_text
-        if not content:
-            return self._result(article, status=SummarizationStatus.NO_CONTENT)
+        if (local := self._local_result(article)) is not None:
+            return local
 
+        content = article.content or article.hn_text or ""
         try:
-            response = self._call_llm(self._build_prompt(content, article.title))
+            response = self._call_llm(self._build_prompt(content, article.title), self._single_tool)
             summary = self._single_parser.parse(response)
             return self._result(article, summary=summary)
         except LLMRateLimitError as e:
@@ -107,9 +345,208 @@ class LLMService:
             logger.exception("Parse error for article %d", article.story_id)
             return self._result(article, status=SummarizationStatus.PARSE_ERROR, error=str(e))
 
+    async def asummarize_article(self, article: Article) -> SummarizedArticle:
+        """Summarize a single article without blocking the event loop.
+
+        Concurrent callers are micro-batched: articles arriving within
+        llm_batch_wait_timeout seconds share one batch LLM call of up to
+        summary_batch_size articles.
+        """
+        if (local := self._local_result(article)) is not None:
+            return local
+
+        return await self._get_batcher().submit(article)
+
+    def _get_batcher(self) -> _MicroBatcher[Article, SummarizedArticle]:
+        """Micro-batcher for the running event loop, created on first use."""
+        loop = asyncio.get_running_loop()
+        batcher = self._batchers.get(loop)
+        if batcher is None:
+            batcher = _MicroBatcher(
+                self._batched_summarize,
+                max_batch_size=self._batch_size,
+                wait_timeout=self._batch_wait_timeout,
+            )
+            self._batchers[loop] = batcher
+        return batcher
+
+    async def astream_summary(self, article: Article) -> AsyncIterator[dict[str, Any]]:
+        """Stream a single article summary as it is generated.
+
+        Tokens are parsed incrementally, so callers can render the summary
+        while the model is still writing it. Each yielded dict is the best
+        parse of the output so far; the last one is the validated summary.
+
+        Args:
+            article: Article to summarize.
+
+        Yields:
+            Progressively more complete ArticleSummary fields.
+
+        Raises:
+            LLMRateLimitError: If the API rate limit is hit.
+            LLMAPIError: If the API call fails.
+            LLMParseError: If the complete output is not a valid ArticleSummary.
+        """
+        if (local := self._local_result(article)) is not None:
+            if local.summary_data is not None:
+                yield local.summary_data.model_dump()
+            return
+
+        content = article.content or article.hn_text or ""
+        prompt = self._build_prompt(content, article.title)
+        key = self._cache_key(prompt)
+        text = await self._cache.aget(key)
+
+        if text is None:
+            reservation = await self._limiter.aacquire(self._estimate_tokens(prompt))
+            await self._aacquire_slot(reservation)
+            started = time.perf_counter()
+            overloaded = False
+            completed = False
+            try:
+                message: BaseMessageChunk | None = None
+                last_partial: dict[str, Any] | None = None
+                # aclosing() closes the HTTP response even if the caller
+                # stops iterating early or is cancelled mid-stream
+                async with aclosing(
+                    cast(
+                        "AsyncGenerator[BaseMessageChunk, None]",
+                        self._client.astream(
+                            [HumanMessage(content=prompt)], **self._tool_kwargs(self._single_tool)
+                        ),
+                    )
+                ) as stream:
+                    while True:
+                        try:
+                            chunk = await anext(stream)
+                        except StopAsyncIteration:
+                            break
+                        except Exception as e:
+                            error = self._to_llm_error(e)
+                            overloaded = self._is_overload(error)
+                            raise error from e
+
+                        message = chunk if message is None else message + chunk
+                        partial = self._partial_output(message)
+                        if partial and partial != last_partial:
+                            last_partial = partial
+                            yield partial
+
+                if message is None:
+                    raise LLMAPIError("Empty response stream", status_code=500)
+                completed = True
+            finally:
+                # Also runs when the stream fails or the caller stops iterating
+                latency = time.perf_counter() - started
+                self._concurrency.release(latency, overloaded=overloaded)
+                if not completed:
+                    self._limiter.release(reservation)
+            self._record_call(message, latency)
+            self._reconcile_usage(reservation, message)
+            text = await self._astore_response(key, message)
+
+        try:
+            summary = self._single_parser.parse(text)
+        except Exception as e:
+            raise LLMParseError(str(e), raw_output=text) from e
+        yield summary.model_dump()
+
+    @classmethod
+    def _partial_output(cls, message: BaseMessageChunk) -> dict[str, Any] | None:
+        """Best-effort parse of a partially streamed response."""
+        tool_calls = getattr(message, "tool_calls", None)
+        if tool_calls:
+            args: dict[str, Any] = tool_calls[0]["args"]
+            return args
+        return cls._parse_partial(message.text())
+
+    @staticmethod
+    def _parse_partial(text: str) -> dict[str, Any] | None:
+        """Best-effort parse of an incomplete JSON object, or None if nothing parses yet."""
+        try:
+            parsed = parse_json_markdown(text, parser=parse_partial_json)
+        except ValueError:
+            return None
+        return parsed if isinstance(parsed, dict) else None
+
+    async def asummarize_articles(
+        self,
+        articles: Sequence[Article],
+        concurrency: int | None = None,
+    ) -> list[SummarizedArticle]:
+        """Summarize multiple articles concurrently.
+
+        Each article goes through asummarize_article, so concurrent calls
+        are micro-batched into shared LLM calls of up to summary_batch_size
+        articles.
+
+        LLM calls are capped by the shared adaptive concurrency controller;
+        concurrency optionally also caps how many articles are in flight.
+
+        Args:
+            articles: Articles to summarize.
+            concurrency: Max articles in flight (default: no extra cap).
+
+        Returns:
+            List of results in same order as input articles.
+        """
+        semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+        # gather returns results in submission order, so no index bookkeeping
+        return await asyncio.gather(*[self._asummarize_one(a, semaphore) for a in articles])
+
+    async def _asummarize_one(
+        self, article: Article, semaphore: asyncio.Semaphore | None
+    ) -> SummarizedArticle:
+        """Summarize one article under the caller's concurrency limit, if any.
+
+        Always returns a result; articles that need no LLM call resolve
+        without taking a slot.
+        """
+        if (local := self._local_result(article)) is not None:
+            return local
+
+        if semaphore is None:
+            return await self.asummarize_article(article)
+        async with semaphore:
+            return await self.asummarize_article(article)
+
     def summarize_articles(self, articles: Sequence[Article]) -> list[SummarizedArticle]:
-        """Summarize multiple articles sequentially. Preserves order."""
-        return [self.summarize_article(a) for a in articles]
+        """Summarize multiple articles concurrently. Preserves order.
+
+        Synchronous and safe to call from inside a running event loop: the
+        calls overlap on a thread pool (see summarize_articles_threaded)
+        rather than in a nested event loop.
+        """
+        return self.summarize_articles_threaded(articles)
+
+    def summarize_articles_threaded(
+        self,
+        articles: Sequence[Article],
+        max_workers: int | None = None,
+    ) -> list[SummarizedArticle]:
+        """Summarize multiple articles on a thread pool, one LLM call per article.
+
+        For synchronous callers that cannot use asummarize_articles, for
+        example from inside a running event loop. Each worker blocks in
+        network I/O, so threads overlap the calls much like asyncio does.
+
+        Args:
+            articles: Articles to summarize.
+            max_workers: Worker threads (default: the concurrency controller's
+                maximum, which caps in-flight calls either way).
+
+        Returns:
+            List of results in same order as input articles.
+        """
+        if not articles:
+            return []
+
+        if max_workers is None:
+            max_workers = self._concurrency.max_concurrency
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.summarize_article, articles))
 
     def summarize_articles_batch(
         self,
@@ -136,11 +573,13 @@ class LLMService:
             batch_size = get_settings().summary_batch_size
 
         # Separate articles with and without content
-        articles_with_content, results = self._prepare_batch(articles)
+        articles_with_content, results, duplicates = self._prepare_batch(articles)
 
         if not articles_with_content:
             return [r for r in results if r is not None]
 
+        before = self.telemetry.model_copy()
+
         # Process in chunks to avoid max_tokens limit
         total_batches = (len(articles_with_content) + batch_size - 1) // batch_size
         for batch_num, i in enumerate(range(0, len(articles_with_content), batch_size), 1):
@@ -155,22 +594,244 @@ class LLMService:
             )
             self._process_batch(chunk, results)
 
+        self._log_totals(before, len(articles))
+        self._fan_out_duplicates(articles, duplicates, results)
+        return [r for r in results if r is not None]
+
+    def summarize_articles_via_batch_api(
+        self,
+        articles: Sequence[Article],
+        poll_interval: float | None = None,
+        max_wait: float | None = None,
+    ) -> list[SummarizedArticle]:
+        """Summarize articles through the Anthropic Message Batches API.
+
+        Each article is submitted as an independent request in a single
+        message batch, which is billed at a discount and processed
+        asynchronously by Anthropic. Blocks until the batch has ended, so
+        this is intended for bulk offline runs rather than request handling.
+        A batch still running after max_wait seconds is cancelled and its
+        articles are returned as API_ERROR.
+
+        Args:
+            articles: Articles to summarize.
+            poll_interval: Seconds between batch status checks (default from settings).
+            max_wait: Seconds to wait for the batch to end (default from settings).
+
+        Returns:
+            List of results in same order as input articles.
+        """
+        if not articles:
+            return []
+
+        settings = get_settings()
+        if poll_interval is None:
+            poll_interval = settings.llm_batch_poll_interval
+        if max_wait is None:
+            max_wait = settings.llm_batch_max_wait
+
+        articles_with_content, results, duplicates = self._prepare_batch(articles)
+
+        if not articles_with_content:
+            return [r for r in results if r is not None]
+
+        pending = {
+            f"story-{article.story_id}-{orig_idx}": (orig_idx, article)
+            for orig_idx, article in articles_with_content
+        }
+        client = self._get_batch_client()
+
+        try:
+            batch = client.messages.batches.create(
+                requests=[
+                    Request(
+                        custom_id=custom_id,
+                        params=self._batch_api_params(article),
+                    )
+                    for custom_id, (_, article) in pending.items()
+                ]
+            )
+            logger.info("Submitted message batch %s with %d requests", batch.id, len(pending))
+
+            deadline = time.monotonic() + max_wait
+            while batch.processing_status != "ended" and time.monotonic() < deadline:
+                time.sleep(max(min(poll_interval, deadline - time.monotonic()), 0.0))
+                batch = client.messages.batches.retrieve(batch.id)
+
+            if batch.processing_status == "ended":
+                for entry in client.messages.batches.results(batch.id):
+                    if entry.custom_id not in pending:
+                        logger.warning("Unknown custom_id in batch results: %s", entry.custom_id)
+                        continue
+                    orig_idx, article = pending[entry.custom_id]
+                    results[orig_idx] = self._batch_api_result(article, entry.result)
+            else:
+                logger.error("Message batch %s did not end within %.0fs", batch.id, max_wait)
+                self._cancel_batch(client, batch.id)
+                self._fill_error_results(
+                    articles_with_content,
+                    results,
+                    SummarizationStatus.API_ERROR,
+                    f"Message batch did not end within {max_wait:.0f}s",
+                )
+        except APIError as e:
+            logger.error("LLM API error during message batch: %s", e)
+            self._fill_error_results(
+                articles_with_content, results, SummarizationStatus.API_ERROR, str(e)
+            )
+
+        self._fill_error_results(
+            articles_with_content,
+            results,
+            SummarizationStatus.PARSE_ERROR,
+            "Missing result in message batch",
+        )
+        self._fan_out_duplicates(articles, duplicates, results)
         return [r for r in results if r is not None]
 
+    @staticmethod
+    def _cancel_batch(client: Anthropic, batch_id: str) -> None:
+        """Cancel an unfinished message batch, logging rather than raising on failure."""
+        try:
+            client.messages.batches.cancel(batch_id)
+        except APIError as e:
+            logger.warning("Failed to cancel message batch %s: %s", batch_id, e)
+
+    def _batch_api_params(self, article: Article) -> MessageCreateParamsNonStreaming:
+        """Build Message Batches API parameters for summarizing one article."""
+        params = MessageCreateParamsNonStreaming(
+            model=self._model,
+            max_tokens=self._max_tokens,
+            temperature=self._temperature,
+            messages=[
+                {
+                    "role": "user",
+                    "content": self._build_prompt(
+                        article.content or article.hn_text or "", article.title
+                    ),
+                }
+            ],
+        )
+        if self._structured_output:
+            # AnthropicTool and the SDK's ToolParam describe the same payload
+            params["tools"] = [cast("ToolParam", self._single_tool)]
+            params["tool_choice"] = {"type": "tool", "name": self._single_tool["name"]}
+        return params
+
+    def _batch_api_result(self, article: Article, result: MessageBatchResult) -> SummarizedArticle:
+        """Convert a single Message Batches API result into a SummarizedArticle."""
+        if result.type != "succeeded":
+            error = f"Batch request {result.type}"
+            if result.type == "errored":
+                error = f"{error}: {result.error.error.message}"
+            return self._result(article, status=SummarizationStatus.API_ERROR, error=error)
+
+        text = next(
+            (
+                json.dumps(block.input)
+                for block in result.message.content
+                if block.type == "tool_use"
+            ),
+            "".join(block.text for block in result.message.content if block.type == "text"),
+        )
+        try:
+            summary = self._single_parser.parse(text)
+        except Exception as e:
+            logger.exception("Parse error for article %d", article.story_id)
+            return self._result(article, status=SummarizationStatus.PARSE_ERROR, error=str(e))
+        return self._result(article, summary=summary)
+
+    def _get_batch_client(self) -> Anthropic:
+        """Return the raw Anthropic client used for the Message Batches API."""
+        if self._batch_client is None:
+            self._batch_client = Anthropic(
+                api_key=self._api_key,
+                timeout=httpx.Timeout(self._request_timeout, connect=5.0),
+            )
+        return self._batch_client
+
     def _prepare_batch(
         self, articles: Sequence[Article]
-    ) -> tuple[list[tuple[int, Article]], list[SummarizedArticle | None]]:
-        """Separate articles with content from those without."""
+    ) -> tuple[list[tuple[int, Article]], list[SummarizedArticle | None], dict[int, list[int]]]:
+        """Separate articles with content from those without.
+
+        Articles whose title and content repeat an earlier one (reposts,
+        mirrors) are left out of articles_with_content; the returned map
+        records, for each representative index, the duplicate indices that
+        _fan_out_duplicates() later fills from its result.
+        """
         articles_with_content: list[tuple[int, Article]] = []
         results: list[SummarizedArticle | None] = [None] * len(articles)
+        duplicates: dict[int, list[int]] = {}
+        representatives: dict[bytes, int] = {}
 
         for i, article in enumerate(articles):
-            if article.content or article.hn_text:
-                articles_with_content.append((i, article))
+            if (local := self._local_result(article)) is not None:
+                results[i] = local
+                continue
+
+            content = article.content or article.hn_text or ""
+            key = hashlib.blake2b(f"{article.title}\0{content}".encode(), digest_size=16).digest()
+            if (rep_idx := representatives.get(key)) is not None:
+                duplicates.setdefault(rep_idx, []).append(i)
             else:
-                results[i] = self._result(article, status=SummarizationStatus.NO_CONTENT)
+                representatives[key] = i
+                articles_with_content.append((i, article))
 
-        return articles_with_content, results
+        if duplicates:
+            logger.info(
+                "Skipping %d duplicate articles in batch",
+                sum(len(dups) for dups in duplicates.values()),
+            )
+        return articles_with_content, results, duplicates
+
+    @staticmethod
+    def _fan_out_duplicates(
+        articles: Sequence[Article],
+        duplicates: dict[int, list[int]],
+        results: list[SummarizedArticle | None],
+    ) -> None:
+        """Copy each representative's result to its duplicates, keeping their own article."""
+        for rep_idx, dup_indices in duplicates.items():
+            source = results[rep_idx]
+            if source is None:
+                continue
+            for i in dup_indices:
+                results[i] = source.model_copy(update={"article": articles[i]})
+
+    async def _batched_summarize(self, articles: list[Article]) -> list[SummarizedArticle]:
+        """Summarize a micro-batch of articles with content in one LLM call."""
+        try:
+            batch_response = await self._acall_llm(
+                self._build_batch_prompt(articles), self._batch_tool
+            )
+        except (LLMRateLimitError, LLMAPIError) as e:
+            logger.error("LLM API error during batch summarization: %s", e)
+            return [
+                self._result(a, status=SummarizationStatus.API_ERROR, error=str(e))
+                for a in articles
+            ]
+
+        results = self._parse_batch_response(articles, batch_response)
+        if failed := self._failed_indices(results):
+            retried = await asyncio.gather(*[self._asummarize_single(articles[i]) for i in failed])
+            for i, result in zip(failed, retried, strict=True):
+                results[i] = result
+        return results
+
+    async def _asummarize_single(self, article: Article) -> SummarizedArticle:
+        """Summarize one article in its own LLM call, bypassing the micro-batcher."""
+        content = article.content or article.hn_text or ""
+        try:
+            response = await self._acall_llm(
+                self._build_prompt(content, article.title), self._single_tool
+            )
+            return self._result(article, summary=self._single_parser.parse(response))
+        except (LLMRateLimitError, LLMAPIError) as e:
+            return self._result(article, status=SummarizationStatus.API_ERROR, error=str(e))
+        except Exception as e:
+            logger.exception("Parse error for article %d", article.story_id)
+            return self._result(article, status=SummarizationStatus.PARSE_ERROR, error=str(e))
 
     def _process_batch(
         self,
@@ -180,38 +841,105 @@ class LLMService:
         """Process batch API call and populate results."""
         try:
             batch_response = self._call_llm(
-                self._build_batch_prompt([a for _, a in articles_with_content])
+                self._build_batch_prompt([a for _, a in articles_with_content]), self._batch_tool
             )
-            batch_summaries = self._batch_parser.parse(batch_response)
-            self._map_batch_results(articles_with_content, batch_summaries.summaries, results)
         except (LLMRateLimitError, LLMAPIError) as e:
             logger.error("LLM API error during batch summarization: %s", e)
             self._fill_error_results(
                 articles_with_content, results, SummarizationStatus.API_ERROR, str(e)
             )
+        else:
+            chunk = [a for _, a in articles_with_content]
+            parsed = self._parse_batch_response(chunk, batch_response)
+            if failed := self._failed_indices(parsed):
+                retried = self.summarize_articles_threaded(
+                    [chunk[i] for i in failed], max_workers=len(failed)
+                )
+                for i, result in zip(failed, retried, strict=True):
+                    parsed[i] = result
+            for (orig_idx, _), result in zip(articles_with_content, parsed, strict=True):
+                results[orig_idx] = result
+
+    def _parse_batch_response(
+        self, articles: list[Article], batch_response: str
+    ) -> list[SummarizedArticle]:
+        """Parse a batch LLM response into one result per article, in input order.
+
+        If the response as a whole does not parse, individually valid
+        summaries are salvaged. Articles left without a summary (malformed
+        or missing from the response) become PARSE_ERROR.
+        """
+        summaries: list[ArticleSummary | None]
+        error = "Missing summary in batch response"
+        try:
+            summaries = list(self._batch_parser.parse(batch_response).summaries)
         except Exception as e:
-            logger.exception("Batch parse error")
-            self._fill_error_results(
-                articles_with_content, results, SummarizationStatus.PARSE_ERROR, str(e)
+            summaries = self._salvage_summaries(batch_response, len(articles))
+            error = str(e)
+            logger.warning(
+                "Batch parse error, salvaged %d of %d summaries: %s",
+                sum(s is not None for s in summaries),
+                len(articles),
+                e,
             )
 
-    def _map_batch_results(
-        self,
-        articles_with_content: list[tuple[int, Article]],
-        summaries: list[ArticleSummary],
-        results: list[SummarizedArticle | None],
-    ) -> None:
-        """Map batch summaries back to original article positions."""
-        for (orig_idx, article), summary in zip(articles_with_content, summaries, strict=False):
-            results[orig_idx] = self._result(article, summary=summary)
+        return [
+            self._result(article, summary=summary)
+            if i < len(summaries) and (summary := summaries[i]) is not None
+            else self._result(article, status=SummarizationStatus.PARSE_ERROR, error=error)
+            for i, article in enumerate(articles)
+        ]
 
-        # Fill any missing results (if LLM returned fewer summaries)
-        self._fill_error_results(
-            [(i, a) for i, a in articles_with_content if results[i] is None],
-            results,
-            SummarizationStatus.PARSE_ERROR,
-            "Missing summary in batch response",
-        )
+    @staticmethod
+    def _salvage_summaries(text: str, count: int) -> list[ArticleSummary | None]:
+        """Recover individually valid summaries from an unparseable batch response.
+
+        Walks the "summaries" array one element at a time with raw_decode,
+        so every item before a syntax error or truncation keeps its index.
+
+        Args:
+            text: Raw batch response.
+            count: Number of articles in the batch.
+
+        Returns:
+            Summary per article index, None where nothing valid was found.
+        """
+        salvaged: list[ArticleSummary | None] = [None] * count
+        key = text.find('"summaries"')
+        start = text.find("[", key) if key >= 0 else -1
+        if start < 0:
+            return salvaged
+
+        decoder = json.JSONDecoder()
+        pos = start + 1
+        for i in range(count):
+            while pos < len(text) and text[pos] in " \t\r\n,":
+                pos += 1
+            try:
+                item, pos = decoder.raw_decode(text, pos)
+            except json.JSONDecodeError:
+                break
+            try:
+                salvaged[i] = ArticleSummary.model_validate(item)
+            except ValidationError:
+                continue
+        return salvaged
+
+    @staticmethod
+    def _failed_indices(results: list[SummarizedArticle]) -> list[int]:
+        """Indices of batch results to retry individually, logging when there are any."""
+        failed = [
+            i
+            for i, r in enumerate(results)
+            if r.summarization_status == SummarizationStatus.PARSE_ERROR
+        ]
+        if failed:
+            logger.warning(
+                "Batch response unusable for %d of %d articles; retrying them individually",
+                len(failed),
+                len(results),
+            )
+        return failed
 
     def _fill_error_results(
         self,
@@ -226,46 +954,286 @@ class LLMService:
                 results[orig_idx] = self._result(article, status=status, error=error)
 
     def _build_prompt(self, content: str, title: str) -> str:
-        """Build prompt with format instructions."""
-        return PROMPT_TEMPLATE.format(
-            title=title,
-            content=content,
-            format_instructions=self._single_parser.get_format_instructions(),
-        )
+        """Build prompt, clipping content to the context window.
+
+        Format instructions are included only when structured output is disabled.
+        """
+        overhead = len(PROMPT_TEMPLATE) + len(self._single_fmt) + len(title)
+        content = self._truncate(content, self._content_budget(overhead, 1))
+        head = _PROMPT_HEAD.format(title=title, content=content)
+        return f"{head}{self._single_fmt}{_PROMPT_TAIL}"
 
     def _build_batch_prompt(self, articles: list[Article]) -> str:
-        """Build batch prompt for multiple articles."""
-        articles_section = "\n\n".join(
-            f"---\n**Article {i + 1}**\n**Title**: {a.title}\n**Content**:\n"
-            f"{a.content or a.hn_text}\n---"
-            for i, a in enumerate(articles)
+        """Build batch prompt for multiple articles, sharing the context window evenly."""
+        overhead = (
+            len(BATCH_PROMPT_TEMPLATE)
+            + len(self._batch_fmt)
+            + sum(len(a.title) + len(_BATCH_ARTICLE_FRAME) for a in articles)
         )
-        return BATCH_PROMPT_TEMPLATE.format(
-            articles_section=articles_section,
-            format_instructions=self._batch_parser.get_format_instructions(),
+        budget = self._content_budget(overhead, len(articles))
+        articles_section = "\n\n".join(
+            [
+                f"---\n**Article {i}**\n**Title**: {a.title}\n**Content**:\n"
+                f"{self._truncate(a.content or a.hn_text or '', budget)}\n---"
+                for i, a in enumerate(articles, 1)
+            ]
         )
+        head = _BATCH_PROMPT_HEAD.format(articles_section=articles_section)
+        return f"{head}{self._batch_fmt}{_BATCH_PROMPT_TAIL}"
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=30),
+        retry=retry_if_exception(_is_retryable),
+        before_sleep=_record_retry,
+        reraise=True,
+    )
+    def _call_llm(self, prompt: str, tool: AnthropicTool | None = None) -> str:
+        """Call LLM with retry on rate limits.
+
+        Paced by the shared limiter and capped by the same adaptive
+        concurrency controller as _acall_llm.
+        """
+        key = self._cache_key(prompt)
+        if (cached := self._cache.get(key)) is not None:
+            logger.debug("LLM cache hit for %s", key[:12])
+            return cached
+
+        reservation = self._limiter.acquire(self._estimate_tokens(prompt))
+        self._concurrency.acquire()
+        started = time.perf_counter()
+        overloaded = False
+        try:
+            response = self._client.invoke(
+                [HumanMessage(content=prompt)], **self._tool_kwargs(tool)
+            )
+        except Exception as e:
+            self._limiter.release(reservation)
+            error = self._to_llm_error(e)
+            overloaded = self._is_overload(error)
+            raise error from e
+        finally:
+            latency = time.perf_counter() - started
+            self._concurrency.release(latency, overloaded=overloaded)
+        self._record_call(response, latency)
+        self._reconcile_usage(reservation, response)
+        return self._store_response(key, response)
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type(LLMRateLimitError),
+        retry=retry_if_exception(_is_retryable),
+        before_sleep=_record_retry,
         reraise=True,
     )
-    def _call_llm(self, prompt: str) -> str:
-        """Call LLM with retry on rate limits."""
+    async def _acall_llm(self, prompt: str, tool: AnthropicTool | None = None) -> str:
+        """Call LLM asynchronously with retry on rate limits.
+
+        Paced by the shared limiter; in-flight calls are capped by the
+        adaptive concurrency controller, which is fed each call's latency
+        and whether it was throttled.
+        """
+        key = self._cache_key(prompt)
+        if (cached := await self._cache.aget(key)) is not None:
+            logger.debug("LLM cache hit for %s", key[:12])
+            return cached
+
+        reservation = await self._limiter.aacquire(self._estimate_tokens(prompt))
+        await self._aacquire_slot(reservation)
+        started = time.perf_counter()
+        overloaded = False
         try:
-            response = self._client.invoke([HumanMessage(content=prompt)])
-            return str(response.content)
+            response = await self._client.ainvoke(
+                [HumanMessage(content=prompt)], **self._tool_kwargs(tool)
+            )
         except Exception as e:
-            if self._is_rate_limit_error(e):
-                raise LLMRateLimitError(str(e)) from e
-            raise LLMAPIError(str(e), status_code=500) from e
+            self._limiter.release(reservation)
+            error = self._to_llm_error(e)
+            overloaded = self._is_overload(error)
+            raise error from e
+        finally:
+            latency = time.perf_counter() - started
+            self._concurrency.release(latency, overloaded=overloaded)
+        self._record_call(response, latency)
+        self._reconcile_usage(reservation, response)
+        return await self._astore_response(key, response)
+
+    async def _aacquire_slot(self, reservation: list[float]) -> None:
+        """Wait for a concurrency slot, handing the reservation back if the wait is abandoned."""
+        try:
+            await self._concurrency.aacquire()
+        except BaseException:
+            # Cancelled or timed out while queued for a slot
+            self._limiter.release(reservation)
+            raise
+
+    def _record_call(self, response: BaseMessage, latency: float) -> None:
+        """Log a completed API call and add it to the running telemetry."""
+        usage = getattr(response, "usage_metadata", None) or {}
+        input_tokens = usage.get("input_tokens", 0)
+        output_tokens = usage.get("output_tokens", 0)
+        latency_ms = latency * 1000
+        with self._telemetry_lock:
+            self.telemetry.calls += 1
+            self.telemetry.input_tokens += input_tokens
+            self.telemetry.output_tokens += output_tokens
+            self.telemetry.latency_ms += latency_ms
+
+        logger.info(
+            "LLM call: model=%s input_tokens=%d output_tokens=%d latency_ms=%.0f",
+            self._model,
+            input_tokens,
+            output_tokens,
+            latency_ms,
+            extra={
+                "event_type": "llm_call",
+                "model": self._model,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "latency_ms": latency_ms,
+            },
+        )
+
+    def _log_totals(self, before: LLMTelemetry, articles: int) -> None:
+        """Log telemetry accumulated since the before snapshot."""
+        after = self.telemetry
+        totals = {
+            "calls": after.calls - before.calls,
+            "input_tokens": after.input_tokens - before.input_tokens,
+            "output_tokens": after.output_tokens - before.output_tokens,
+            "latency_ms": after.latency_ms - before.latency_ms,
+            "retries": after.retries - before.retries,
+        }
+        logger.info(
+            "LLM batch totals: articles=%d calls=%d input_tokens=%d output_tokens=%d "
+            "latency_ms=%.0f retries=%d",
+            articles,
+            *totals.values(),
+            extra={"event_type": "llm_batch_totals", "articles": articles, **totals},
+        )
+
+    def _tool_kwargs(self, tool: AnthropicTool | None) -> dict[str, Any]:
+        """Call arguments that force the model to answer through tool, if enabled."""
+        if tool is None or not self._structured_output:
+            return {}
+        return {"tools": [tool], "tool_choice": {"type": "tool", "name": tool["name"]}}
+
+    def _cache_key(self, prompt: str) -> str:
+        """Cache key for a prompt under this service's model settings."""
+        return self._cache.make_key(self._model, self._temperature, self._max_tokens, prompt)
+
+    def _store_response(self, key: str, response: BaseMessage) -> str:
+        """Cache a complete response and return its text.
+
+        Responses cut off at max_tokens are returned but not cached, since
+        they are almost certainly truncated JSON.
+        """
+        text = self._response_text(response)
+        if response.response_metadata.get("stop_reason") != "max_tokens":
+            self._cache.set(key, text)
+        return text
+
+    async def _astore_response(self, key: str, response: BaseMessage) -> str:
+        """Async _store_response() that keeps SQLite writes off the event loop."""
+        text = self._response_text(response)
+        if response.response_metadata.get("stop_reason") != "max_tokens":
+            await self._cache.aset(key, text)
+        return text
+
+    @staticmethod
+    def _response_text(response: BaseMessage) -> str:
+        """Response payload as text: the tool call input as JSON, else the message text."""
+        tool_calls = getattr(response, "tool_calls", None)
+        if tool_calls:
+            return json.dumps(tool_calls[0]["args"])
+        return str(response.content)
+
+    def _estimate_tokens(self, prompt: str) -> int:
+        """Estimate tokens for a call: ~4 chars per input token plus max output."""
+        return len(prompt) // _CHARS_PER_TOKEN + self._max_tokens
+
+    def _content_budget(self, overhead_chars: int, count: int) -> int:
+        """Max content characters per article that keep a prompt inside the context window.
+
+        Args:
+            overhead_chars: Characters of the prompt that are not article content.
+            count: Number of articles sharing the budget.
+
+        Returns:
+            Character budget for each article's content.
+        """
+        budget_tokens = self._context_window - self._max_tokens - overhead_chars // _CHARS_PER_TOKEN
+        return max(budget_tokens, 0) * _CHARS_PER_TOKEN // max(count, 1)
+
+    @staticmethod
+    def _truncate(content: str, max_chars: int) -> str:
+        """Clip content to max_chars, ending with TRUNCATION_MARKER if clipped."""
+        if len(content) <= max_chars:
+            return content
+        logger.info("Truncating article content from %d to %d chars", len(content), max_chars)
+        return content[: max(max_chars - len(TRUNCATION_MARKER), 0)] + TRUNCATION_MARKER
+
+    def _reconcile_usage(self, reservation: list[float], response: BaseMessage) -> None:
+        """Correct the limiter reservation with the usage reported by the API."""
+        usage = getattr(response, "usage_metadata", None)
+        if usage:
+            self._limiter.reconcile(reservation, usage["total_tokens"])
+
+    @classmethod
+    def _to_llm_error(cls, error: Exception) -> LLMRateLimitError | LLMAPIError:
+        """Translate a client exception into the service's error types."""
+        if cls._is_rate_limit_error(error):
+            return LLMRateLimitError(str(error))
+        if isinstance(error, APITimeoutError):
+            return LLMAPIError(str(error), status_code=504, retryable=True)
+        if isinstance(error, APIConnectionError):
+            return LLMAPIError(str(error), status_code=503, retryable=True)
+        if isinstance(error, APIStatusError):
+            # 5xx and 529 overloaded are transient on Anthropic's side
+            retryable = error.status_code >= 500  # noqa: PLR2004
+            return LLMAPIError(str(error), status_code=error.status_code, retryable=retryable)
+        return LLMAPIError(str(error), status_code=500)
+
+    @staticmethod
+    def _is_overload(error: LLMRateLimitError | LLMAPIError) -> bool:
+        """Check if an error signals provider congestion (429 or timeout)."""
+        return isinstance(error, LLMRateLimitError) or (
+            isinstance(error, LLMAPIError) and error.status_code == 504  # noqa: PLR2004
+        )
 
     @staticmethod
     def _is_rate_limit_error(error: Exception) -> bool:
         """Check if error is a rate limit error."""
-        error_str = str(error).lower()
-        return ("rate" in error_str and "limit" in error_str) or "429" in str(error)
+        return isinstance(error, RateLimitError) or (
+            isinstance(error, APIStatusError) and error.status_code == 429  # noqa: PLR2004
+        )
+
+    def _local_result(self, article: Article) -> SummarizedArticle | None:
+        """Result for an article that needs no LLM call, or None if it does.
+
+        Articles without content are NO_CONTENT. When llm_min_content_chars
+        is set, content shorter than it is already summary-sized, so it
+        becomes the summary as-is (prefixed with the title if too short to
+        stand alone). Such summaries carry no tech tags.
+        """
+        if not article.has_content:
+            return self._result(article, status=SummarizationStatus.NO_CONTENT)
+        if not self._min_content_chars:
+            return None
+
+        # hn_text is the raw HTML of an Ask HN/job post
+        text = (article.content or _html_to_text(article.hn_text or "")).strip()
+        if len(text) >= self._min_content_chars:
+            return None
+
+        if len(text) < _MIN_SUMMARY_CHARS:
+            text = f"{article.title}: {text}"
+        try:
+            summary = ArticleSummary(summary=text, key_points=[article.title])
+        except ValidationError:
+            # Still too short to be a valid summary; let the model try
+            return None
+        return self._result(article, summary=summary)
 
     @staticmethod
     def _result(
@@ -0,0 +1,174 @@
+"""Response cache for LLM calls.
+
+Summaries are generated at temperature 0 from a prompt fully determined by
+the article, so identical prompts can reuse a previous response. The cache
+keys on a SHA-256 hash of (namespace, model, temperature, max_tokens,
+prompt) and supports the backends selected by ``llm_cache_type``:
+
+- memory: in-process LRU, cleared on restart (the default)
+- sqlite: in-process LRU in front of a persistent SQLite table (opt-in)
+- none: caching disabled
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Literal
+
+from hn_herald.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 1024
+"""Maximum responses kept in the in-process LRU tier."""
+
+
+class LLMResponseCache:
+    """Two-tier (memory, optional SQLite) cache of raw LLM responses.
+
+    Entries expire after ``ttl`` seconds in both tiers. All operations are
+    guarded by a lock so a single instance can be shared across threads.
+
+    Usage:
+        cache = get_llm_cache()
+        key = cache.make_key(model, temperature, max_tokens, prompt)
+        if (hit := cache.get(key)) is None:
+            cache.set(key, call_llm(prompt))
+    """
+
+    def __init__(
+        self,
+        cache_type: Literal["sqlite", "memory", "none"],
+        ttl: int,
+        namespace: str = "",
+        database_path: str | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_type: Backend to use ("sqlite", "memory" or "none").
+            ttl: Seconds before an entry expires.
+            namespace: Prefix mixed into every key; change it to invalidate all entries.
+            database_path: SQLite file path (required for "sqlite").
+            max_entries: Maximum entries held in the in-process LRU tier.
+        """
+        self.enabled = cache_type != "none"
+        self.ttl = ttl
+        self.namespace = namespace
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._db: sqlite3.Connection | None = None
+
+        if cache_type == "sqlite" and database_path:
+            Path(database_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(database_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    def make_key(self, model: str, temperature: float, max_tokens: int, prompt: str) -> str:
+        """Build the cache key for a call.
+
+        Args:
+            model: Model identifier.
+            temperature: Sampling temperature.
+            max_tokens: Maximum output tokens.
+            prompt: Full prompt text.
+
+        Returns:
+            Hex SHA-256 digest identifying the call.
+        """
+        raw = f"{self.namespace}|{model}|{temperature}|{max_tokens}|{prompt}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for key, or None on miss or expiry."""
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    return entry[1]
+                del self._memory[key]
+
+            if self._db is None:
+                return None
+
+            row = self._db.execute(
+                "SELECT value, expires_at FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                return None
+
+            self._remember(key, row[1], row[0])
+            return str(row[0])
+
+    def set(self, key: str, value: str) -> None:
+        """Store a response under key for ttl seconds."""
+        if not self.enabled:
+            return
+
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._remember(key, expires_at, value)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO llm_responses VALUES (?, ?, ?)",
+                        (key, value, expires_at),
+                    )
+                    self._db.commit()
+                except sqlite3.Error:
+                    logger.exception("Failed to persist LLM response to cache")
+
+    async def aget(self, key: str) -> str | None:
+        """Async get(); SQLite lookups run on a worker thread, memory hits inline."""
+        if self._db is None:
+            return self.get(key)
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: str) -> None:
+        """Async set(); SQLite writes run on a worker thread, memory stores inline."""
+        if self._db is None:
+            self.set(key, value)
+        else:
+            await asyncio.to_thread(self.set, key, value)
+
+    def _remember(self, key: str, expires_at: float, value: str) -> None:
+        """Insert into the LRU tier, evicting the oldest entry when full."""
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+
+@lru_cache
+def get_llm_cache() -> LLMResponseCache:
+    """Get the process-wide LLM response cache, configured from settings.
+
+    Returns:
+        Shared LLMResponseCache instance.
+    """
+    settings = get_settings()
+    return LLMResponseCache(
+        cache_type=settings.llm_cache_type,
+        ttl=settings.llm_cache_ttl,
+        namespace=settings.llm_cache_namespace,
+        database_path=settings.cache_database_path,
+    )
@@ -10,34 +10,91 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+from collections import Counter
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, ClassVar
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 import httpx
-from bs4 import BeautifulSoup
+from lxml import etree, html
 from tenacity import (
     retry,
     retry_if_exception_type,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
 )
 
 from hn_herald.config import get_settings
 from hn_herald.models.article import Article, ExtractionStatus
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
     from types import TracebackType
 
     from hn_herald.models.story import Story
 
 logger = logging.getLogger(__name__)
 
+# Main content containers, compiled once and tried in priority order:
+# <article>, <main>, the first element whose class (then id) mentions a
+# content-like word (matched case-insensitively in C via EXSLT regex),
+# and finally <body>
+_CONTENT_CONTAINER_PATTERN = "content|post|article|entry|story"
+_CONTENT_CONTAINER_XPATHS = (
+    etree.XPath("(//article)[1]"),
+    etree.XPath("(//main)[1]"),
+    *(
+        etree.XPath(
+            f"(//*[re:test(@{attr}, '{_CONTENT_CONTAINER_PATTERN}', 'i')])[1]",
+            namespaces={"re": "http://exslt.org/regular-expressions"},
+        )
+        for attr in ("class", "id")
+    ),
+    etree.XPath("(//body)[1]"),
+)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Seconds an idle pooled connection stays open for reuse by later fetches
+_KEEPALIVE_EXPIRY = 30.0
+
+# Bytes requested per read when streaming a response body
+_STREAM_CHUNK_SIZE = 65536
+
+# A <meta charset> declaration near the top of a page, which lxml honours
+# itself; pages without one (or a Content-Type charset) are parsed as UTF-8
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset", re.IGNORECASE)
+_META_CHARSET_SCAN_BYTES = 2048
+
+# Marks a trie node whose label path spells a complete blocked domain
+_TRIE_END = "$"
+
+
+def _build_domain_trie(domains: Iterable[str]) -> dict[str, Any]:
+    """Build a trie of domains keyed by reversed dot-labels.
+
+    "twitter.com" becomes {"com": {"twitter": {"$": True}}}, so a lookup
+    walks a hostname from its TLD and stops at the first blocked suffix.
+
+    Args:
+        domains: Lowercase domain names.
+
+    Returns:
+        Nested dict trie with _TRIE_END marking complete domains.
+    """
+    trie: dict[str, Any] = {}
+    for domain in domains:
+        node = trie
+        for label in reversed(domain.split(".")):
+            node = node.setdefault(label, {})
+        node[_TRIE_END] = True
+    return trie
+
 
 class ArticleLoader:
     """Async service for extracting article content from URLs.
 
-    Fetches and processes article content using httpx and BeautifulSoup
+    Fetches and processes article content using httpx and lxml
     with retry logic, domain filtering, and content truncation.
 
     Usage:
@@ -52,73 +109,80 @@ class ArticleLoader:
     """
 
     # Domains that should be skipped (problematic for extraction)
-    BLOCKED_DOMAINS: ClassVar[set[str]] = {
-        # Social media (requires JS, rate-limited)
-        "twitter.com",
-        "x.com",
-        "reddit.com",
-        "old.reddit.com",
-        "facebook.com",
-        "instagram.com",
-        # Video platforms (no text content)
-        "youtube.com",
-        "youtu.be",
-        "vimeo.com",
-        "tiktok.com",
-        # Code hosting (complex structure, often binary)
-        "github.com",
-        "gitlab.com",
-        "bitbucket.org",
-        # Google services (auth required)
-        "docs.google.com",
-        "drive.google.com",
-        "sheets.google.com",
-        # Paywalled sites
-        "medium.com",
-        "bloomberg.com",
-        "wsj.com",
-        "nytimes.com",
-        "ft.com",
-        "economist.com",
-        "washingtonpost.com",
-        # Professional networks (auth required)
-        "linkedin.com",
-    }
+    BLOCKED_DOMAINS: ClassVar[frozenset[str]] = frozenset(
+        {
+            # Social media (requires JS, rate-limited)
+            "twitter.com",
+            "x.com",
+            "reddit.com",
+            "old.reddit.com",
+            "facebook.com",
+            "instagram.com",
+            # Video platforms (no text content)
+            "youtube.com",
+            "youtu.be",
+            "vimeo.com",
+            "tiktok.com",
+            # Code hosting (complex structure, often binary)
+            "github.com",
+            "gitlab.com",
+            "bitbucket.org",
+            # Google services (auth required)
+            "docs.google.com",
+            "drive.google.com",
+            "sheets.google.com",
+            # Paywalled sites
+            "medium.com",
+            "bloomberg.com",
+            "wsj.com",
+            "nytimes.com",
+            "ft.com",
+            "economist.com",
+            "washingtonpost.com",
+            # Professional networks (auth required)
+            "linkedin.com",
+        }
+    )
+
+    # Blocked domains as a reversed-label trie, so subdomains match too
+    _BLOCKED_DOMAIN_TRIE: ClassVar[dict[str, Any]] = _build_domain_trie(BLOCKED_DOMAINS)
 
     # File extensions that should be skipped
-    BLOCKED_EXTENSIONS: ClassVar[set[str]] = {
-        # Documents
-        ".pdf",
-        ".doc",
-        ".docx",
-        ".xls",
-        ".xlsx",
-        ".ppt",
-        ".pptx",
-        # Archives
-        ".zip",
-        ".tar",
-        ".gz",
-        ".rar",
-        ".7z",
-        # Media
-        ".mp4",
-        ".mp3",
-        ".wav",
-        ".avi",
-        ".mov",
-        ".mkv",
-        ".webm",
-        # Images
-        ".jpg",
-        ".jpeg",
-        ".png",
-        ".gif",
-        ".svg",
-        ".webp",
-        ".bmp",
-        ".ico",
-    }
+    BLOCKED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset(
+        {
+            # Documents
+            ".pdf",
+            ".doc",
+            ".docx",
+            ".xls",
+            ".xlsx",
+            ".ppt",
+            ".pptx",
+            # Archives
+            ".zip",
+            ".tar",
+            ".gz",
+            ".rar",
+            ".7z",
+            # Media
+            ".mp4",
+            ".mp3",
+            ".wav",
+            ".avi",
+            ".mov",
+            ".mkv",
+            ".webm",
+            # Images
+            ".jpg",
+            ".jpeg",
+            ".png",
+            ".gif",
+            ".svg",
+            ".webp",
+            ".bmp",
+            ".ico",
+        }
+    )
 
     # Tags to remove from HTML before extraction
     REMOVE_TAGS: ClassVar[list[str]] = [
@@ -135,12 +199,16 @@ class ArticleLoader:
         "button",
     ]
 
+    # Arguments for etree.strip_elements: REMOVE_TAGS plus comment nodes
+    _STRIPPED_NODES: ClassVar[tuple[Any, ...]] = (*REMOVE_TAGS, etree.Comment)
+
     def __init__(
         self,
         timeout: int | None = None,
         max_retries: int = 3,
         max_concurrent: int = 10,
         max_content_length: int | None = None,
+        max_response_bytes: int | None = None,
     ) -> None:
         """Initialize article loader.
 
@@ -150,28 +218,42 @@ class ArticleLoader:
             max_concurrent: Maximum concurrent requests.
             max_content_length: Maximum content length in characters.
                                Defaults to settings value.
+            max_response_bytes: Maximum response body bytes to read.
+                               Defaults to settings value.
         """
         settings = get_settings()
         self.timeout = timeout or settings.article_fetch_timeout
         self.max_retries = max_retries
         self.max_concurrent = max_concurrent
         self.max_content_length = max_content_length or settings.max_content_length
+        self.max_response_bytes = max_response_bytes or settings.max_response_bytes
         self._client: httpx.AsyncClient | None = None
         self._semaphore: asyncio.Semaphore | None = None
 
     async def __aenter__(self) -> ArticleLoader:
         """Async context manager entry.
 
-        Creates the HTTP client and semaphore for rate limiting.
+        Creates the HTTP client and semaphore for rate limiting. The
+        connection pool is sized to the semaphore so every concurrent fetch
+        can keep its connection alive, and HTTP/2 lets requests to the same
+        origin share one connection.
 
         Returns:
             The ArticleLoader instance.
         """
         self._client = httpx.AsyncClient(
             timeout=httpx.Timeout(self.timeout),
+            limits=httpx.Limits(
+                max_connections=self.max_concurrent,
+                max_keepalive_connections=self.max_concurrent,
+                keepalive_expiry=_KEEPALIVE_EXPIRY,
+            ),
+            http2=True,
             headers={
                 "User-Agent": "HN-Herald/0.1 (+https://github.com/darth-dodo/ai-adventures)",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                # HTML only, so well-behaved servers can refuse other types
+                # (406) before sending a body
+                "Accept": "text/html,application/xhtml+xml;q=0.9",
                 "Accept-Language": "en-US,en;q=0.5",
             },
             follow_redirects=True,
@@ -228,9 +310,14 @@ class ArticleLoader:
             raise RuntimeError(msg)
         return self._semaphore
 
-    def extract_domain(self, url: str) -> str | None:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def extract_domain(url: str) -> str | None:
         """Extract domain from URL.
 
+        Cached, since each story's URL is parsed for its domain by both
+        extract_article and should_skip_url.
+
         Args:
             url: URL to extract domain from.
 
@@ -238,22 +325,20 @@ class ArticleLoader:
             Domain string (e.g., 'example.com') or None if invalid.
         """
         try:
-            parsed = urlparse(url)
-            if parsed.netloc:
+            netloc = urlsplit(url).netloc
+            if netloc:
                 # Remove www. prefix for consistency
-                domain = parsed.netloc.lower()
-                if domain.startswith("www."):
-                    domain = domain[4:]
-                return domain
+                return netloc.lower().removeprefix("www.")
         except Exception:
             logger.debug("Failed to parse URL: %s", url)
         return None
 
-    def should_skip_url(self, url: str) -> tuple[bool, str]:
+    def should_skip_url(self, url: str, domain: str | None = None) -> tuple[bool, str]:
         """Check if URL should be skipped.
 
         Args:
             url: URL to check.
+            domain: The URL's domain if the caller already extracted it.
 
         Returns:
             Tuple of (should_skip, reason).
@@ -262,23 +347,43 @@ class ArticleLoader:
             return True, "No URL provided"
 
         # Check domain
-        domain = self.extract_domain(url)
-        if domain and domain in self.BLOCKED_DOMAINS:
+        if domain is None:
+            domain = self.extract_domain(url)
+        if domain and self._is_blocked_domain(domain):
             return True, f"Blocked domain: {domain}"
 
-        # Check file extension
-        parsed = urlparse(url)
-        path_lower = parsed.path.lower()
-        for ext in self.BLOCKED_EXTENSIONS:
-            if path_lower.endswith(ext):
-                return True, f"Blocked file type: {ext}"
+        # Check file extension (one hash lookup on the final suffix)
+        _, dot, suffix = urlsplit(url).path.lower().rpartition(".")
+        ext = dot + suffix
+        if dot and ext in self.BLOCKED_EXTENSIONS:
+            return True, f"Blocked file type: {ext}"
 
         return False, ""
 
+    def _is_blocked_domain(self, domain: str) -> bool:
+        """Check if domain or any parent domain is blocked.
+
+        Args:
+            domain: Lowercase domain (e.g., 'mobile.twitter.com').
+
+        Returns:
+            True if a suffix of the domain is in BLOCKED_DOMAINS.
+        """
+        node = self._BLOCKED_DOMAIN_TRIE
+        for label in reversed(domain.split(".")):
+            child: dict[str, Any] | None = node.get(label)
+            if child is None:
+                return False
+            if _TRIE_END in child:
+                return True
+            node = child
+        return False
+
     def _clean_text(self, text: str) -> str:
         """Clean extracted text content.
 
-        Removes excessive whitespace and normalizes line breaks.
+        Collapses every whitespace run, line breaks included, to a single
+        space in one pass.
 
         Args:
             text: Raw extracted text.
@@ -286,12 +391,7 @@ class ArticleLoader:
         Returns:
             Cleaned text content.
         """
-        # Normalize whitespace
-        text = re.sub(r"\s+", " ", text)
-        # Split into lines and clean each
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
-        # Rejoin with single newlines
-        return "\n".join(lines)
+        return _WHITESPACE_RE.sub(" ", text).strip()
 
     def _truncate_content(self, content: str) -> str:
         """Truncate content to maximum length.
@@ -321,45 +421,46 @@ class ArticleLoader:
 
         return truncated.strip()
 
-    def _extract_content_from_html(self, html: str) -> str | None:
+    def _extract_content_from_html(self, body: bytes, encoding: str | None = None) -> str | None:
         """Extract text content from HTML.
 
-        Uses BeautifulSoup to parse HTML and extract readable text.
+        Parses the raw bytes with lxml directly, so decoding and the whole
+        extraction run in C without building a Python object per node.
 
         Args:
-            html: Raw HTML content.
+            body: Raw HTML bytes.
+            encoding: Charset from the Content-Type header, if any. Without
+                one lxml uses the page's <meta charset>, falling back to UTF-8.
 
         Returns:
             Extracted text content or None if extraction failed.
         """
+        if not body.strip():
+            return None
+
+        if encoding is None and not _META_CHARSET_RE.search(body, 0, _META_CHARSET_SCAN_BYTES):
+            encoding = "utf-8"
+
         try:
-            soup = BeautifulSoup(html, "lxml")
-        except Exception:
-            logger.debug("Failed to parse HTML with lxml, trying html.parser")
-            try:
-                soup = BeautifulSoup(html, "html.parser")
-            except Exception:
-                logger.warning("Failed to parse HTML")
-                return None
-
-        # Remove unwanted tags
-        for tag in soup(self.REMOVE_TAGS):
-            tag.decompose()
-
-        # Try to find main content container
-        main_content = (
-            soup.find("article")
-            or soup.find("main")
-            or soup.find(class_=re.compile(r"content|post|article|entry|story", re.I))
-            or soup.find(id=re.compile(r"content|post|article|entry|story", re.I))
-            or soup.find("body")
-        )
+            root = html.document_fromstring(body, parser=html.HTMLParser(encoding=encoding))
+        except (etree.ParserError, LookupError):
+            logger.warning("Failed to parse HTML")
+            return None
+
+        # Remove unwanted tags (keeping the text that follows them) and comments
+        etree.strip_elements(root, *self._STRIPPED_NODES, with_tail=False)
 
-        if not main_content:
+        # Take the first container that matches, most specific first
+        for xpath in _CONTENT_CONTAINER_XPATHS:
+            matches = xpath(root)
+            if matches:
+                main_content = matches[0]
+                break
+        else:
             return None
 
-        # Extract text
-        text = main_content.get_text(separator="\n", strip=True)
+        # Extract text; _clean_text collapses the separators and blank runs
+        text = " ".join(main_content.itertext())
 
         # Clean and validate
         cleaned = self._clean_text(text)
@@ -370,6 +471,28 @@ class ArticleLoader:
 
         return cleaned
 
+    async def _read_body(self, response: httpx.Response) -> bytes:
+        """Read a streamed response body up to max_response_bytes.
+
+        Stops reading once the cap is reached so oversized pages are never
+        fully downloaded; lxml parses the truncated HTML leniently.
+
+        Args:
+            response: Streaming response whose body has not been read.
+
+        Returns:
+            Body bytes, truncated to roughly max_response_bytes.
+        """
+        chunks: list[bytes] = []
+        received = 0
+        async for chunk in response.aiter_bytes(_STREAM_CHUNK_SIZE):
+            chunks.append(chunk)
+            received += len(chunk)
+            if received >= self.max_response_bytes:
+                logger.debug("Response from %s exceeded %d bytes", response.url, received)
+                break
+        return b"".join(chunks)
+
     async def _fetch_content(self, url: str) -> tuple[str | None, str | None]:
         """Fetch and extract content from URL.
 
@@ -383,21 +506,29 @@ class ArticleLoader:
 
         @retry(
             stop=stop_after_attempt(self.max_retries),
-            wait=wait_exponential(multiplier=1, min=1, max=10),
+            # Full jitter keeps concurrent fetches that hit the same
+            # transient failure from retrying in lock-step
+            wait=wait_random_exponential(multiplier=1, min=1, max=10),
             retry=retry_if_exception_type((httpx.TimeoutException, httpx.TransportError)),
             reraise=True,
         )
-        async def _do_fetch() -> httpx.Response:
+        async def _do_fetch() -> tuple[bytes, str | None] | None:
             client = self._get_client()
             semaphore = self._get_semaphore()
 
-            async with semaphore:
-                response = await client.get(url)
+            async with semaphore, client.stream("GET", url) as response:
                 response.raise_for_status()
-                return response
+
+                # Check content type before draining the body
+                content_type = response.headers.get("content-type", "")
+                if "text/html" not in content_type and "application/xhtml" not in content_type:
+                    logger.debug("Non-HTML content type for %s: %s", url, content_type)
+                    return None
+
+                return await self._read_body(response), response.charset_encoding
 
         try:
-            response = await _do_fetch()
+            fetched = await _do_fetch()
         except httpx.TimeoutException:
             logger.warning("Timeout fetching %s", url)
             return None, "Request timed out"
@@ -408,20 +539,42 @@ class ArticleLoader:
             logger.warning("Transport error fetching %s: %s", url, e)
             return None, f"Transport error: {e}"
 
-        # Check content type
-        content_type = response.headers.get("content-type", "")
-        if "text/html" not in content_type and "application/xhtml" not in content_type:
-            logger.debug("Non-HTML content type for %s: %s", url, content_type)
+        if fetched is None:
             return None, None  # Empty content, not an error
 
-        # Extract content from HTML
-        content = self._extract_content_from_html(response.text)
+        # Extract content from the raw bytes; lxml decodes them itself. Parse
+        # in a worker thread: lxml releases the GIL while parsing, so other
+        # fetches keep running (compiled XPaths lock per evaluation)
+        body, encoding = fetched
+        content = await asyncio.to_thread(self._extract_content_from_html, body, encoding)
 
         if content:
             content = self._truncate_content(content)
 
         return content, None
 
+    def _base_article(self, story: Story, domain: str | None) -> Article:
+        """Build the Article fields shared by every extraction outcome.
+
+        Args:
+            story: Story object from HN API.
+            domain: Domain extracted from the story URL, if any.
+
+        Returns:
+            Validated Article carrying only the story's HN fields.
+        """
+        return Article(
+            story_id=story.id,
+            title=story.title,
+            url=story.url,
+            hn_url=story.hn_url,
+            hn_score=story.score,
+            hn_comments=story.descendants or 0,
+            author=story.by,
+            domain=domain,
+            hn_text=story.text,
+        )
+
     async def extract_article(self, story: Story) -> Article:
         """Extract article content from a story.
 
@@ -434,37 +587,32 @@ class ArticleLoader:
         Returns:
             Article with extracted content or appropriate status.
         """
-        # Create base article from story
-        base_article: dict[str, Any] = {
-            "story_id": story.id,
-            "title": story.title,
-            "url": story.url,
-            "hn_url": story.hn_url,
-            "hn_score": story.score,
-            "hn_comments": story.descendants or 0,
-            "author": story.by,
-            "domain": self.extract_domain(story.url) if story.url else None,
-            "hn_text": story.text,
-        }
+        # Parse the domain once; the skip check below reuses it
+        domain = self.extract_domain(story.url) if story.url else None
+
+        # Validate the story fields once; each outcome copies in its own fields
+        base_article = self._base_article(story, domain)
 
         # Handle stories without external URL (Ask HN, Jobs)
         if not story.url:
             logger.debug("Story %d has no external URL", story.id)
-            return Article(
-                **base_article,
-                status=ExtractionStatus.NO_URL,
-                content=None,
-                word_count=len(story.text.split()) if story.text else 0,
+            return base_article.model_copy(
+                update={
+                    "status": ExtractionStatus.NO_URL,
+                    "content": None,
+                    "word_count": len(story.text.split()) if story.text else 0,
+                }
             )
 
         # Check if URL should be skipped
-        should_skip, reason = self.should_skip_url(story.url)
+        should_skip, reason = self.should_skip_url(story.url, domain)
         if should_skip:
             logger.debug("Skipping story %d: %s", story.id, reason)
-            return Article(
-                **base_article,
-                status=ExtractionStatus.SKIPPED,
-                error_message=reason,
+            return base_article.model_copy(
+                update={
+                    "status": ExtractionStatus.SKIPPED,
+                    "error_message": reason,
+                }
             )
 
         # Fetch and extract content
@@ -473,43 +621,50 @@ class ArticleLoader:
             content, fetch_error = await self._fetch_content(story.url)
         except Exception as e:
             logger.warning("Failed to extract story %d: %s", story.id, e)
-            return Article(
-                **base_article,
-                status=ExtractionStatus.FAILED,
-                error_message=str(e),
+            return base_article.model_copy(
+                update={
+                    "status": ExtractionStatus.FAILED,
+                    "error_message": str(e),
+                }
             )
 
         # Handle fetch errors (network, HTTP errors)
         if fetch_error:
             logger.debug("Fetch error for story %d: %s", story.id, fetch_error)
-            return Article(
-                **base_article,
-                status=ExtractionStatus.FAILED,
-                error_message=fetch_error,
+            return base_article.model_copy(
+                update={
+                    "status": ExtractionStatus.FAILED,
+                    "error_message": fetch_error,
+                }
             )
 
         # Handle empty content (page loaded but no content extracted)
         if not content:
             logger.debug("No content extracted from story %d", story.id)
-            return Article(
-                **base_article,
-                status=ExtractionStatus.EMPTY,
-                error_message="No content could be extracted",
+            return base_article.model_copy(
+                update={
+                    "status": ExtractionStatus.EMPTY,
+                    "error_message": "No content could be extracted",
+                }
             )
 
-        # Success
-        word_count = len(content.split())
+        # Success; _clean_text leaves exactly one space between words, so
+        # counting spaces gives the word count without building a list
+        word_count = content.count(" ") + 1
         logger.debug("Extracted %d words from story %d", word_count, story.id)
-        return Article(
-            **base_article,
-            status=ExtractionStatus.SUCCESS,
-            content=content,
-            word_count=word_count,
+        return base_article.model_copy(
+            update={
+                "status": ExtractionStatus.SUCCESS,
+                "content": content,
+                "word_count": word_count,
+            }
         )
 
     async def extract_articles(self, stories: Sequence[Story]) -> list[Article]:
         """Extract articles from multiple stories in parallel.
 
+        Stories are dispatched in waves of ``max_concurrent * 2`` tasks.
+
         Args:
             stories: Sequence of Story objects to extract.
 
@@ -521,52 +676,49 @@ class ArticleLoader:
 
         logger.info("Extracting %d articles", len(stories))
 
-        # Create extraction tasks
-        tasks = [self.extract_article(story) for story in stories]
-
-        # Execute in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results
-        articles: list[Article] = []
-        for i, result in enumerate(results):
-            if isinstance(result, BaseException):
+        async def _extract_indexed(index: int, story: Story) -> tuple[int, Article]:
+            try:
+                return index, await self.extract_article(story)
+            except Exception as e:
                 # Create failed article for exceptions
-                story = stories[i]
-                logger.warning("Exception extracting story %d: %s", story.id, result)
-                articles.append(
-                    Article(
-                        story_id=story.id,
-                        title=story.title,
-                        url=story.url,
-                        hn_url=story.hn_url,
-                        hn_score=story.score,
-                        hn_comments=story.descendants or 0,
-                        author=story.by,
-                        domain=self.extract_domain(story.url) if story.url else None,
-                        hn_text=story.text,
-                        status=ExtractionStatus.FAILED,
-                        error_message=str(result),
-                    )
+                logger.warning("Exception extracting story %d: %s", story.id, e)
+                domain = self.extract_domain(story.url) if story.url else None
+                return index, self._base_article(story, domain).model_copy(
+                    update={"status": ExtractionStatus.FAILED, "error_message": str(e)}
                 )
-            else:
-                articles.append(result)
 
-        # Log summary
-        success = sum(1 for a in articles if a.status == ExtractionStatus.SUCCESS)
-        skipped = sum(1 for a in articles if a.status == ExtractionStatus.SKIPPED)
-        failed = sum(1 for a in articles if a.status == ExtractionStatus.FAILED)
-        no_url = sum(1 for a in articles if a.status == ExtractionStatus.NO_URL)
-        empty = sum(1 for a in articles if a.status == ExtractionStatus.EMPTY)
+        # Dispatch in waves of max_concurrent*2 so only a bounded number of
+        # tasks exist at once. Within a wave, results are collected as they
+        # complete and slotted into their input position. The TaskGroup
+        # cancels whatever is still running if the caller is cancelled.
+        slots: list[Article | None] = [None] * len(stories)
+        wave_size = self.max_concurrent * 2
+        completed = 0
+        for start in range(0, len(stories), wave_size):
+            async with asyncio.TaskGroup() as group:
+                tasks = [
+                    group.create_task(_extract_indexed(i, stories[i]))
+                    for i in range(start, min(start + wave_size, len(stories)))
+                ]
+                for next_done in asyncio.as_completed(tasks):
+                    index, article = await next_done
+                    slots[index] = article
+                    completed += 1
+                    logger.debug("Extracted %d/%d articles", completed, len(stories))
+
+        articles = [article for article in slots if article is not None]
+
+        # Log summary (one pass over the statuses)
+        counts = Counter(a.status for a in articles)
 
         logger.info(
             "Extracted %d articles: %d success, %d skipped, %d failed, %d no_url, %d empty",
             len(articles),
-            success,
-            skipped,
-            failed,
-            no_url,
-            empty,
+            counts[ExtractionStatus.SUCCESS],
+            counts[ExtractionStatus.SKIPPED],
+            counts[ExtractionStatus.FAILED],
+            counts[ExtractionStatus.NO_URL],
+            counts[ExtractionStatus.EMPTY],
         )
 
         return articles
@@ -74,6 +74,20 @@ class ScoringService:
             ValueError: If weights are negative or sum > 1.
         """
         self.profile = profile
+
+        # Tag sets for C-level intersection against each article's tags
+        # (profile tags are already lowercased and deduplicated)
+        self._interest_set = frozenset(profile.interest_tags)
+        self._disinterest_set = frozenset(profile.disinterest_tags)
+
+        # Validated once; each article gets its own copy (see _neutral_relevance)
+        self._no_preferences_relevance = RelevanceScore(
+            score=self.NEUTRAL_SCORE,
+            reason="No preferences configured",
+            matched_interest_tags=[],
+            matched_disinterest_tags=[],
+        )
+
         self.relevance_weight = (
             relevance_weight if relevance_weight is not None else self.RELEVANCE_WEIGHT
         )
@@ -105,28 +119,41 @@ class ScoringService:
         Returns:
             ScoredArticle with relevance and final scores.
         """
-        # Get article tech tags (empty list if no summary)
-        article_tags = article.display_tags
+        popularity_score = self._normalize_popularity(article.article.hn_score, all_hn_scores)
+        return self._combine_scores(article, popularity_score)
+
+    def _combine_scores(
+        self,
+        article: SummarizedArticle,
+        popularity_score: float,
+    ) -> ScoredArticle:
+        """Combine tag relevance with a normalized popularity score.
 
-        # Calculate relevance score
-        relevance = self._calculate_relevance(article_tags)
+        Args:
+            article: SummarizedArticle to score.
+            popularity_score: Article's normalized HN popularity (0-1).
 
-        # Normalize HN popularity
-        hn_score = article.article.hn_score
-        popularity_score = self._normalize_popularity(hn_score, all_hn_scores)
+        Returns:
+            ScoredArticle with relevance and final scores.
+        """
+        # Calculate relevance score from the article's tech tags
+        relevance = self._calculate_relevance(article.display_tags)
 
         # Compute composite final score
         final_score = (
             self.relevance_weight * relevance.score + self.popularity_weight * popularity_score
         )
 
-        logger.debug(
-            "Scored article %d: relevance=%.2f, popularity=%.2f, final=%.2f",
-            article.article.story_id,
-            relevance.score,
-            popularity_score,
-            final_score,
-        )
+        # Guarded: this runs once per article, and the attribute lookups and
+        # argument packing would otherwise be paid even with DEBUG off
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Scored article %d: relevance=%.2f, popularity=%.2f, final=%.2f",
+                article.article.story_id,
+                relevance.score,
+                popularity_score,
+                final_score,
+            )
 
         return ScoredArticle(
             article=article,
@@ -156,11 +183,14 @@ class ScoringService:
         if not articles:
             return []
 
-        # Collect all HN scores for relative normalization
-        all_hn_scores = [a.article.hn_score for a in articles]
+        # Normalize all HN scores against the batch in a single pass
+        popularity_scores = self._normalize_batch_popularity([a.article.hn_score for a in articles])
 
         # Score all articles
-        scored = [self.score_article(a, all_hn_scores) for a in articles]
+        scored = [
+            self._combine_scores(a, popularity)
+            for a, popularity in zip(articles, popularity_scores, strict=True)
+        ]
 
         # Filter by minimum score if requested
         if filter_below_min and self.profile.min_score > 0:
@@ -178,6 +208,16 @@ class ScoringService:
 
         return scored
 
+    def _neutral_relevance(self) -> RelevanceScore:
+        """Relevance for a profile with no preferences.
+
+        Copied from a template validated once per service, with fresh tag
+        lists, so scored articles never share mutable state.
+        """
+        return self._no_preferences_relevance.model_copy(
+            update={"matched_interest_tags": [], "matched_disinterest_tags": []}
+        )
+
     def _calculate_relevance(
         self,
         article_tags: list[str],
@@ -196,6 +236,11 @@ class ScoringService:
         Returns:
             RelevanceScore with score, reason, and matched tags.
         """
+        # Handle empty profile first, so untagged articles report it too
+        # and tag matching is skipped entirely
+        if not self.profile.has_preferences:
+            return self._neutral_relevance()
+
         # Handle empty tags
         if not article_tags:
             return RelevanceScore(
@@ -205,23 +250,16 @@ class ScoringService:
                 matched_disinterest_tags=[],
             )
 
-        # Handle empty profile
-        if not self.profile.has_preferences:
-            return RelevanceScore(
-                score=self.NEUTRAL_SCORE,
-                reason="No preferences configured",
-                matched_interest_tags=[],
-                matched_disinterest_tags=[],
-            )
-
         # Normalize article tags for matching
         normalized_tags = {tag.lower() for tag in article_tags}
 
-        # Find matches
-        matched_interest = [tag for tag in self.profile.interest_tags if tag in normalized_tags]
-        matched_disinterest = [
-            tag for tag in self.profile.disinterest_tags if tag in normalized_tags
-        ]
+        # Find matches, listed in profile order for a stable reason string
+        matched_interest = self._ordered_matches(
+            self.profile.interest_tags, self._interest_set & normalized_tags
+        )
+        matched_disinterest = self._ordered_matches(
+            self.profile.disinterest_tags, self._disinterest_set & normalized_tags
+        )
 
         # Calculate score based on matches
         if matched_disinterest:
@@ -229,7 +267,7 @@ class ScoringService:
             score = self.DISINTEREST_PENALTY_SCORE
         elif matched_interest:
             # Boost based on proportion of interest tags matched
-            match_ratio = len(matched_interest) / len(self.profile.interest_tags)
+            match_ratio = len(matched_interest) / len(self._interest_set)
             # Scale to 0.5-1.0 range
             score = self.NEUTRAL_SCORE + (match_ratio * 0.5)
         else:
@@ -245,6 +283,21 @@ class ScoringService:
             matched_disinterest_tags=matched_disinterest,
         )
 
+    @staticmethod
+    def _ordered_matches(profile_tags: list[str], matched: frozenset[str]) -> list[str]:
+        """List matched tags in the order the profile declares them.
+
+        Args:
+            profile_tags: Interest or disinterest tags from the profile.
+            matched: Intersection of those tags with the article's tags.
+
+        Returns:
+            Matched tags in profile order (empty without scanning if none).
+        """
+        if not matched:
+            return []
+        return [tag for tag in profile_tags if tag in matched]
+
     def _normalize_popularity(
         self,
         hn_score: int,
@@ -274,6 +327,28 @@ class ScoringService:
         # Absolute normalization using MAX_HN_SCORE cap
         return min(hn_score / self.MAX_HN_SCORE, 1.0)
 
+    def _normalize_batch_popularity(self, hn_scores: list[int]) -> list[float]:
+        """Normalize a batch of HN scores to the 0-1 range.
+
+        Equivalent to calling _normalize_popularity for each score against
+        the whole batch, but finds the batch min and max once.
+
+        Args:
+            hn_scores: HN upvote scores for every article in the batch.
+
+        Returns:
+            Normalized popularity scores (0-1), in input order.
+        """
+        if len(hn_scores) <= 1:
+            return [self._normalize_popularity(score) for score in hn_scores]
+
+        min_score = min(hn_scores)
+        score_span = max(hn_scores) - min_score
+        if not score_span:
+            # All same score - return neutral
+            return [0.5] * len(hn_scores)
+        return [(score - min_score) / score_span for score in hn_scores]
+
     def _generate_reason(
         self,
         matched_interest: list[str],
@@ -454,9 +454,9 @@ def mock_scoring_service():
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_client():
-    """Create FastAPI test client.
+    """Create FastAPI test client, shared across the session.
 
     Returns:
         TestClient for API testing.
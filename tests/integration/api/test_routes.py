@@ -7,7 +7,8 @@ LangGraph pipeline execution, and response formatting.
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi import status
@@ -21,14 +22,20 @@ from hn_herald.models.scoring import RelevanceScore, ScoredArticle
 from hn_herald.models.story import Story, StoryType
 from hn_herald.models.summary import ArticleSummary, SummarizationStatus, SummarizedArticle
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def client() -> TestClient:
-    """Create FastAPI test client."""
+    """Create FastAPI test client, shared by every test in this module."""
     return TestClient(app)
 
 
-@pytest.fixture
+# Sample models are only read by these tests, so each is validated once per module
+
+
+@pytest.fixture(scope="module")
 def sample_profile() -> UserProfile:
     """Sample user profile for testing."""
     return UserProfile(
@@ -41,7 +48,7 @@ def sample_profile() -> UserProfile:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_story() -> Story:
     """Sample HN story for testing."""
     return Story(
@@ -54,7 +61,7 @@ def sample_story() -> Story:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_article(sample_story: Story) -> Article:
     """Sample article for testing."""
     return Article(
@@ -69,7 +76,7 @@ def sample_article(sample_story: Story) -> Article:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_summarized_article(sample_article: Article) -> SummarizedArticle:
     """Sample summarized article for testing."""
     summary_data = ArticleSummary(
@@ -84,7 +91,7 @@ def sample_summarized_article(sample_article: Article) -> SummarizedArticle:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_scored_article(sample_summarized_article: SummarizedArticle) -> ScoredArticle:
     """Sample scored article for testing."""
     relevance = RelevanceScore(
@@ -101,7 +108,7 @@ def sample_scored_article(sample_summarized_article: SummarizedArticle) -> Score
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_digest(sample_scored_article: ScoredArticle) -> Digest:
     """Sample digest for testing."""
     return Digest(
@@ -117,6 +124,27 @@ def sample_digest(sample_scored_article: ScoredArticle) -> Digest:
     )
 
 
+@pytest.fixture(scope="module")
+def digest_state(sample_digest: Digest) -> dict[str, Any]:
+    """Final pipeline state carrying sample_digest, dumped once per module."""
+    return {
+        "digest": sample_digest.model_dump(),
+        "articles": [],
+        "summarized_articles": [],
+        "scored_articles": [],
+        "errors": [],
+    }
+
+
+@pytest.fixture
+def mock_graph(digest_state: dict[str, Any]) -> Iterator[AsyncMock]:
+    """Patch create_hn_graph with a graph whose ainvoke returns digest_state."""
+    graph = AsyncMock()
+    graph.ainvoke = AsyncMock(return_value=digest_state)
+    with patch("hn_herald.api.routes.create_hn_graph", return_value=graph):
+        yield graph
+
+
 class TestHealthEndpoint:
     """Tests for the health check endpoint."""
 
@@ -168,55 +196,25 @@ class TestGenerateEndpoint:
 
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
-    @patch("hn_herald.api.routes.create_hn_graph")
+    @pytest.mark.usefixtures("mock_graph")
     async def test_generate_success(
         self,
-        mock_create_graph: MagicMock,
         client: TestClient,
         sample_profile: UserProfile,
-        sample_digest: Digest,
     ) -> None:
         """Test successful digest generation."""
-        # Mock graph execution
-        mock_graph = AsyncMock()
-        mock_graph.ainvoke = AsyncMock(
-            return_value={
-                "digest": sample_digest.model_dump(),
-                "articles": [],
-                "summarized_articles": [],
-                "scored_articles": [],
-                "errors": [],
-            }
-        )
-        mock_create_graph.return_value = mock_graph
-
         request_body = {"profile": sample_profile.model_dump()}
         response = client.post("/api/v1/digest", json=request_body)
 
         assert response.status_code == status.HTTP_200_OK
 
-    @patch("hn_herald.api.routes.create_hn_graph")
+    @pytest.mark.usefixtures("mock_graph")
     async def test_generate_response_format(
         self,
-        mock_create_graph: MagicMock,
         client: TestClient,
         sample_profile: UserProfile,
-        sample_digest: Digest,
     ) -> None:
         """Test that response has correct format."""
-        # Mock graph execution
-        mock_graph = AsyncMock()
-        mock_graph.ainvoke = AsyncMock(
-            return_value={
-                "digest": sample_digest.model_dump(),
-                "articles": [],
-                "summarized_articles": [],
-                "scored_articles": [],
-                "errors": [],
-            }
-        )
-        mock_create_graph.return_value = mock_graph
-
         request_body = {"profile": sample_profile.model_dump()}
         response = client.post("/api/v1/digest", json=request_body)
         data = response.json()
@@ -228,28 +226,13 @@ class TestGenerateEndpoint:
         assert isinstance(data["articles"], list)
         assert isinstance(data["stats"], dict)
 
-    @patch("hn_herald.api.routes.create_hn_graph")
+    @pytest.mark.usefixtures("mock_graph")
     async def test_generate_includes_stats(
         self,
-        mock_create_graph: MagicMock,
         client: TestClient,
         sample_profile: UserProfile,
-        sample_digest: Digest,
     ) -> None:
         """Test that response includes generation statistics."""
-        # Mock graph execution
-        mock_graph = AsyncMock()
-        mock_graph.ainvoke = AsyncMock(
-            return_value={
-                "digest": sample_digest.model_dump(),
-                "articles": [],
-                "summarized_articles": [],
-                "scored_articles": [],
-                "errors": [],
-            }
-        )
-        mock_create_graph.return_value = mock_graph
-
         request_body = {"profile": sample_profile.model_dump()}
         response = client.post("/api/v1/digest", json=request_body)
         data = response.json()
@@ -263,28 +246,13 @@ class TestGenerateEndpoint:
         assert "errors" in stats
         assert "generation_time_ms" in stats
 
-    @patch("hn_herald.api.routes.create_hn_graph")
+    @pytest.mark.usefixtures("mock_graph")
     async def test_generate_includes_profile_summary(
         self,
-        mock_create_graph: MagicMock,
         client: TestClient,
         sample_profile: UserProfile,
-        sample_digest: Digest,
     ) -> None:
         """Test that response includes profile summary."""
-        # Mock graph execution
-        mock_graph = AsyncMock()
-        mock_graph.ainvoke = AsyncMock(
-            return_value={
-                "digest": sample_digest.model_dump(),
-                "articles": [],
-                "summarized_articles": [],
-                "scored_articles": [],
-                "errors": [],
-            }
-        )
-        mock_create_graph.return_value = mock_graph
-
         request_body = {"profile": sample_profile.model_dump()}
         response = client.post("/api/v1/digest", json=request_body)
         data = response.json()
@@ -295,70 +263,41 @@ class TestGenerateEndpoint:
         assert "min_score" in profile_summary
         assert "max_articles" in profile_summary
 
-    @patch("hn_herald.api.routes.create_hn_graph")
     async def test_generate_handles_pipeline_failure(
         self,
-        mock_create_graph: MagicMock,
+        mock_graph: AsyncMock,
         client: TestClient,
         sample_profile: UserProfile,
     ) -> None:
         """Test that pipeline failures return 500 error."""
-        # Mock graph execution failure
-        mock_graph = AsyncMock()
-        mock_graph.ainvoke = AsyncMock(side_effect=Exception("Pipeline failed"))
-        mock_create_graph.return_value = mock_graph
+        mock_graph.ainvoke.side_effect = Exception("Pipeline failed")
 
         request_body = {"profile": sample_profile.model_dump()}
         response = client.post("/api/v1/digest", json=request_body)
 
         assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
 
-    @patch("hn_herald.api.routes.create_hn_graph")
     async def test_generate_handles_missing_digest(
         self,
-        mock_create_graph: MagicMock,
+        mock_graph: AsyncMock,
         client: TestClient,
         sample_profile: UserProfile,
     ) -> None:
         """Test that missing digest in state returns 500 error."""
-        # Mock graph execution with missing digest
-        mock_graph = AsyncMock()
-        mock_graph.ainvoke = AsyncMock(
-            return_value={
-                "articles": [],
-                "errors": [],
-                # Missing "digest" key
-            }
-        )
-        mock_create_graph.return_value = mock_graph
+        mock_graph.ainvoke.return_value = {"articles": [], "errors": []}
 
         request_body = {"profile": sample_profile.model_dump()}
         response = client.post("/api/v1/digest", json=request_body)
 
         assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
 
-    @patch("hn_herald.api.routes.create_hn_graph")
+    @pytest.mark.usefixtures("mock_graph")
     async def test_generate_article_response_fields(
         self,
-        mock_create_graph: MagicMock,
         client: TestClient,
         sample_profile: UserProfile,
-        sample_digest: Digest,
     ) -> None:
         """Test that article responses contain all required fields."""
-        # Mock graph execution
-        mock_graph = AsyncMock()
-        mock_graph.ainvoke = AsyncMock(
-            return_value={
-                "digest": sample_digest.model_dump(),
-                "articles": [],
-                "summarized_articles": [],
-                "scored_articles": [],
-                "errors": [],
-            }
-        )
-        mock_create_graph.return_value = mock_graph
-
         request_body = {"profile": sample_profile.model_dump()}
         response = client.post("/api/v1/digest", json=request_body)
         data = response.json()
@@ -0,0 +1,21 @@
+"""Shared fixtures for HN Herald integration tests."""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run integration tests on uvloop where uvicorn[standard] installs it.
+
+    Scoped to the integration suite so unit tests keep the default loop.
+
+    Returns:
+        uvloop's event loop policy, or the asyncio default where it is unavailable.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
@@ -0,0 +1,246 @@
+"""Shared fixtures for LangGraph pipeline integration tests.
+
+Provides the compiled graph, initial pipeline state, stand-ins for the
+services each graph node instantiates, and patching of those services.
+"""
+
+import importlib
+from contextlib import ExitStack, contextmanager
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from hn_herald.graph.graph import create_hn_graph
+from hn_herald.models.article import Article, ExtractionStatus
+from hn_herald.models.scoring import RelevanceScore, ScoredArticle
+from hn_herald.models.summary import (
+    ArticleSummary,
+    SummarizationStatus,
+    SummarizedArticle,
+)
+
+# Node modules and the service class each one instantiates, resolved once so
+# patch.object skips the per-test import walk of a patch() target string.
+# import_module is needed because hn_herald.graph.nodes re-exports functions
+# under the module names (fetch_hn, summarize, ...).
+_SERVICE_TARGETS = (
+    (importlib.import_module("hn_herald.graph.nodes.fetch_hn"), "HNClient"),
+    (importlib.import_module("hn_herald.graph.nodes.fetch_article"), "ArticleLoader"),
+    (importlib.import_module("hn_herald.graph.nodes.summarize"), "LLMService"),
+    (importlib.import_module("hn_herald.graph.nodes.score"), "ScoringService"),
+)
+
+# Summary and relevance shared by every article the stand-in services produce.
+# The pipeline only reads them, so one validated instance of each is enough.
+_SUMMARY = ArticleSummary(
+    summary="This is a valid summary text",
+    key_points=["Key point"],
+    tech_tags=["python"],
+)
+_RELEVANCE = RelevanceScore(
+    score=0.8,
+    reason="Matches interests: python",
+    matched_interest_tags=["python"],
+    matched_disinterest_tags=[],
+)
+
+
+def _extract_article(story):
+    """Extract story into a successful one-word article."""
+    return Article(
+        story_id=story.id,
+        title=story.title,
+        url=story.url,
+        hn_url=f"https://news.ycombinator.com/item?id={story.id}",
+        hn_score=story.score,
+        author=story.by,
+        content="Content",
+        word_count=1,
+        status=ExtractionStatus.SUCCESS,
+    )
+
+
+def _summarize_article(article, error):
+    """Summarize article, or record a failed summary when error is set."""
+    if error:
+        return SummarizedArticle(
+            article=article,
+            summarization_status=SummarizationStatus.API_ERROR,
+            error_message=error,
+        )
+    return SummarizedArticle(
+        article=article,
+        summary_data=_SUMMARY,
+        summarization_status=SummarizationStatus.SUCCESS,
+    )
+
+
+def _score_articles(summarized, filter_below_min=False):  # noqa: FBT002
+    """Score every summarized article with a summary as a python match."""
+    return [
+        ScoredArticle(
+            article=summ,
+            relevance=_RELEVANCE,
+            popularity_score=0.6,
+            final_score=0.74,
+        )
+        for summ in summarized
+        if summ.has_summary
+    ]
+
+
+class _AsyncService(SimpleNamespace):
+    """Namespace that doubles as an async context manager yielding itself."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+def _mock_services(
+    stories,
+    *,
+    extraction_error=None,
+    summarization_error=None,
+    score_articles=_score_articles,
+):
+    """Build stand-ins for HNClient, ArticleLoader, LLMService and ScoringService.
+
+    The services are plain namespaces rather than mocks: the graph tests
+    never inspect calls, so Mock's per-call bookkeeping would be wasted.
+
+    Args:
+        stories: Stories returned by HNClient.fetch_stories.
+        extraction_error: Maps a story to the message extract_article raises
+            for it, or None to extract it successfully.
+        summarization_error: Maps an article to the error message of its
+            failed summary, or None to summarize it successfully.
+        score_articles: Implementation of ScoringService.score_articles.
+
+    Returns:
+        The four services, in the order patch_services takes them.
+    """
+
+    async def fetch_stories(*_args, **_kwargs):
+        return stories
+
+    async def extract_article(story):
+        if extraction_error and (message := extraction_error(story)):
+            raise Exception(message)
+        return _extract_article(story)
+
+    def summarize_articles_batch(articles):
+        return [
+            _summarize_article(article, summarization_error and summarization_error(article))
+            for article in articles
+        ]
+
+    return (
+        _AsyncService(fetch_stories=fetch_stories),
+        _AsyncService(extract_article=extract_article),
+        SimpleNamespace(summarize_articles_batch=summarize_articles_batch),
+        SimpleNamespace(score_articles=score_articles),
+    )
+
+
+@contextmanager
+def _patched_services(hn_client, article_loader, llm_service, scoring_service):
+    """Patch the services the graph nodes instantiate with the given mocks."""
+    services = (hn_client, article_loader, llm_service, scoring_service)
+    with ExitStack() as stack:
+        for (module, name), service in zip(_SERVICE_TARGETS, services, strict=True):
+            stack.enter_context(patch.object(module, name, return_value=service))
+        yield
+
+
+def _initial_state(profile):
+    """Build the empty pipeline state the graph is invoked with.
+
+    Every call returns fresh lists and dicts, so nothing a run mutates in
+    place can leak into another test.
+    """
+    return {
+        "profile": profile,
+        "stories": [],
+        "articles": [],
+        "filtered_articles": [],
+        "summarized_articles": [],
+        "scored_articles": [],
+        "ranked_articles": [],
+        "digest": {},
+        "errors": [],
+        "start_time": 0.0,
+    }
+
+
+@pytest.fixture(scope="session")
+def graph():
+    """Compile the digest graph once; it keeps no state between runs.
+
+    Returns:
+        Compiled HN Herald StateGraph.
+    """
+    return create_hn_graph()
+
+
+@pytest.fixture
+def mock_services():
+    """Factory for stand-in services with scripted per-item failures.
+
+    Returns:
+        Callable taking (stories, *, extraction_error, summarization_error,
+        score_articles) and returning the services for patch_services.
+    """
+    return _mock_services
+
+
+@pytest.fixture
+def patch_services():
+    """Context manager factory patching the graph's services.
+
+    Returns:
+        Callable taking (hn_client, article_loader, llm_service, scoring_service).
+    """
+    return _patched_services
+
+
+@pytest.fixture
+def make_initial_state():
+    """Initial state factory for tests that need their own profile.
+
+    Returns:
+        Callable building the empty pipeline state for a profile.
+    """
+    return _initial_state
+
+
+@pytest.fixture
+def initial_state(mock_user_profile):
+    """Fresh pipeline state for the default mock profile.
+
+    Returns:
+        Initial state dict carrying mock_user_profile.
+    """
+    return _initial_state(mock_user_profile)
+
+
+@pytest.fixture
+def patched_services(mock_hn_service, mock_article_loader, mock_llm_service, mock_scoring_service):
+    """Run the graph against the shared mock services from the root conftest."""
+    with _patched_services(
+        mock_hn_service, mock_article_loader, mock_llm_service, mock_scoring_service
+    ):
+        yield
+
+
+@pytest.fixture
+async def ran_graph(graph, initial_state, patched_services):
+    """Final state of one graph run over the shared mock services.
+
+    Returns:
+        State dict returned by graph.ainvoke.
+    """
+    return await graph.ainvoke(initial_state)
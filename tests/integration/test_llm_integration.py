@@ -8,9 +8,11 @@ Run with: pytest -m integration tests/integration/
 
 import pytest
 
+from hn_herald.config import get_settings
 from hn_herald.models.article import Article, ExtractionStatus
 from hn_herald.models.summary import SummarizationStatus
 from hn_herald.services.llm import LLMService
+from hn_herald.services.llm_cache import get_llm_cache
 
 # Mark all tests as slow and integration
 pytestmark = [
@@ -19,9 +21,14 @@ pytestmark = [
 ]
 
 
-@pytest.fixture
-def require_api_key(monkeypatch):
-    """Skip test if no valid API key is available, load from .env file."""
+@pytest.fixture(scope="session")
+def require_api_key():
+    """Skip test if no valid API key is available, load from .env file.
+
+    Session-scoped so the .env file is read once. The key is returned
+    rather than written to os.environ, so later tests keep the conftest
+    dummy key and cannot reach the real API by accident.
+    """
     from pathlib import Path
 
     # Try to load real API key from .env file (bypassing conftest.py defaults)
@@ -37,21 +44,35 @@ def require_api_key(monkeypatch):
     if not api_key or not api_key.startswith("sk-"):
         pytest.skip("No valid ANTHROPIC_API_KEY in .env file")
 
-    # Set the real key in environment for this test
-    monkeypatch.setenv("ANTHROPIC_API_KEY", api_key)
+    return api_key
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def llm_service(require_api_key):
     """Create LLMService instance for integration tests.
 
-    Uses settings from environment, ensuring real API key is used.
-    Depends on require_api_key to skip if no valid key is available.
-    """
-    return LLMService()
-
+    The real API key is only in the environment while the service is
+    built; the service keeps it on its client, and the environment and
+    settings caches are restored straight afterwards. Shared across the
+    session so tests reuse one client and its connection pool.
 
-@pytest.fixture
+    The response cache and the short-content shortcut are disabled
+    explicitly so every article, however short, is answered by the model.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("ANTHROPIC_API_KEY", require_api_key)
+        mp.setenv("LLM_CACHE_TYPE", "none")
+        mp.setenv("LLM_MIN_CONTENT_CHARS", "0")
+        get_settings.cache_clear()
+        get_llm_cache.cache_clear()
+        try:
+            return LLMService()
+        finally:
+            get_settings.cache_clear()
+            get_llm_cache.cache_clear()
+
+
+@pytest.fixture(scope="session")
 def article_with_tech_content():
     """Create an Article with realistic tech content for summarization.
 
@@ -109,7 +130,7 @@ def article_with_tech_content():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def article_with_minimal_content():
     """Create an Article with minimal content.
 
@@ -134,7 +155,7 @@ def article_with_minimal_content():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def article_with_no_content():
     """Create an Article with no content.
 
@@ -156,7 +177,7 @@ def article_with_no_content():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multiple_articles(article_with_tech_content, article_with_minimal_content):
     """Create a list of articles for batch summarization testing.
 
@@ -261,8 +282,12 @@ class TestSummarizeMinimalContent:
         Verifies that even with just a sentence or two, the LLM can
         generate a valid summary structure.
         """
+        calls_before = llm_service.telemetry.calls
         result = llm_service.summarize_article(article_with_minimal_content)
 
+        # The summary must come from the model, not a cache or shortcut
+        assert llm_service.telemetry.calls == calls_before + 1
+
         # Should still succeed with minimal content
         assert result.summary_data is not None, "Should generate summary even for minimal content"
         assert result.summarization_status == SummarizationStatus.SUCCESS, (
@@ -1,8 +1,12 @@
 """Tests for FastAPI API endpoints."""
 
+import json
+
 from fastapi.testclient import TestClient
 
 from hn_herald import __version__
+from hn_herald.main import app, rate_limit_exceeded_handler
+from hn_herald.rate_limit import RateLimitExceededError
 
 
 class TestHealthEndpoint:
@@ -59,3 +63,24 @@ class TestRootEndpoint:
         assert "digest-form" in response.text
         assert "interest-tags" in response.text
         assert "disinterest-tags" in response.text
+
+
+class TestRateLimitExceededHandler:
+    """Tests for the 429 response on a spent rate limit bucket."""
+
+    def test_handler_is_registered(self) -> None:
+        """RateLimitExceededError should be handled by the app."""
+        assert app.exception_handlers[RateLimitExceededError] is rate_limit_exceeded_handler
+
+    async def test_handler_returns_429_with_retry_after(self) -> None:
+        """Handler should return 429 with the error's Retry-After."""
+        exc = RateLimitExceededError("Rate limit exceeded: 30 calls per 60 seconds", 42)
+
+        response = await rate_limit_exceeded_handler(None, exc)  # type: ignore[arg-type]
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "42"
+        assert json.loads(response.body) == {
+            "error": "Rate limit exceeded",
+            "detail": "Rate limit exceeded: 30 calls per 60 seconds",
+        }
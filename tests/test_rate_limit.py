@@ -7,6 +7,8 @@ for protecting upstream API quotas.
 
 import asyncio
 import functools
+import threading
+import time
 from unittest.mock import patch
 
 import pytest
@@ -161,6 +163,40 @@ class TestRateLimitEnforcement:
 
         assert call_count == min(5, CALLS)
 
+    async def test_async_call_over_limit_raises_without_sleeping(self):
+        from hn_herald.rate_limit import CALLS, PERIOD, RateLimitExceededError, rate_limit
+
+        @rate_limit
+        async def limited():
+            return "ok"
+
+        for _ in range(CALLS):
+            await limited()
+
+        with patch("time.sleep") as mock_sleep, pytest.raises(RateLimitExceededError) as exc:
+            await limited()
+
+        mock_sleep.assert_not_called()
+        assert 1 <= exc.value.retry_after <= PERIOD
+
+    async def test_each_async_function_has_its_own_bucket(self):
+        from hn_herald.rate_limit import CALLS, RateLimitExceededError, rate_limit
+
+        @rate_limit
+        async def spent():
+            return "spent"
+
+        @rate_limit
+        async def fresh():
+            return "fresh"
+
+        for _ in range(CALLS):
+            await spent()
+
+        with pytest.raises(RateLimitExceededError):
+            await spent()
+        assert await fresh() == "fresh"
+
     @patch("hn_herald.rate_limit.limits")
     async def test_limits_decorator_applied_with_correct_params(self, mock_limits):
         # We need to reimport after patching to see the patched version
@@ -266,6 +302,8 @@ class TestRateLimitIntegration:
         assert hasattr(rate_limit_module, "rate_limit")
         assert hasattr(rate_limit_module, "CALLS")
         assert hasattr(rate_limit_module, "PERIOD")
+        assert hasattr(rate_limit_module, "AnthropicLimiter")
+        assert hasattr(rate_limit_module, "get_anthropic_limiter")
 
     async def test_decorator_can_be_stacked(self):
         from hn_herald.rate_limit import rate_limit
@@ -388,3 +426,217 @@ class TestRateLimitEdgeCases:
 
         with pytest.raises(asyncio.CancelledError):
             await task
+
+
+class TestAnthropicLimiter:
+    """Tests for the proactive Anthropic request/token limiter."""
+
+    def test_acquire_within_budget_does_not_wait(self):
+        from hn_herald.rate_limit import AnthropicLimiter
+
+        limiter = AnthropicLimiter(requests_per_minute=5, tokens_per_minute=1000)
+
+        with patch("hn_herald.rate_limit.time.sleep") as mock_sleep:
+            for _ in range(5):
+                limiter.acquire(100)
+
+        mock_sleep.assert_not_called()
+
+    def test_acquire_waits_when_request_budget_exhausted(self):
+        from hn_herald.rate_limit import AnthropicLimiter
+
+        limiter = AnthropicLimiter(requests_per_minute=2, tokens_per_minute=1000, window=0.05)
+        limiter.acquire(10)
+        limiter.acquire(10)
+
+        with patch("hn_herald.rate_limit.time.sleep", wraps=time.sleep) as mock_sleep:
+            limiter.acquire(10)
+
+        assert mock_sleep.called
+
+    def test_acquire_waits_when_token_budget_exhausted(self):
+        from hn_herald.rate_limit import AnthropicLimiter
+
+        limiter = AnthropicLimiter(requests_per_minute=100, tokens_per_minute=100, window=0.05)
+        limiter.acquire(80)
+
+        with patch("hn_herald.rate_limit.time.sleep", wraps=time.sleep) as mock_sleep:
+            limiter.acquire(50)
+
+        assert mock_sleep.called
+
+    def test_reconcile_releases_overestimated_tokens(self):
+        from hn_herald.rate_limit import AnthropicLimiter
+
+        limiter = AnthropicLimiter(requests_per_minute=100, tokens_per_minute=100)
+        reservation = limiter.acquire(80)
+        limiter.reconcile(reservation, 20)
+
+        with patch("hn_herald.rate_limit.time.sleep") as mock_sleep:
+            limiter.acquire(50)
+
+        mock_sleep.assert_not_called()
+
+    def test_reconcile_after_window_keeps_token_count_exact(self):
+        from hn_herald.rate_limit import AnthropicLimiter
+
+        limiter = AnthropicLimiter(requests_per_minute=100, tokens_per_minute=100, window=0.01)
+        reservation = limiter.acquire(80)
+        time.sleep(0.02)
+        # Expired but not yet popped: the pop must subtract what was added
+        limiter.reconcile(reservation, 20)
+        limiter.acquire(10)
+
+        assert limiter._tokens_in_window == 10
+
+    def test_release_returns_tokens_but_keeps_request(self):
+        from hn_herald.rate_limit import AnthropicLimiter
+
+        limiter = AnthropicLimiter(requests_per_minute=1, tokens_per_minute=100)
+        reservation = limiter.acquire(80)
+        limiter.release(reservation)
+
+        assert limiter._tokens_in_window == 0
+        assert len(limiter._reservations) == 1
+
+    def test_oversized_request_is_clamped_to_budget(self):
+        from hn_herald.rate_limit import AnthropicLimiter
+
+        limiter = AnthropicLimiter(requests_per_minute=10, tokens_per_minute=100)
+
+        with patch("hn_herald.rate_limit.time.sleep") as mock_sleep:
+            limiter.acquire(10_000)
+
+        mock_sleep.assert_not_called()
+
+    async def test_aacquire_waits_when_budget_exhausted(self):
+        from hn_herald.rate_limit import AnthropicLimiter
+
+        limiter = AnthropicLimiter(requests_per_minute=1, tokens_per_minute=1000, window=0.05)
+        await limiter.aacquire(10)
+
+        start = time.monotonic()
+        await limiter.aacquire(10)
+
+        assert time.monotonic() - start >= 0.04
+
+
+class TestAIMDController:
+    """Tests for the adaptive concurrency controller."""
+
+    def test_seeded_from_anthropic_profile(self):
+        from hn_herald.rate_limit import PROVIDER_PROFILES, AIMDController
+
+        controller = AIMDController.from_profile(PROVIDER_PROFILES["anthropic"])
+
+        assert controller.max_concurrency == 5
+        assert controller.target_latency == 3.0
+        assert controller.limit == 5.0
+
+    async def test_overload_halves_limit_with_floor(self):
+        from hn_herald.rate_limit import AIMDController
+
+        controller = AIMDController(max_concurrency=4, target_latency=1.0)
+        for _ in range(3):
+            await controller.aacquire()
+            controller.release(0.1, overloaded=True)
+
+        assert controller.limit == 1.0
+
+    async def test_fast_completion_increases_limit_up_to_max(self):
+        from hn_herald.rate_limit import AIMDController
+
+        controller = AIMDController(max_concurrency=3, target_latency=1.0)
+        controller.limit = 1.0
+        for _ in range(5):
+            await controller.aacquire()
+            controller.release(0.1)
+
+        assert controller.limit == 3.0
+
+    async def test_slow_completion_holds_limit(self):
+        from hn_herald.rate_limit import AIMDController
+
+        controller = AIMDController(max_concurrency=3, target_latency=1.0)
+        controller.limit = 2.0
+        await controller.aacquire()
+        controller.release(5.0)
+
+        assert controller.limit == 2.0
+        assert controller.latency_ewma == 5.0
+
+    async def test_acquire_blocks_at_limit_until_release(self):
+        from hn_herald.rate_limit import AIMDController
+
+        controller = AIMDController(max_concurrency=1, target_latency=1.0)
+        await controller.aacquire()
+
+        waiter = asyncio.create_task(controller.aacquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        controller.release(0.1)
+        await asyncio.wait_for(waiter, timeout=1)
+        assert controller.in_flight == 1
+
+    def test_shared_across_event_loops(self):
+        from hn_herald.rate_limit import AIMDController
+
+        controller = AIMDController(max_concurrency=1, target_latency=1.0)
+
+        async def run_two() -> None:
+            async def call() -> None:
+                await controller.aacquire()
+                await asyncio.sleep(0)
+                controller.release(0.1)
+
+            await asyncio.gather(call(), call())
+
+        asyncio.run(run_two())
+        asyncio.run(run_two())
+
+        assert controller.in_flight == 0
+
+    def test_threads_block_at_limit_until_release(self):
+        from hn_herald.rate_limit import AIMDController
+
+        controller = AIMDController(max_concurrency=1, target_latency=1.0)
+        controller.acquire()
+
+        waiter = threading.Thread(target=controller.acquire)
+        waiter.start()
+        waiter.join(timeout=0.05)
+        assert waiter.is_alive()
+
+        controller.release(0.1)
+        waiter.join(timeout=1)
+        assert not waiter.is_alive()
+        assert controller.in_flight == 1
+
+    async def test_thread_release_wakes_loop_waiter(self):
+        from hn_herald.rate_limit import AIMDController
+
+        controller = AIMDController(max_concurrency=1, target_latency=1.0)
+        controller.acquire()
+
+        waiter = asyncio.create_task(controller.aacquire())
+        await asyncio.sleep(0)
+        await asyncio.to_thread(controller.release, 0.1)
+
+        await asyncio.wait_for(waiter, timeout=1)
+        assert controller.in_flight == 1
+
+    async def test_cancelled_waiter_does_not_hold_slot(self):
+        from hn_herald.rate_limit import AIMDController
+
+        controller = AIMDController(max_concurrency=1, target_latency=1.0)
+        await controller.aacquire()
+        cancelled = asyncio.create_task(controller.aacquire())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+        controller.release(0.1)
+        await asyncio.wait_for(controller.aacquire(), timeout=1)
+        assert controller.in_flight == 1
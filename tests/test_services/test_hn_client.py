@@ -4,12 +4,16 @@ This module tests the HNClient class for fetching stories from
 the HackerNews Firebase API with mocked HTTP responses.
 """
 
+import logging
+
 import httpx
 import pytest
 import respx
+from pydantic import ValidationError
 
-from hn_herald.models.story import Story, StoryType
+from hn_herald.models.story import DeadItem, Story, StoryType
 from hn_herald.services.hn_client import (
+    _HN_ITEM_ADAPTER,
     HNAPIError,
     HNClient,
     HNClientError,
@@ -301,6 +305,109 @@ class TestFetchStory:
         assert isinstance(result, Story)
         assert result.type == "job"
 
+    @respx.mock
+    async def test_fetch_story_returns_none_for_poll(self, caplog):
+        """Test fetch_story skips polls with a warning even if they have story fields."""
+        # Arrange
+        poll_data = {
+            "id": 12345,
+            "type": "poll",
+            "by": "user",
+            "time": 1234567890,
+            "title": "Poll: Favourite editor?",
+            "score": 42,
+            "parts": [12346, 12347],
+        }
+        respx.get(f"{TEST_BASE_URL}/item/12345.json").mock(
+            return_value=httpx.Response(200, json=poll_data)
+        )
+        caplog.set_level(logging.WARNING)
+
+        # Act
+        async with HNClient(base_url=TEST_BASE_URL) as client:
+            result = await client.fetch_story(12345)
+
+        # Assert
+        assert result is None
+        assert any("type: poll" in record.message for record in caplog.records)
+
+    @respx.mock
+    @pytest.mark.parametrize("body", [b"[]", b'"oops"', b"42"])
+    async def test_fetch_story_returns_none_for_non_object_body(self, body, caplog):
+        """Test fetch_story logs and returns None when the body is not a JSON object."""
+        # Arrange
+        respx.get(f"{TEST_BASE_URL}/item/12345.json").mock(
+            return_value=httpx.Response(200, content=body)
+        )
+        caplog.set_level(logging.ERROR)
+
+        # Act
+        async with HNClient(base_url=TEST_BASE_URL) as client:
+            result = await client.fetch_story(12345)
+
+        # Assert
+        assert result is None
+        assert any("Failed to parse story 12345" in record.message for record in caplog.records)
+
+
+class TestHNItemParsing:
+    """Tests for validating raw item JSON into Story | DeadItem."""
+
+    def test_live_story_parses_as_story(self, sample_story_data):
+        """Test a complete story payload validates as Story."""
+        item = _HN_ITEM_ADAPTER.validate_python(sample_story_data)
+
+        assert isinstance(item, Story)
+
+    @pytest.mark.parametrize("item_type", ["comment", "poll", "pollopt"])
+    def test_non_story_types_parse_as_dead_item(self, item_type):
+        """Test comments and polls fall through to DeadItem."""
+        data = {
+            "id": 12345,
+            "type": item_type,
+            "by": "user",
+            "time": 1234567890,
+            "title": "Has a title",
+            "score": 3,
+        }
+
+        item = _HN_ITEM_ADAPTER.validate_python(data)
+
+        assert isinstance(item, DeadItem)
+        assert item.id == 12345
+        assert item.type == item_type
+
+    def test_deleted_stub_parses_as_dead_item(self, sample_deleted_story_data):
+        """Test a deleted stub without story fields validates as DeadItem."""
+        item = _HN_ITEM_ADAPTER.validate_python(sample_deleted_story_data)
+
+        assert isinstance(item, DeadItem)
+        assert item.deleted is True
+
+    def test_dead_stub_parses_as_dead_item(self):
+        """Test a killed item missing story fields validates as DeadItem."""
+        item = _HN_ITEM_ADAPTER.validate_json(b'{"id": 999, "type": "story", "dead": true}')
+
+        assert isinstance(item, DeadItem)
+        assert item.dead is True
+
+    def test_dead_story_with_full_fields_stays_story(self, sample_dead_story_data):
+        """Test a killed story keeps its Story shape so the dead flag is checked later."""
+        item = _HN_ITEM_ADAPTER.validate_python(sample_dead_story_data)
+
+        assert isinstance(item, Story)
+        assert item.dead is True
+
+    def test_null_body_parses_as_none(self):
+        """Test a JSON null body validates to None rather than raising."""
+        assert _HN_ITEM_ADAPTER.validate_json(b"null") is None
+
+    @pytest.mark.parametrize("body", [b"[]", b'"oops"', b"42", b"true"])
+    def test_non_object_body_raises_validation_error(self, body):
+        """Test a non-object, non-null JSON body raises ValidationError."""
+        with pytest.raises(ValidationError):
+            _HN_ITEM_ADAPTER.validate_json(body)
+
 
 class TestFetchStories:
     """Tests for HNClient.fetch_stories method."""
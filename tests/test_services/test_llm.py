@@ -0,0 +1,1230 @@
+"""Tests for LLMService summarization paths.
+
+This module tests the LLMService without making real API calls. The
+LangChain and Anthropic clients are replaced with mocks so that prompt
+construction, result mapping, and error handling can be verified.
+"""
+
+import asyncio
+import json
+import re
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import anthropic
+import httpx
+import pytest
+from anthropic.types import ToolUseBlock
+from anthropic.types.messages import MessageBatchIndividualResponse
+from langchain_core.messages import AIMessage, AIMessageChunk
+from tenacity import wait_none
+
+from hn_herald.config import get_settings
+from hn_herald.models.article import Article, ExtractionStatus
+from hn_herald.models.summary import (
+    LLMAPIError,
+    LLMParseError,
+    LLMRateLimitError,
+    SummarizationStatus,
+    SummarizedArticle,
+)
+from hn_herald.rate_limit import AIMDController, AnthropicLimiter
+from hn_herald.services.llm import TRUNCATION_MARKER, LLMService, _MicroBatcher
+from hn_herald.services.llm_cache import LLMResponseCache, get_llm_cache
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def llm_service(monkeypatch):
+    """LLMService configured with a dummy API key."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test-key")
+    # Caching disabled so every test reaches the mocked client
+    monkeypatch.setenv("LLM_CACHE_TYPE", "none")
+    # Fixture articles are short; keep them on the LLM path
+    monkeypatch.setenv("LLM_MIN_CONTENT_CHARS", "0")
+    get_settings.cache_clear()
+    get_llm_cache.cache_clear()
+    service = LLMService()
+    # Generous budget so pacing never delays unit tests
+    service._limiter = AnthropicLimiter(requests_per_minute=10_000, tokens_per_minute=10**9)
+    # Fresh controller so adaptive state never leaks between tests
+    service._concurrency = AIMDController(max_concurrency=5, target_latency=3.0)
+    yield service
+    get_settings.cache_clear()
+    get_llm_cache.cache_clear()
+
+
+@pytest.fixture
+def articles() -> list[Article]:
+    """Two articles with content and one without."""
+    return [
+        Article(
+            story_id=1,
+            title="Python Performance",
+            url="https://example.com/python",
+            hn_url="https://news.ycombinator.com/item?id=1",
+            hn_score=100,
+            author="alice",
+            content="Python 3.13 ships a faster interpreter.",
+            status=ExtractionStatus.SUCCESS,
+        ),
+        Article(
+            story_id=2,
+            title="No Content",
+            url="https://example.com/empty",
+            hn_url="https://news.ycombinator.com/item?id=2",
+            hn_score=50,
+            author="bob",
+            status=ExtractionStatus.FAILED,
+        ),
+        Article(
+            story_id=3,
+            title="Rust in the Kernel",
+            url="https://example.com/rust",
+            hn_url="https://news.ycombinator.com/item?id=3",
+            hn_score=200,
+            author="carol",
+            content="Rust drivers are now merged upstream.",
+            status=ExtractionStatus.SUCCESS,
+        ),
+    ]
+
+
+def summary_json(summary: str) -> str:
+    """Serialize a valid ArticleSummary payload."""
+    return json.dumps(
+        {
+            "summary": summary,
+            "key_points": ["Point one", "Point two", "Point three"],
+            "tech_tags": ["Python"],
+        }
+    )
+
+
+TITLE_PATTERN = re.compile(r"\*\*Title\*\*: (.+)")
+
+
+async def respond_to_batch(messages, **kwargs) -> AIMessage:
+    """Answer a batch prompt with one summary per article title, in order.
+
+    Answers through the forced tool call when tools are bound, like the API.
+    """
+    titles = TITLE_PATTERN.findall(messages[0].content)
+    summaries = [json.loads(summary_json(f"A summary about {title}.")) for title in titles]
+    if tools := kwargs.get("tools"):
+        tool_call = {"name": tools[0]["name"], "args": {"summaries": summaries}, "id": "toolu_1"}
+        return AIMessage(content="", tool_calls=[tool_call])
+    return AIMessage(content=json.dumps({"summaries": summaries}))
+
+
+def succeeded(custom_id: str, text: str) -> MessageBatchIndividualResponse:
+    """Build a succeeded Message Batches API result."""
+    return MessageBatchIndividualResponse.model_validate(
+        {
+            "custom_id": custom_id,
+            "result": {
+                "type": "succeeded",
+                "message": {
+                    "id": f"msg_{custom_id}",
+                    "type": "message",
+                    "role": "assistant",
+                    "model": "claude-haiku-4-5-20251001",
+                    "content": [{"type": "text", "text": text}],
+                    "stop_reason": "end_turn",
+                    "stop_sequence": None,
+                    "usage": {"input_tokens": 10, "output_tokens": 20},
+                },
+            },
+        }
+    )
+
+
+def errored(custom_id: str) -> MessageBatchIndividualResponse:
+    """Build an errored Message Batches API result."""
+    return MessageBatchIndividualResponse.model_validate(
+        {
+            "custom_id": custom_id,
+            "result": {
+                "type": "errored",
+                "error": {
+                    "type": "error",
+                    "error": {"type": "overloaded_error", "message": "Overloaded"},
+                },
+            },
+        }
+    )
+
+
+def mock_batch_client(results: list[MessageBatchIndividualResponse]) -> MagicMock:
+    """Create a mock Anthropic client whose batch ends after one poll."""
+    client = MagicMock()
+    client.messages.batches.create.return_value = MagicMock(
+        id="batch_1", processing_status="in_progress"
+    )
+    client.messages.batches.retrieve.return_value = MagicMock(
+        id="batch_1", processing_status="ended"
+    )
+    client.messages.batches.results.return_value = iter(results)
+    return client
+
+
+# =============================================================================
+# Message Batches API Tests
+# =============================================================================
+
+
+class TestSummarizeViaBatchAPI:
+    """Tests for LLMService.summarize_articles_via_batch_api."""
+
+    def test_empty_list_returns_empty(self, llm_service):
+        assert llm_service.summarize_articles_via_batch_api([]) == []
+
+    def test_submits_one_request_per_article_with_content(self, llm_service, articles):
+        client = mock_batch_client([])
+        llm_service._batch_client = client
+
+        llm_service.summarize_articles_via_batch_api(articles, poll_interval=0)
+
+        requests = client.messages.batches.create.call_args.kwargs["requests"]
+        assert [r["custom_id"] for r in requests] == ["story-1-0", "story-3-2"]
+        assert "Python Performance" in requests[0]["params"]["messages"][0]["content"]
+        assert requests[0]["params"]["model"] == llm_service._model
+
+    def test_maps_results_back_in_input_order(self, llm_service, articles):
+        llm_service._batch_client = mock_batch_client(
+            [
+                succeeded("story-3-2", summary_json("A summary about Rust.")),
+                succeeded("story-1-0", summary_json("A summary about Python.")),
+            ]
+        )
+
+        results = llm_service.summarize_articles_via_batch_api(articles, poll_interval=0)
+
+        assert [r.article.story_id for r in results] == [1, 2, 3]
+        assert results[0].summary_data.summary == "A summary about Python."
+        assert results[1].summarization_status == SummarizationStatus.NO_CONTENT
+        assert results[2].summary_data.summary == "A summary about Rust."
+
+    def test_errored_request_is_api_error(self, llm_service, articles):
+        llm_service._batch_client = mock_batch_client(
+            [
+                succeeded("story-1-0", summary_json("A summary about Python.")),
+                errored("story-3-2"),
+            ]
+        )
+
+        results = llm_service.summarize_articles_via_batch_api(articles, poll_interval=0)
+
+        assert results[0].summarization_status == SummarizationStatus.SUCCESS
+        assert results[2].summarization_status == SummarizationStatus.API_ERROR
+        assert "Overloaded" in results[2].error_message
+
+    def test_unparseable_result_is_parse_error(self, llm_service, articles):
+        llm_service._batch_client = mock_batch_client(
+            [
+                succeeded("story-1-0", "not json"),
+                succeeded("story-3-2", summary_json("A summary about Rust.")),
+            ]
+        )
+
+        results = llm_service.summarize_articles_via_batch_api(articles, poll_interval=0)
+
+        assert results[0].summarization_status == SummarizationStatus.PARSE_ERROR
+        assert results[2].summarization_status == SummarizationStatus.SUCCESS
+
+    def test_missing_result_is_parse_error(self, llm_service, articles):
+        llm_service._batch_client = mock_batch_client(
+            [succeeded("story-1-0", summary_json("A summary about Python."))]
+        )
+
+        results = llm_service.summarize_articles_via_batch_api(articles, poll_interval=0)
+
+        assert results[2].summarization_status == SummarizationStatus.PARSE_ERROR
+        assert results[2].error_message == "Missing result in message batch"
+
+    def test_unfinished_batch_is_cancelled_after_max_wait(self, llm_service, articles):
+        client = mock_batch_client([])
+        client.messages.batches.retrieve.return_value = MagicMock(
+            id="batch_1", processing_status="in_progress"
+        )
+        llm_service._batch_client = client
+
+        results = llm_service.summarize_articles_via_batch_api(
+            articles, poll_interval=0, max_wait=0.01
+        )
+
+        client.messages.batches.cancel.assert_called_once_with("batch_1")
+        client.messages.batches.results.assert_not_called()
+        assert results[0].summarization_status == SummarizationStatus.API_ERROR
+        assert results[1].summarization_status == SummarizationStatus.NO_CONTENT
+        assert results[2].summarization_status == SummarizationStatus.API_ERROR
+
+
+# =============================================================================
+# Async Summarization Tests
+# =============================================================================
+
+
+class TestAsyncSummarization:
+    """Tests for LLMService.asummarize_article and asummarize_articles."""
+
+    async def test_asummarize_article_success(self, llm_service, articles):
+        llm_service._client = MagicMock()
+        llm_service._client.ainvoke = AsyncMock(side_effect=respond_to_batch)
+
+        result = await llm_service.asummarize_article(articles[0])
+
+        assert result.summarization_status == SummarizationStatus.SUCCESS
+        assert result.summary_data.summary == "A summary about Python Performance."
+
+    async def test_asummarize_article_no_content_skips_llm(self, llm_service, articles):
+        llm_service._client = MagicMock()
+        llm_service._client.ainvoke = AsyncMock()
+
+        result = await llm_service.asummarize_article(articles[1])
+
+        assert result.summarization_status == SummarizationStatus.NO_CONTENT
+        llm_service._client.ainvoke.assert_not_called()
+
+    async def test_asummarize_article_api_error(self, llm_service, articles):
+        llm_service._client = MagicMock()
+        llm_service._client.ainvoke = AsyncMock(side_effect=RuntimeError("boom"))
+
+        result = await llm_service.asummarize_article(articles[0])
+
+        assert result.summarization_status == SummarizationStatus.API_ERROR
+        assert "boom" in result.error_message
+
+    async def test_asummarize_article_parse_error(self, llm_service, articles):
+        llm_service._client = MagicMock()
+        llm_service._client.ainvoke = AsyncMock(return_value=AIMessage(content="not json"))
+
+        result = await llm_service.asummarize_article(articles[0])
+
+        assert result.summarization_status == SummarizationStatus.PARSE_ERROR
+
+    async def test_asummarize_articles_preserves_order(self, llm_service, articles):
+        llm_service._client = MagicMock()
+        llm_service._client.ainvoke = AsyncMock(side_effect=respond_to_batch)
+
+        results = await llm_service.asummarize_articles(articles)
+
+        assert [r.article.story_id for r in results] == [1, 2, 3]
+        assert results[0].summary_data.summary == "A summary about Python Performance."
+        assert results[1].summarization_status == SummarizationStatus.NO_CONTENT
+        assert results[2].summary_data.summary == "A summary about Rust in the Kernel."
+
+    async def test_asummarize_articles_respects_concurrency(self, llm_service, articles):
+        batch_sizes = []
+
+        async def respond(messages, **kwargs):
+            batch_sizes.append(len(TITLE_PATTERN.findall(messages[0].content)))
+            return await respond_to_batch(messages, **kwargs)
+
+        llm_service._client = MagicMock()
+        llm_service._client.ainvoke = AsyncMock(side_effect=respond)
+
+        results = await llm_service.asummarize_articles(articles * 4, concurrency=2)
+
+        assert max(batch_sizes) <= 2
+        assert sum(batch_sizes) == 8
+        assert all(r.summarization_status != SummarizationStatus.PARSE_ERROR for r in results)
+
+
+# =============================================================================
+# Micro-batching Tests
+# =============================================================================
+
+
+class TestMicroBatching:
+    """Tests for coalescing concurrent asummarize_article calls."""
+
+    async def test_concurrent_calls_share_one_llm_call(self, llm_service, articles):
+        llm_service._client = MagicMock()
+        llm_service._client.ainvoke = AsyncMock(side_effect=respond_to_batch)
+
+        results = await asyncio.gather(
+            llm_service.asummarize_article(articles[0]),
+            llm_service.asummarize_article(articles[2]),
+        )
+
+        assert llm_service._client.ainvoke.await_count == 1
+        assert results[0].summary_data.summary == "A summary about Python Performance."
+        assert results[1].summary_data.summary == "A summary about Rust in the Kernel."
+
+    async def test_full_batch_dispatches_without_waiting(self, llm_service, articles):
+        llm_service._batch_size = 2
+        llm_service._batch_wait_timeout = 60.0
+        llm_service._client = MagicMock()
+        llm_service._client.ainvoke = AsyncMock(side_effect=respond_to_batch)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(llm_service.asummarize_article(articles[0]) for _ in range(4))),
+            timeout=1.0,
+        )
+
+        assert llm_service._client.ainvoke.await_count == 2
+        assert len(results) == 4
+
+    def test_batcher_is_per_event_loop(self, llm_service, articles):
+        llm_service._client = MagicMock()
+        llm_service._client.ainvoke = AsyncMock(side_effect=respond_to_batch)
+
+        llm_service._batch_wait_timeout = 0.05
+
+        async def abandoned() -> None:
+            # Leaves a pending item and flush timer behind on the first loop
+            with pytest.raises(TimeoutError):
+                await asyncio.wait_for(llm_service.asummarize_article(articles[0]), 0.001)
+
+        async def summarize() -> SummarizedArticle:
+            return await asyncio.wait_for(llm_service.asummarize_article(articles[2]), 1.0)
+
+        asyncio.run(abandoned())
+        result = asyncio.run(summarize())
+
+        assert result.summarization_status == SummarizationStatus.SUCCESS
+
+    async def test_handler_exception_reaches_every_caller(self):
+        async def failing_handler(items):
+            raise ValueError("handler failed")
+
+        batcher = _MicroBatcher(failing_handler, max_batch_size=5, wait_timeout=0.01)
+
+        results = await asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True)
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+
+# =============================================================================
+# Rate Limiter Integration Tests
+# =============================================================================
+
+
+class TestLimiterIntegration:
+    """Tests for AnthropicLimiter pacing inside LLMService calls."""
+
+    async def test_acall_reserves_estimate_and_reconciles_usage(self, llm_service, articles):
+        limiter = MagicMock(spec=AnthropicLimiter)
+        limiter.aacquire = AsyncMock(return_value=[0.0, 0.0])
+        llm_service._limiter = limiter
+        llm_service._client = MagicMock()
+        llm_service._client.ainvoke = AsyncMock(
+            return_value=AIMessage(
+                content=json.dumps(
+                    {"summaries": [json.loads(summary_json("A summary about Python."))]}
+                ),
+                usage_metadata={"input_tokens": 300, "output_tokens": 120, "total_tokens": 420},
+            )
+        )
+
+        await llm_service.asummarize_article(articles[0])
+
+        estimated = limiter.aacquire.call_args.args[0]
+        assert estimated > llm_service._max_tokens
+        limiter.reconcile.assert_called_once_with([0.0, 0.0], 420)
+
+    def test_call_without_usage_keeps_estimate(self, llm_service, articles):
+        limiter = MagicMock(spec=AnthropicLimiter)
+        limiter.acquire.return_value = [0.0, 0.0]
+        llm_service._limiter = limiter
+        llm_service._client = MagicMock()
+        llm_service._client.invoke.return_value = AIMessage(
+            content=summary_json("A summary about Python.")
+        )
+
+        llm_service.summarize_article(articles[0])
+
+        limiter.acquire.assert_called_once()
+        limiter.reconcile.assert_not_called()
+
+    def test_failed_call_releases_reservation(self, llm_service, articles):
+        limiter = MagicMock(spec=AnthropicLimiter)
+        limiter.acquire.return_value = [0.0, 0.0]
+        llm_service._limiter = limiter
+        llm_service._client = MagicMock()
+        llm_service._client.invoke.side_effect = status_error(400)
+
+        llm_service.summarize_article(articles[0])
+
+        limiter.release.assert_called_once_with([0.0, 0.0])
+
+
+class TestConcurrencyControl:
+    """Tests for the AIMD controller wrapped around async LLM calls."""
+
+    async def test_rate_limit_halves_concurrency(self, llm_service):
+        llm_service._client = MagicMock()
+        llm_service._client.ainvoke = AsyncMock(side_effect=status_error(429))
+
+        with (
+            patch.object(LLMService._acall_llm.retry, "wait", wait_none()),
+            pytest.raises(LLMRateLimitError),
+        ):
+            await llm_service._acall_llm("prompt")
+
+        # Three attempts: 5 -> 2.5 -> 1.25 -> 1 (floor)
+        assert llm_service._concurrency.limit == 1.0
+        assert llm_service._concurrency.in_flight == 0
+
+    def test_sync_calls_share_the_controller(self, llm_service):
+        llm_service._client = MagicMock()
+        llm_service._client.invoke.side_effect = status_error(429)
+
+        with (
+            patch.object(LLMService._call_llm.retry, "wait", wait_none()),
+            pytest.raises(LLMRateLimitError),
+        ):
+            llm_service._call_llm("prompt")
+
+        assert llm_service._concurrency.limit == 1.0
+        assert llm_service._concurrency.in_flight == 0
+
+    def test_threaded_calls_are_capped_by_controller(self, llm_service, articles):
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+        llm_service._concurrency = AIMDController(max_concurrency=2, target_latency=3.0)
+
+        def respond(messages, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return AIMessage(content=summary_json("A summary about anything."))
+
+        llm_service._client = MagicMock()
+        llm_service._client.invoke.side_effect = respond
+
+        llm_service.summarize_articles_threaded([articles[0]] * 6, max_workers=4)
+
+        assert peak == 2
+
+    async def test_cancelled_while_waiting_for_slot_releases_reservation(self, llm_service):
+        limiter = MagicMock(spec=AnthropicLimiter)
+        limiter.aacquire = AsyncMock(return_value=[0.0, 0.0])
+        llm_service._limiter = limiter
+        llm_service._concurrency = AIMDController(max_concurrency=1, target_latency=3.0)
+        await llm_service._concurrency.aacquire()
+        llm_service._client = MagicMock()
+        llm_service._client.ainvoke = AsyncMock(return_value=AIMessage(content="ok"))
+
+        task = asyncio.create_task(llm_service._acall_llm("prompt"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        limiter.release.assert_called_once_with([0.0, 0.0])
+        llm_service._client.ainvoke.assert_not_called()
+        assert llm_service._concurrency.in_flight == 1
+
+    async def test_stream_cancelled_while_waiting_for_slot_releases_reservation(
+        self, llm_service, articles
+    ):
+        limiter = MagicMock(spec=AnthropicLimiter)
+        limiter.aacquire = AsyncMock(return_value=[0.0, 0.0])
+        llm_service._limiter = limiter
+        llm_service._concurrency = AIMDController(max_concurrency=1, target_latency=3.0)
+        await llm_service._concurrency.aacquire()
+        llm_service._client = MagicMock()
+
+        async def consume():
+            return [p async for p in llm_service.astream_summary(articles[0])]
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        limiter.release.assert_called_once_with([0.0, 0.0])
+        llm_service._client.astream.assert_not_called()
+
+    async def test_fast_success_grows_concurrency(self, llm_service):
+        llm_service._concurrency.limit = 2.0
+        llm_service._client = MagicMock()
+        llm_service._client.ainvoke = AsyncMock(return_value=AIMessage(content="ok"))
+
+        await llm_service._acall_llm("prompt")
+
+        assert llm_service._concurrency.limit == 3.0
+
+
+# =============================================================================
+# Prompt Truncation Tests
+# =============================================================================
+
+
+class TestPromptTruncation:
+    """Tests for clipping article content to the model context window."""
+
+    def test_short_content_is_not_truncated(self, llm_service, articles):
+        prompt = llm_service._build_batch_prompt([articles[0], articles[2]])
+
+        assert TRUNCATION_MARKER not in prompt
+        assert articles[0].content in prompt
+
+    def test_long_content_is_truncated_with_marker(self, llm_service, articles):
+        llm_service._context_window = llm_service._max_tokens + 2000
+        long_article = articles[0].model_copy(update={"content": "word " * 20_000})
+
+        prompt = llm_service._build_batch_prompt([long_article, articles[2]])
+
+        assert TRUNCATION_MARKER in prompt
+        assert llm_service._estimate_tokens(prompt) <= llm_service._context_window
+        assert articles[2].content in prompt
+
+    def test_single_prompt_is_truncated(self, llm_service):
+        llm_service._context_window = llm_service._max_tokens + 2000
+
+        prompt = llm_service._build_prompt("word " * 20_000, "Long Article")
+
+        assert TRUNCATION_MARKER in prompt
+        assert llm_service._estimate_tokens(prompt) <= llm_service._context_window
+
+
+# =============================================================================
+# Response Cache Integration Tests
+# =============================================================================
+
+
+class TestResponseCaching:
+    """Tests for LLMResponseCache use inside LLMService calls."""
+
+    def test_repeat_call_is_served_from_cache(self, llm_service, articles):
+        llm_service._cache = LLMResponseCache(cache_type="memory", ttl=60)
+        llm_service._client = MagicMock()
+        llm_service._client.invoke.return_value = AIMessage(
+            content=summary_json("A summary about Python.")
+        )
+
+        first = llm_service.summarize_article(articles[0])
+        second = llm_service.summarize_article(articles[0])
+
+        assert llm_service._client.invoke.call_count == 1
+        assert second.summary_data == first.summary_data
+
+    async def test_async_call_shares_cache(self, llm_service, articles):
+        llm_service._cache = LLMResponseCache(cache_type="memory", ttl=60)
+        llm_service._client = MagicMock()
+        llm_service._client.ainvoke = AsyncMock(side_effect=respond_to_batch)
+
+        await llm_service.asummarize_article(articles[0])
+        await llm_service.asummarize_article(articles[0])
+
+        assert llm_service._client.ainvoke.await_count == 1
+
+    def test_truncated_response_is_not_cached(self, llm_service, articles):
+        llm_service._cache = LLMResponseCache(cache_type="memory", ttl=60)
+        llm_service._client = MagicMock()
+        llm_service._client.invoke.return_value = AIMessage(
+            content='{"summary": "cut o', response_metadata={"stop_reason": "max_tokens"}
+        )
+
+        llm_service.summarize_article(articles[0])
+        llm_service.summarize_article(articles[0])
+
+        assert llm_service._client.invoke.call_count == 2
+
+
+# =============================================================================
+# Streaming Tests
+# =============================================================================
+
+
+def stream_of(text: str, size: int = 7):
+    """Return an astream replacement that emits text in fixed-size chunks.
+
+    With tools bound, the text arrives as streamed tool call arguments.
+    """
+
+    async def astream(messages, **kwargs):
+        tools = kwargs.get("tools")
+        for i in range(0, len(text), size):
+            if tools:
+                tool_call_chunk = {
+                    "name": tools[0]["name"] if i == 0 else None,
+                    "args": text[i : i + size],
+                    "id": "toolu_1" if i == 0 else None,
+                    "index": 0,
+                }
+                yield AIMessageChunk(content="", tool_call_chunks=[tool_call_chunk])
+            else:
+                yield AIMessageChunk(content=text[i : i + size])
+
+    return astream
+
+
+class TestStreamSummary:
+    """Tests for LLMService.astream_summary."""
+
+    async def test_yields_partials_then_validated_summary(self, llm_service, articles):
+        llm_service._client = MagicMock()
+        llm_service._client.astream = stream_of(summary_json("A summary about Python."))
+
+        partials = [p async for p in llm_service.astream_summary(articles[0])]
+
+        assert len(partials) > 2
+        assert "key_points" not in partials[0]
+        assert partials[-1]["summary"] == "A summary about Python."
+        assert partials[-1]["key_points"] == ["Point one", "Point two", "Point three"]
+
+    async def test_no_content_yields_nothing(self, llm_service, articles):
+        llm_service._client = MagicMock()
+
+        partials = [p async for p in llm_service.astream_summary(articles[1])]
+
+        assert partials == []
+        llm_service._client.astream.assert_not_called()
+
+    async def test_invalid_output_raises_parse_error(self, llm_service, articles):
+        llm_service._client = MagicMock()
+        llm_service._client.astream = stream_of('{"summary": "too short"}')
+
+        with pytest.raises(LLMParseError):
+            _ = [p async for p in llm_service.astream_summary(articles[0])]
+
+    async def test_stream_failure_raises_api_error(self, llm_service, articles):
+        async def failing_stream(messages, **kwargs):
+            yield AIMessageChunk(content='{"summ')
+            raise RuntimeError("connection reset")
+
+        llm_service._client = MagicMock()
+        llm_service._client.astream = failing_stream
+
+        with pytest.raises(LLMAPIError, match="connection reset"):
+            _ = [p async for p in llm_service.astream_summary(articles[0])]
+
+    async def test_stream_failure_releases_slot_and_reservation(self, llm_service, articles):
+        async def failing_stream(messages, **kwargs):
+            yield AIMessageChunk(content='{"summ')
+            raise RuntimeError("connection reset")
+
+        limiter = MagicMock(spec=AnthropicLimiter)
+        limiter.aacquire = AsyncMock(return_value=[0.0, 0.0])
+        llm_service._limiter = limiter
+        llm_service._client = MagicMock()
+        llm_service._client.astream = failing_stream
+
+        with pytest.raises(LLMAPIError):
+            _ = [p async for p in llm_service.astream_summary(articles[0])]
+
+        limiter.release.assert_called_once_with([0.0, 0.0])
+        assert llm_service._concurrency.in_flight == 0
+        assert llm_service.telemetry.calls == 0
+
+    async def test_abandoned_stream_closes_upstream(self, llm_service, articles):
+        closed = False
+
+        async def endless_stream(messages, **kwargs):
+            nonlocal closed
+            try:
+                while True:
+                    yield AIMessageChunk(content='{"summary": "x')
+                    await asyncio.sleep(0)
+            finally:
+                closed = True
+
+        llm_service._client = MagicMock()
+        llm_service._client.astream = endless_stream
+
+        stream = llm_service.astream_summary(articles[0])
+        await anext(stream)
+        await stream.aclose()
+
+        assert closed
+        assert llm_service._concurrency.in_flight == 0
+
+    async def test_completed_stream_is_recorded(self, llm_service, articles):
+        llm_service._client = MagicMock()
+        llm_service._client.astream = stream_of(summary_json("A summary about Python."))
+
+        _ = [p async for p in llm_service.astream_summary(articles[0])]
+
+        assert llm_service.telemetry.calls == 1
+        assert llm_service._concurrency.in_flight == 0
+
+    async def test_cached_response_yields_single_summary(self, llm_service, articles):
+        llm_service._cache = LLMResponseCache(cache_type="memory", ttl=60)
+        llm_service._client = MagicMock()
+        llm_service._client.astream = stream_of(summary_json("A summary about Python."))
+
+        _ = [p async for p in llm_service.astream_summary(articles[0])]
+        llm_service._client.astream = MagicMock()
+        partials = [p async for p in llm_service.astream_summary(articles[0])]
+
+        assert len(partials) == 1
+        llm_service._client.astream.assert_not_called()
+
+
+# =============================================================================
+# Threaded Summarization Tests
+# =============================================================================
+
+
+class TestThreadedSummarization:
+    """Tests for LLMService.summarize_articles_threaded."""
+
+    def test_empty_list_returns_empty(self, llm_service):
+        assert llm_service.summarize_articles_threaded([]) == []
+
+    def test_preserves_order(self, llm_service, articles):
+        def respond(messages, **kwargs):
+            topic = "Python" if "Python Performance" in messages[0].content else "Rust"
+            time.sleep(0.02 if topic == "Python" else 0)
+            return AIMessage(content=summary_json(f"A summary about {topic}."))
+
+        llm_service._client = MagicMock()
+        llm_service._client.invoke.side_effect = respond
+
+        results = llm_service.summarize_articles_threaded(articles)
+
+        assert [r.article.story_id for r in results] == [1, 2, 3]
+        assert results[0].summary_data.summary == "A summary about Python."
+        assert results[1].summarization_status == SummarizationStatus.NO_CONTENT
+        assert results[2].summary_data.summary == "A summary about Rust."
+
+    def test_calls_overlap_across_workers(self, llm_service, articles):
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def respond(messages, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return AIMessage(content=summary_json("A summary about anything."))
+
+        llm_service._client = MagicMock()
+        llm_service._client.invoke.side_effect = respond
+
+        llm_service.summarize_articles_threaded([articles[0]] * 6, max_workers=3)
+
+        assert peak == 3
+
+
+# =============================================================================
+# Client Configuration Tests
+# =============================================================================
+
+
+class TestClientConfiguration:
+    """Tests for bounded timeouts and retries on the Anthropic clients."""
+
+    def test_chat_client_has_timeout_and_no_sdk_retries(self, llm_service):
+        assert llm_service._client.default_request_timeout == get_settings().llm_request_timeout
+        assert llm_service._client.max_retries == 0
+
+    def test_chat_client_is_shared_between_services(self, llm_service):
+        assert LLMService()._client is LLMService()._client
+
+    def test_chat_client_differs_per_model(self, llm_service):
+        assert LLMService(model="claude-other")._client is not LLMService()._client
+
+    def test_batch_client_has_bounded_timeout(self, llm_service):
+        client = llm_service._get_batch_client()
+
+        assert client.timeout.read == get_settings().llm_request_timeout
+        assert client.timeout.connect == 5.0
+
+
+# =============================================================================
+# Error Classification Tests
+# =============================================================================
+
+
+ANTHROPIC_REQUEST = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+
+
+def status_error(status_code: int) -> anthropic.APIStatusError:
+    """Build the SDK exception the Anthropic client raises for a status code."""
+    response = httpx.Response(status_code, request=ANTHROPIC_REQUEST)
+    return anthropic.Anthropic(api_key="sk-test")._make_status_error(
+        "error", body=None, response=response
+    )
+
+
+class TestErrorClassification:
+    """Tests for mapping Anthropic SDK exceptions onto LLM service errors."""
+
+    def test_rate_limit_error_maps_to_rate_limit(self, llm_service):
+        error = llm_service._to_llm_error(status_error(429))
+
+        assert isinstance(error, LLMRateLimitError)
+
+    def test_rate_limit_message_without_type_is_not_rate_limit(self, llm_service):
+        error = llm_service._to_llm_error(RuntimeError("rate limit 429"))
+
+        assert isinstance(error, LLMAPIError)
+        assert not error.retryable
+
+    def test_timeout_is_retryable(self, llm_service):
+        error = llm_service._to_llm_error(anthropic.APITimeoutError(request=ANTHROPIC_REQUEST))
+
+        assert isinstance(error, LLMAPIError)
+        assert error.retryable
+
+    @pytest.mark.parametrize(("status_code", "retryable"), [(400, False), (500, True), (529, True)])
+    def test_status_errors_keep_code(self, llm_service, status_code, retryable):
+        error = llm_service._to_llm_error(status_error(status_code))
+
+        assert isinstance(error, LLMAPIError)
+        assert error.status_code == status_code
+        assert error.retryable is retryable
+
+    def test_transient_failure_is_retried(self, llm_service, articles):
+        llm_service._client = MagicMock()
+        llm_service._client.invoke.side_effect = [
+            anthropic.APITimeoutError(request=ANTHROPIC_REQUEST),
+            AIMessage(content=summary_json("A summary about Python.")),
+        ]
+
+        with patch.object(LLMService._call_llm.retry, "wait", wait_none()):
+            result = llm_service.summarize_article(articles[0])
+
+        assert result.summarization_status == SummarizationStatus.SUCCESS
+        assert llm_service._client.invoke.call_count == 2
+
+    def test_client_error_is_not_retried(self, llm_service, articles):
+        llm_service._client = MagicMock()
+        llm_service._client.invoke.side_effect = status_error(400)
+
+        result = llm_service.summarize_article(articles[0])
+
+        assert result.summarization_status == SummarizationStatus.API_ERROR
+        assert llm_service._client.invoke.call_count == 1
+
+
+# =============================================================================
+# Duplicate Prompt Tests
+# =============================================================================
+
+
+class TestDuplicateArticles:
+    """Tests for collapsing repeated articles into a single LLM request."""
+
+    @pytest.fixture
+    def reposted(self, articles) -> list[Article]:
+        repost = articles[0].model_copy(update={"story_id": 4})
+        return [*articles, repost]
+
+    def test_batch_sends_duplicate_once_and_fans_out(self, llm_service, reposted):
+        llm_service._client = MagicMock()
+        llm_service._client.invoke.side_effect = lambda messages, **kwargs: asyncio.run(
+            respond_to_batch(messages, **kwargs)
+        )
+
+        results = llm_service.summarize_articles_batch(reposted)
+
+        prompt = llm_service._client.invoke.call_args.args[0][0].content
+        assert prompt.count("Python Performance") == 1
+        assert [r.article.story_id for r in results] == [1, 2, 3, 4]
+        assert results[3].summary_data == results[0].summary_data
+        assert results[3].summarization_status == SummarizationStatus.SUCCESS
+
+    def test_batch_api_submits_duplicate_once(self, llm_service, reposted):
+        llm_service._batch_client = mock_batch_client(
+            [
+                succeeded("story-1-0", summary_json("A summary about Python.")),
+                succeeded("story-3-2", summary_json("A summary about Rust.")),
+            ]
+        )
+
+        results = llm_service.summarize_articles_via_batch_api(reposted, poll_interval=0)
+
+        requests = llm_service._batch_client.messages.batches.create.call_args.kwargs["requests"]
+        assert [r["custom_id"] for r in requests] == ["story-1-0", "story-3-2"]
+        assert results[3].article.story_id == 4
+        assert results[3].summary_data.summary == "A summary about Python."
+
+    def test_same_content_different_title_is_not_collapsed(self, llm_service, articles):
+        retitled = articles[0].model_copy(update={"story_id": 4, "title": "Faster Python"})
+
+        with_content, _, duplicates = llm_service._prepare_batch([articles[0], retitled])
+
+        assert len(with_content) == 2
+        assert duplicates == {}
+
+
+# =============================================================================
+# Structured Output Tests
+# =============================================================================
+
+
+class TestStructuredOutput:
+    """Tests for native tool-use structured output and the text fallback."""
+
+    def test_prompt_omits_format_instructions(self, llm_service, articles):
+        prompt = llm_service._build_prompt(articles[0].content, articles[0].title)
+
+        assert llm_service._single_parser.get_format_instructions() not in prompt
+
+    def test_call_forces_summary_tool(self, llm_service, articles):
+        llm_service._client = MagicMock()
+        llm_service._client.invoke.return_value = AIMessage(
+            content="",
+            tool_calls=[
+                {
+                    "name": "ArticleSummary",
+                    "args": json.loads(summary_json("A summary about Python.")),
+                    "id": "toolu_1",
+                }
+            ],
+        )
+
+        result = llm_service.summarize_article(articles[0])
+
+        kwargs = llm_service._client.invoke.call_args.kwargs
+        assert kwargs["tool_choice"] == {"type": "tool", "name": "ArticleSummary"}
+        assert result.summary_data.summary == "A summary about Python."
+
+    def test_batch_api_reads_tool_use_block(self, llm_service, articles):
+        result = succeeded("story-1-0", "")
+        result.result.message.content = [
+            ToolUseBlock(
+                type="tool_use",
+                id="toolu_1",
+                name="ArticleSummary",
+                input=json.loads(summary_json("A summary about Python.")),
+            )
+        ]
+        llm_service._batch_client = mock_batch_client([result])
+
+        results = llm_service.summarize_articles_via_batch_api([articles[0]], poll_interval=0)
+
+        params = llm_service._batch_client.messages.batches.create.call_args.kwargs["requests"][0]
+        assert params["params"]["tool_choice"]["name"] == "ArticleSummary"
+        assert results[0].summary_data.summary == "A summary about Python."
+
+    def test_disabled_falls_back_to_format_instructions(self, llm_service, monkeypatch, articles):
+        monkeypatch.setenv("LLM_STRUCTURED_OUTPUT", "false")
+        get_settings.cache_clear()
+        service = LLMService()
+        service._client = MagicMock()
+        service._client.invoke.return_value = AIMessage(
+            content=summary_json("A summary about Python.")
+        )
+
+        result = service.summarize_article(articles[0])
+
+        prompt = service._client.invoke.call_args.args[0][0].content
+        assert service._single_parser.get_format_instructions() in prompt
+        assert service._client.invoke.call_args.kwargs == {}
+        assert result.summarization_status == SummarizationStatus.SUCCESS
+
+
+# =============================================================================
+# Batch Response Parsing Tests
+# =============================================================================
+
+
+class TestParseBatchResponse:
+    """Tests for turning a batch response into ordered per-article results."""
+
+    def test_short_response_marks_missing_articles(self, llm_service, articles):
+        response = json.dumps({"summaries": [json.loads(summary_json("A summary about Python."))]})
+
+        results = llm_service._parse_batch_response([articles[0], articles[2]], response)
+
+        assert [r.article.story_id for r in results] == [1, 3]
+        assert results[0].summarization_status == SummarizationStatus.SUCCESS
+        assert results[1].summarization_status == SummarizationStatus.PARSE_ERROR
+        assert results[1].error_message == "Missing summary in batch response"
+
+    async def test_asummarize_articles_resolves_no_content_without_llm(self, llm_service, articles):
+        llm_service._client = MagicMock()
+        llm_service._client.ainvoke = AsyncMock()
+
+        results = await llm_service.asummarize_articles([articles[1]] * 3)
+
+        assert [r.summarization_status for r in results] == [SummarizationStatus.NO_CONTENT] * 3
+        llm_service._client.ainvoke.assert_not_called()
+
+
+# =============================================================================
+# Telemetry Tests
+# =============================================================================
+
+
+class TestTelemetry:
+    """Tests for per-call and per-batch LLM telemetry."""
+
+    def test_call_records_usage_and_latency(self, llm_service, articles, caplog):
+        llm_service._client = MagicMock()
+        llm_service._client.invoke.return_value = AIMessage(
+            content=summary_json("A summary about Python."),
+            usage_metadata={"input_tokens": 300, "output_tokens": 120, "total_tokens": 420},
+        )
+
+        with caplog.at_level("INFO", logger="hn_herald.services.llm"):
+            llm_service.summarize_article(articles[0])
+
+        assert llm_service.telemetry.calls == 1
+        assert llm_service.telemetry.input_tokens == 300
+        assert llm_service.telemetry.output_tokens == 120
+        assert llm_service.telemetry.latency_ms > 0
+        record = next(r for r in caplog.records if getattr(r, "event_type", "") == "llm_call")
+        assert record.input_tokens == 300
+
+    def test_retries_are_counted(self, llm_service, articles):
+        llm_service._client = MagicMock()
+        llm_service._client.invoke.side_effect = [
+            anthropic.APITimeoutError(request=ANTHROPIC_REQUEST),
+            AIMessage(content=summary_json("A summary about Python.")),
+        ]
+
+        with patch.object(LLMService._call_llm.retry, "wait", wait_none()):
+            llm_service.summarize_article(articles[0])
+
+        assert llm_service.telemetry.retries == 1
+        assert llm_service.telemetry.calls == 1
+
+    def test_batch_logs_aggregate_totals(self, llm_service, articles, caplog):
+        llm_service._client = MagicMock()
+        llm_service._client.invoke.side_effect = lambda messages, **kwargs: asyncio.run(
+            respond_to_batch(messages, **kwargs)
+        )
+
+        with caplog.at_level("INFO", logger="hn_herald.services.llm"):
+            llm_service.summarize_articles_batch(articles, batch_size=1)
+
+        record = next(
+            r for r in caplog.records if getattr(r, "event_type", "") == "llm_batch_totals"
+        )
+        assert record.articles == 3
+        assert record.calls == 2
+
+
+# =============================================================================
+# Short Content Tests
+# =============================================================================
+
+
+class TestShortContent:
+    """Tests for skipping the LLM when content is already summary-sized."""
+
+    @pytest.fixture
+    def short_service(self, llm_service):
+        llm_service._min_content_chars = 200
+        llm_service._client = MagicMock()
+        llm_service._client.ainvoke = AsyncMock()
+        return llm_service
+
+    def test_short_content_becomes_summary(self, short_service, articles):
+        result = short_service.summarize_article(articles[0])
+
+        assert result.summarization_status == SummarizationStatus.SUCCESS
+        assert result.summary_data.summary == articles[0].content
+        assert result.summary_data.key_points == [articles[0].title]
+        short_service._client.invoke.assert_not_called()
+
+    def test_very_short_content_is_prefixed_with_title(self, short_service, articles):
+        article = articles[0].model_copy(update={"content": "Tiny update."})
+
+        result = short_service.summarize_article(article)
+
+        assert result.summary_data.summary == "Python Performance: Tiny update."
+
+    def test_hn_text_html_is_stripped(self, short_service, articles):
+        article = articles[0].model_copy(
+            update={
+                "content": None,
+                "hn_text": 'Is Python fast yet?<p>It&#x27;s <a href="https://x.y">close</a>.',
+            }
+        )
+
+        result = short_service.summarize_article(article)
+
+        assert result.summary_data.summary == "Is Python fast yet?\n\nIt's close."
+
+    def test_disabled_by_default(self, llm_service, monkeypatch):
+        monkeypatch.delenv("LLM_MIN_CONTENT_CHARS", raising=False)
+        get_settings.cache_clear()
+
+        assert get_settings().llm_min_content_chars == 0
+
+    def test_batch_skips_short_content(self, short_service, articles):
+        results = short_service.summarize_articles_batch(articles)
+
+        assert [r.summarization_status for r in results] == [
+            SummarizationStatus.SUCCESS,
+            SummarizationStatus.NO_CONTENT,
+            SummarizationStatus.SUCCESS,
+        ]
+        short_service._client.invoke.assert_not_called()
+
+    async def test_async_skips_short_content(self, short_service, articles):
+        results = await short_service.asummarize_articles(articles)
+
+        assert results[2].summary_data.summary == articles[2].content
+        short_service._client.ainvoke.assert_not_called()
+
+
+# =============================================================================
+# Batch Partial Failure Tests
+# =============================================================================
+
+
+class TestBatchPartialFailure:
+    """Tests for salvaging and retrying articles when a batch response is bad."""
+
+    def test_salvage_keeps_valid_items_by_index(self):
+        good = summary_json("A summary about Python.")
+        text = f'{{"summaries": [{good}, {{"summary": "short"}}, {good}, {{"summ'
+
+        salvaged = LLMService._salvage_summaries(text, 4)
+
+        assert [s is not None for s in salvaged] == [True, False, True, False]
+
+    def test_salvage_without_summaries_array(self):
+        assert LLMService._salvage_summaries("not json", 2) == [None, None]
+
+    def test_sync_batch_retries_only_malformed_article(self, llm_service, articles):
+        good = json.loads(summary_json("A summary about Python."))
+        batch = AIMessage(content=json.dumps({"summaries": [good, {"summary": "short"}]}))
+        single = AIMessage(content=summary_json("A summary about Rust."))
+        llm_service._client = MagicMock()
+        llm_service._client.invoke.side_effect = [batch, single]
+
+        results = llm_service.summarize_articles_batch(articles)
+
+        assert results[0].summary_data.summary == "A summary about Python."
+        assert results[2].summary_data.summary == "A summary about Rust."
+        retry_prompt = llm_service._client.invoke.call_args_list[1].args[0][0].content
+        assert "Rust in the Kernel" in retry_prompt
+        assert "Python Performance" not in retry_prompt
+
+    async def test_micro_batch_retries_missing_article(self, llm_service, articles):
+        calls = []
+
+        async def respond(messages, **kwargs):
+            calls.append(messages[0].content)
+            if len(calls) == 1:
+                good = json.loads(summary_json("A summary about Python."))
+                return AIMessage(content=json.dumps({"summaries": [good]}))
+            return AIMessage(content=summary_json("A summary about Rust."))
+
+        llm_service._client = MagicMock()
+        llm_service._client.ainvoke = AsyncMock(side_effect=respond)
+
+        results = await llm_service.asummarize_articles(articles)
+
+        assert [r.summarization_status for r in results] == [
+            SummarizationStatus.SUCCESS,
+            SummarizationStatus.NO_CONTENT,
+            SummarizationStatus.SUCCESS,
+        ]
+        assert len(calls) == 2
+        assert "Python Performance" not in calls[1]
@@ -0,0 +1,163 @@
+"""Tests for LLMResponseCache.
+
+This module tests key derivation, the in-process LRU tier, the SQLite
+persistence tier, TTL expiry, and the disabled ("none") backend.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from hn_herald.config import get_settings
+from hn_herald.services.llm_cache import LLMResponseCache
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def memory_cache() -> LLMResponseCache:
+    """In-process cache with a one minute TTL."""
+    return LLMResponseCache(cache_type="memory", ttl=60, namespace="test")
+
+
+@pytest.fixture
+def database_path(tmp_path) -> str:
+    """Path for a throwaway SQLite cache database."""
+    return str(tmp_path / "cache" / "llm_cache.db")
+
+
+# =============================================================================
+# Key Tests
+# =============================================================================
+
+
+class TestMakeKey:
+    """Tests for LLMResponseCache.make_key."""
+
+    def test_same_inputs_same_key(self, memory_cache):
+        key_a = memory_cache.make_key("model", 0.0, 1024, "prompt")
+        key_b = memory_cache.make_key("model", 0.0, 1024, "prompt")
+
+        assert key_a == key_b
+        assert len(key_a) == 64
+
+    @pytest.mark.parametrize(
+        ("model", "temperature", "max_tokens", "prompt"),
+        [
+            ("other-model", 0.0, 1024, "prompt"),
+            ("model", 0.5, 1024, "prompt"),
+            ("model", 0.0, 2048, "prompt"),
+            ("model", 0.0, 1024, "other prompt"),
+        ],
+    )
+    def test_any_input_change_changes_key(
+        self, memory_cache, model, temperature, max_tokens, prompt
+    ):
+        base = memory_cache.make_key("model", 0.0, 1024, "prompt")
+
+        assert memory_cache.make_key(model, temperature, max_tokens, prompt) != base
+
+    def test_namespace_changes_key(self):
+        v1 = LLMResponseCache(cache_type="memory", ttl=60, namespace="v1")
+        v2 = LLMResponseCache(cache_type="memory", ttl=60, namespace="v2")
+
+        assert v1.make_key("m", 0.0, 1, "p") != v2.make_key("m", 0.0, 1, "p")
+
+
+# =============================================================================
+# Backend Tests
+# =============================================================================
+
+
+class TestMemoryCache:
+    """Tests for the in-process LRU tier."""
+
+    def test_miss_returns_none(self, memory_cache):
+        assert memory_cache.get("missing") is None
+
+    def test_set_then_get(self, memory_cache):
+        memory_cache.set("key", "value")
+
+        assert memory_cache.get("key") == "value"
+
+    def test_expired_entry_is_a_miss(self, memory_cache):
+        memory_cache.set("key", "value")
+
+        with patch("hn_herald.services.llm_cache.time.time", return_value=10**12):
+            assert memory_cache.get("key") is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = LLMResponseCache(cache_type="memory", ttl=60, max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert cache.get("c") == "3"
+
+
+class TestSQLiteCache:
+    """Tests for the persistent SQLite tier."""
+
+    def test_entries_survive_a_new_instance(self, database_path):
+        LLMResponseCache(cache_type="sqlite", ttl=60, database_path=database_path).set(
+            "key", "value"
+        )
+
+        reopened = LLMResponseCache(cache_type="sqlite", ttl=60, database_path=database_path)
+
+        assert reopened.get("key") == "value"
+
+    def test_expired_rows_are_a_miss(self, database_path):
+        LLMResponseCache(cache_type="sqlite", ttl=-1, database_path=database_path).set(
+            "key", "value"
+        )
+
+        reopened = LLMResponseCache(cache_type="sqlite", ttl=60, database_path=database_path)
+
+        assert reopened.get("key") is None
+
+    async def test_async_access_runs_off_event_loop(self, database_path):
+        cache = LLMResponseCache(cache_type="sqlite", ttl=60, database_path=database_path)
+        loop_thread = threading.get_ident()
+        threads = []
+        get = cache.get
+
+        def tracking_get(key):
+            threads.append(threading.get_ident())
+            return get(key)
+
+        await cache.aset("key", "value")
+        with patch.object(cache, "get", tracking_get):
+            assert await cache.aget("key") == "value"
+
+        assert threads
+        assert loop_thread not in threads
+
+
+class TestDefaultBackend:
+    """Tests for the configured default backend."""
+
+    def test_defaults_to_memory(self, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test-key")
+        monkeypatch.delenv("LLM_CACHE_TYPE", raising=False)
+        get_settings.cache_clear()
+        try:
+            assert get_settings().llm_cache_type == "memory"
+        finally:
+            get_settings.cache_clear()
+
+
+class TestDisabledCache:
+    """Tests for cache_type="none"."""
+
+    def test_never_stores(self):
+        cache = LLMResponseCache(cache_type="none", ttl=60)
+        cache.set("key", "value")
+
+        assert cache.get("key") is None
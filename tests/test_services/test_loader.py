@@ -1,5 +1,9 @@
 """Tests for ArticleLoader service."""
 
+import asyncio
+import threading
+from unittest.mock import AsyncMock, patch
+
 import httpx
 import pytest
 import respx
@@ -128,6 +132,23 @@ class TestURLFiltering:
         if expected_skip:
             assert "Blocked domain" in reason
 
+    @pytest.mark.parametrize(
+        "url,expected_skip",
+        [
+            ("https://mobile.twitter.com/user/status/123", True),
+            ("https://help.medium.com/article", True),
+            ("https://www.blog.nytimes.com/post", True),
+            ("https://nottwitter.com/post", False),
+            ("https://google.com/search", False),
+            ("https://twitter.com.example.org/post", False),
+        ],
+    )
+    def test_should_skip_blocked_subdomains(self, url, expected_skip):
+        """Subdomains of blocked domains should be skipped too."""
+        loader = ArticleLoader()
+        should_skip, _reason = loader.should_skip_url(url)
+        assert should_skip == expected_skip
+
     @pytest.mark.parametrize(
         "url",
         [
@@ -136,6 +157,8 @@ class TestURLFiltering:
             "https://techcrunch.com/article",
             "https://arstechnica.com/story",
             "https://news.example.com/breaking",
+            "https://example.com/v1.2/release-notes",
+            "https://example.com/pdf",
         ],
     )
     def test_should_not_skip_valid_urls(self, url):
@@ -153,6 +176,8 @@ class TestURLFiltering:
             ("https://example.com/video.mp4", True),
             ("https://example.com/image.png", True),
             ("https://example.com/archive.zip", True),
+            ("https://example.com/backup.tar.gz", True),
+            ("https://example.com/PAPER.PDF", True),
         ],
     )
     def test_should_skip_blocked_extensions(self, url, expected_skip):
@@ -163,6 +188,17 @@ class TestURLFiltering:
         if expected_skip:
             assert "Blocked file type" in reason
 
+    def test_should_skip_url_uses_given_domain(self):
+        """A domain extracted by the caller should be used without re-parsing."""
+        loader = ArticleLoader()
+        with patch.object(ArticleLoader, "extract_domain") as extract_domain:
+            should_skip, reason = loader.should_skip_url(
+                "https://mobile.twitter.com/status/1", "mobile.twitter.com"
+            )
+        extract_domain.assert_not_called()
+        assert should_skip is True
+        assert reason == "Blocked domain: mobile.twitter.com"
+
     def test_should_skip_empty_url(self):
         """Empty URL should be skipped."""
         loader = ArticleLoader()
@@ -214,6 +250,14 @@ class TestDomainExtraction:
         domain = loader.extract_domain("")
         assert domain is None
 
+    def test_extract_domain_is_cached(self):
+        """Repeated lookups of the same URL should hit the cache."""
+        url = "https://cached.example.com/article"
+        ArticleLoader.extract_domain(url)
+        hits = ArticleLoader.extract_domain.cache_info().hits
+        ArticleLoader().extract_domain(url)
+        assert ArticleLoader.extract_domain.cache_info().hits == hits + 1
+
 
 # =============================================================================
 # Article Extraction Tests
@@ -244,8 +288,37 @@ class TestArticleExtraction:
         assert article.content is not None
         assert len(article.content) > 0
         assert article.word_count > 0
+        assert article.word_count == len(article.content.split())
         assert article.domain == "example.com"
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_parses_html_off_the_event_loop(self, sample_story, sample_html_page):
+        """Should run HTML parsing in a worker thread, not the event loop thread."""
+        respx.get("https://example.com/article").mock(
+            return_value=httpx.Response(
+                200,
+                text=sample_html_page,
+                headers={"content-type": "text/html"},
+            )
+        )
+        loader = ArticleLoader()
+        extract = loader._extract_content_from_html
+        parse_threads = []
+
+        def record_thread(body, encoding=None):
+            parse_threads.append(threading.get_ident())
+            return extract(body, encoding)
+
+        loader._extract_content_from_html = record_thread
+
+        async with loader:
+            article = await loader.extract_article(sample_story)
+
+        assert article.status == ExtractionStatus.SUCCESS
+        assert parse_threads
+        assert threading.get_ident() not in parse_threads
+
     @pytest.mark.asyncio
     async def test_extract_article_no_url(self, sample_story_no_url):
         """Should handle stories without external URL."""
@@ -415,6 +488,94 @@ class TestBatchExtraction:
         assert articles[1].story_id == 2
         assert articles[2].story_id == 3
 
+    @pytest.mark.asyncio
+    async def test_extract_articles_out_of_order_completion(self):
+        """Should keep input order when later stories finish first, and fail soft."""
+        stories = [
+            Story(id=i, title=f"Story {i}", url=None, score=100, by="user", time=1709654321)
+            for i in range(1, 4)
+        ]
+        loader = ArticleLoader()
+        extract_article = loader.extract_article
+
+        async def slow_first(story):
+            if story.id == 2:
+                raise RuntimeError("boom")
+            await asyncio.sleep(0.02 if story.id == 1 else 0)
+            return await extract_article(story)
+
+        loader.extract_article = slow_first
+
+        async with loader:
+            articles = await loader.extract_articles(stories)
+
+        assert [a.story_id for a in articles] == [1, 2, 3]
+        assert articles[1].status == ExtractionStatus.FAILED
+        assert articles[1].error_message == "boom"
+
+    @pytest.mark.asyncio
+    async def test_extract_articles_dispatches_in_waves(self):
+        """Should keep at most max_concurrent*2 extractions in flight."""
+        stories = [
+            Story(id=i, title=f"Story {i}", url=None, score=100, by="user", time=1709654321)
+            for i in range(1, 8)
+        ]
+        loader = ArticleLoader(max_concurrent=1)
+        extract_article = loader.extract_article
+        in_flight = 0
+        peak = 0
+
+        async def tracked(story):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001 * story.id)
+            in_flight -= 1
+            return await extract_article(story)
+
+        loader.extract_article = tracked
+
+        async with loader:
+            articles = await loader.extract_articles(stories)
+
+        assert [a.story_id for a in articles] == list(range(1, 8))
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_extract_articles_cancellation_cancels_in_flight(self):
+        """Should cancel running extractions when the caller is cancelled."""
+        stories = [
+            Story(id=i, title=f"Story {i}", url=None, score=100, by="user", time=1709654321)
+            for i in range(1, 4)
+        ]
+        loader = ArticleLoader()
+        started = 0
+        cancelled = 0
+        all_started = asyncio.Event()
+
+        async def hang(story):
+            nonlocal started, cancelled
+            started += 1
+            if started == len(stories):
+                all_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+
+        loader.extract_article = hang
+
+        async with loader:
+            task = asyncio.create_task(loader.extract_articles(stories))
+            await all_started.wait()
+            task.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert cancelled == len(stories)
+
     @pytest.mark.asyncio
     async def test_extract_articles_empty_list(self):
         """Should handle empty story list."""
@@ -517,6 +678,36 @@ class TestContentProcessing:
         assert article.status == ExtractionStatus.SUCCESS
         assert len(article.content) <= 1000
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_stops_reading_past_max_response_bytes(self):
+        """Should stop reading the body once max_response_bytes is reached."""
+        filler = "This is an opening paragraph of the article. " * 4000
+        huge_html = f"<html><body><article><p>{filler}</p><p>TAIL MARKER</p></article></body>"
+
+        story = Story(
+            id=1,
+            title="Huge Article",
+            url="https://example.com/huge",
+            score=100,
+            by="user",
+            time=1709654321,
+        )
+
+        respx.get("https://example.com/huge").mock(
+            return_value=httpx.Response(
+                200,
+                text=huge_html,
+                headers={"content-type": "text/html"},
+            )
+        )
+
+        async with ArticleLoader(max_content_length=500000, max_response_bytes=1000) as loader:
+            article = await loader.extract_article(story)
+
+        assert article.status == ExtractionStatus.SUCCESS
+        assert "TAIL MARKER" not in article.content
+
     @respx.mock
     @pytest.mark.asyncio
     async def test_removes_script_and_style_tags(self):
@@ -558,6 +749,59 @@ class TestContentProcessing:
         assert "color: red" not in article.content
         assert "actual content" in article.content
 
+    def test_finds_container_by_class_case_insensitively(self):
+        """Should fall back to a content-like class when there is no article/main."""
+        body = "Meaningful sentence about the subject of the post. " * 5
+        html = f"""<?xml version="1.0" encoding="utf-8"?>
+        <html><body>
+        <div class="Sidebar">Unrelated links</div>
+        <div class="Post-Body"><p>{body}</p><!-- editor note --></div>
+        </body></html>
+        """
+
+        content = ArticleLoader()._extract_content_from_html(html.encode())
+
+        assert content is not None
+        assert "Meaningful sentence" in content
+        assert "Unrelated links" not in content
+        assert "editor note" not in content
+
+    def test_prefers_article_over_content_class(self):
+        """Should take <article> over an earlier element with a content-like class."""
+        body = "The article element holds the real text of this page. " * 3
+        page = f"""<html><body>
+        <div class="post-list">Other posts, newsletter signup, and related links</div>
+        <article><p>{body}</p></article>
+        </body></html>"""
+
+        content = ArticleLoader()._extract_content_from_html(page.encode())
+
+        assert content is not None
+        assert content.startswith("The article element")
+        assert "newsletter" not in content
+
+    def test_empty_html_returns_none(self):
+        """Should return None for an empty document."""
+        assert ArticleLoader()._extract_content_from_html(b"") is None
+
+    @pytest.mark.parametrize(
+        ("head", "encoding", "charset"),
+        [
+            ("", None, "utf-8"),
+            ('<meta charset="iso-8859-1">', None, "iso-8859-1"),
+            ("", "windows-1252", "windows-1252"),
+        ],
+    )
+    def test_decodes_bytes_by_header_meta_or_utf8(self, head, encoding, charset):
+        """Should decode by header charset, then <meta charset>, then UTF-8."""
+        text = "Café naïve résumé, a sentence with accented characters. " * 3
+        page = f"<html><head>{head}</head><body><article><p>{text}</p></article></body></html>"
+
+        content = ArticleLoader()._extract_content_from_html(page.encode(charset), encoding)
+
+        assert content is not None
+        assert "Café naïve résumé" in content
+
 
 # =============================================================================
 # Context Manager Tests
@@ -582,6 +826,40 @@ class TestContextManager:
         # Client should be None after exiting context
         assert loader._client is None
 
+    @pytest.mark.asyncio
+    async def test_client_pool_sized_to_concurrency(self):
+        """Should size the keep-alive pool to max_concurrent and enable HTTP/2."""
+        loader = ArticleLoader(max_concurrent=4)
+
+        with patch(
+            "hn_herald.services.loader.httpx.AsyncClient", return_value=AsyncMock()
+        ) as client_cls:
+            async with loader:
+                pass
+
+        kwargs = client_cls.call_args.kwargs
+        assert kwargs["limits"].max_connections == 4
+        assert kwargs["limits"].max_keepalive_connections == 4
+        assert kwargs["http2"] is True
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_requests_html_only(self, sample_story, sample_html_page):
+        """Should ask servers for HTML without a */* fallback."""
+        route = respx.get("https://example.com/article").mock(
+            return_value=httpx.Response(
+                200,
+                text=sample_html_page,
+                headers={"content-type": "text/html"},
+            )
+        )
+
+        async with ArticleLoader() as loader:
+            await loader.extract_article(sample_story)
+
+        accept = route.calls.last.request.headers["accept"]
+        assert accept == "text/html,application/xhtml+xml;q=0.9"
+
     @pytest.mark.asyncio
     async def test_handles_missing_client_gracefully(self):
         """Should handle missing client with FAILED status."""
@@ -631,3 +909,14 @@ class TestIntegration:
         # example.com should return successfully
         assert article.status in (ExtractionStatus.SUCCESS, ExtractionStatus.EMPTY)
         assert article.domain == "example.com"
+
+
+class TestCleanText:
+    """Tests for whitespace normalisation of extracted text."""
+
+    def test_collapses_all_whitespace_runs(self):
+        """Line breaks, tabs and repeated spaces become single spaces."""
+        loader = ArticleLoader()
+        assert (
+            loader._clean_text("  First line\n\n\tSecond   line \r\n") == "First line Second line"
+        )
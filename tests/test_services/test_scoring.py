@@ -5,6 +5,8 @@ tag matching algorithms, popularity normalization, composite scoring,
 batch scoring operations, and edge cases.
 """
 
+from unittest.mock import patch
+
 import pytest
 
 from hn_herald.models.article import Article, ExtractionStatus
@@ -829,6 +831,61 @@ class TestBatchScoring:
         assert scored_by_id[2].popularity_score == 0.5
         assert scored_by_id[3].popularity_score == 1.0
 
+    @pytest.mark.parametrize("hn_scores", [[10, 250, 40, 90], [70, 70, 70], [600]])
+    def test_batch_popularity_matches_per_article_normalization(self, sample_profile, hn_scores):
+        """
+        Given: A batch of HN scores
+        When: The batch is normalized in one pass
+        Then: Each score should match normalizing it individually against the batch
+        """
+        # Arrange
+        service = ScoringService(sample_profile)
+
+        # Act
+        batch = service._normalize_batch_popularity(hn_scores)
+
+        # Assert
+        assert batch == [service._normalize_popularity(s, hn_scores) for s in hn_scores]
+
+    def test_batch_scoring_without_preferences_skips_tag_matching(self, empty_profile):
+        """
+        Given: A profile with no preferences
+        When: Batch scoring is performed
+        Then: Every article should get its own neutral relevance without tag matching
+        """
+        # Arrange
+        service = ScoringService(empty_profile)
+        articles = [
+            create_summarized_article(story_id=i, tech_tags=["python"]) for i in range(1, 4)
+        ]
+
+        # Act
+        with patch.object(service, "_ordered_matches") as match:
+            scored = service.score_articles(articles)
+
+        # Assert
+        match.assert_not_called()
+        assert len({id(s.relevance) for s in scored}) == 3
+        assert len({id(s.relevance.matched_interest_tags) for s in scored}) == 3
+        assert scored[0].relevance.score == ScoringService.NEUTRAL_SCORE
+        assert scored[0].relevance.reason == "No preferences configured"
+
+    def test_no_preferences_relevance_follows_neutral_score(self, empty_profile):
+        """
+        Given: A service whose NEUTRAL_SCORE differs from the default
+        When: An article is scored against a profile with no preferences
+        Then: The neutral relevance should use that score
+        """
+        # Arrange
+        with patch.object(ScoringService, "NEUTRAL_SCORE", 0.4):
+            service = ScoringService(empty_profile)
+
+        # Act
+        scored = service.score_articles([create_summarized_article(story_id=1)])
+
+        # Assert
+        assert scored[0].relevance.score == 0.4
+
     def test_batch_scoring_empty_list(self, sample_profile):
         """
         Given: Empty list of articles
@@ -908,6 +965,22 @@ class TestReasonGeneration:
         assert "crypto" in reason
         assert "blockchain" in reason
 
+    def test_matched_tags_follow_profile_order(self, sample_profile):
+        """
+        Given: Article tags listing interests in a different order than the profile
+        When: Relevance is calculated
+        Then: Matched tags and the reason should follow profile order
+        """
+        # Arrange
+        service = ScoringService(sample_profile)
+
+        # Act
+        relevance = service._calculate_relevance(["Rust", "web", "PYTHON"])
+
+        # Assert
+        assert relevance.matched_interest_tags == ["python", "rust"]
+        assert relevance.reason == "Matches interests: python, rust"
+
     def test_reason_for_no_matches(self, sample_profile):
         """
         Given: No matched tags
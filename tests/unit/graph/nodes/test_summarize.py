@@ -3,6 +3,7 @@
 Tests the summarize node which batch summarizes articles using LLMService.
 """
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -157,6 +158,46 @@ class TestSummarizeSuccess:
         assert "errors" in result
         assert len(result["errors"]) == 0
 
+    @pytest.mark.asyncio
+    async def test_summarize_runs_batch_off_event_loop_thread(self):
+        """Test the blocking batch call runs on a worker thread.
+
+        Given: Filtered articles
+        When: summarize node is executed
+        Then: summarize_articles_batch runs outside the event loop's thread
+        """
+        # Arrange
+        articles = [
+            Article(
+                story_id=1,
+                title="Test Article",
+                url="https://example.com/1",
+                hn_url="https://news.ycombinator.com/item?id=1",
+                hn_score=100,
+                author="user1",
+                content="Article content",
+                word_count=2,
+                status=ExtractionStatus.SUCCESS,
+            ),
+        ]
+        state = {"filtered_articles": articles}
+        threads = []
+
+        def summarize_articles_batch(batch):
+            threads.append(threading.get_ident())
+            return []
+
+        mock_service = MagicMock()
+        mock_service.summarize_articles_batch = summarize_articles_batch
+
+        # Act
+        with patch("hn_herald.graph.nodes.summarize.LLMService", return_value=mock_service):
+            await summarize(state)
+
+        # Assert
+        assert threads
+        assert threads[0] != threading.get_ident()
+
 
 class TestSummarizeErrorHandling:
     """Tests for summarize error handling."""